@@ -21,13 +21,23 @@ from django.urls import path, include
 from rest_framework_simplejwt.views import (TokenObtainPairView,
                                             TokenRefreshView)
 
+# Local Libs
+from projects.authentication import (ClaimsTokenObtainPairSerializer,)
+from projects.urls import (batch_urlpatterns,
+                           issues_urlpatterns,)
+
 urlpatterns = [
     # Admin part
     path('admin/', admin.site.urls),
     # Authentication
     path("signup/", include('signup.urls')),
-    path("login/", TokenObtainPairView.as_view(), name='token_obtain_pair'),
+    path("login/",
+         TokenObtainPairView.as_view(
+             serializer_class=ClaimsTokenObtainPairSerializer),
+         name='token_obtain_pair'),
     path("login/refresh/", TokenRefreshView.as_view(), name='token-refresh'),
     # API
     path("projects/", include('projects.urls')),
+    path("issues/", include(issues_urlpatterns)),
+    path("batch/", include(batch_urlpatterns)),
 ]
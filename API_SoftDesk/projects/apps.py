@@ -5,3 +5,8 @@ from django.apps import AppConfig
 class ProjectsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'projects'
+
+    def ready(self):
+        # Connect the signals : user status cache invalidation,
+        # instrumentation of the database connections
+        from . import authentication, instrumentation  # noqa: F401
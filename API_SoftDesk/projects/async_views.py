@@ -0,0 +1,95 @@
+# Python Libs
+import functools
+
+# Django Libs
+from asgiref.sync import sync_to_async
+from django.core.handlers.asgi import ASGIRequest
+from django.db import close_old_connections
+from django.http import HttpResponse
+from django.template.response import SimpleTemplateResponse
+
+# Django REST Libs
+from rest_framework.routers import (SimpleRouter,)
+
+# Local Libs
+from .instrumentation import (timed,)
+
+
+# Actions run concurrently in the thread pool : reads only, SQLite
+# allows a single writer
+ASYNC_ACTIONS = ("list", "retrieve")
+# Actions streaming their response (NDJSON, server-sent events) : sync
+# generators, not wrapped
+STREAMING_ACTIONS = ("export", "events")
+
+
+def is_asgi_request(request):
+    """
+    True if the request is served by an ASGI server.
+
+    Django 3.2 iterates the streaming responses in the event loop,
+    blocking generators (events, export) would stop the server.
+    """
+    return isinstance(getattr(request, "_request", request), ASGIRequest)
+
+
+def _run(view, request, args, kwargs, release_connections):
+    """
+    Sync part of an async view : the viewset action and the rendering,
+    in one thread hop.
+    """
+    try:
+        response = view(request, *args, **kwargs)
+        if isinstance(response, SimpleTemplateResponse):
+            # Rendered here, the handler would render it in
+            # another (thread sensitive) hop
+            with timed("serialize"):
+                response.render()
+            rendered = HttpResponse(content=response.content,
+                                    status=response.status_code)
+            for header, value in response.items():
+                rendered[header] = value
+            response = rendered
+        return response
+    finally:
+        if release_connections:
+            # request_finished is not sent in the pool threads
+            close_old_connections()
+
+
+def as_async_view(view):
+    """
+    Async variant of a viewset view function.
+
+    Django 3.2 has no async ORM : the database work of an action is
+    done in a single sync_to_async hop.
+        - ASYNC_ACTIONS run in the thread pool (thread_sensitive=False),
+          concurrently with the other requests
+        - other actions, the writes, run in the thread sensitive
+          thread, like sync views under ASGI : one at a time
+    """
+    actions = view.actions
+
+    # wraps keeps cls, actions, initkwargs and csrf_exempt
+    @functools.wraps(view)
+    async def async_view(request, *args, **kwargs):
+        concurrent = actions.get(request.method.lower()) in ASYNC_ACTIONS
+        return await sync_to_async(_run, thread_sensitive=not concurrent)(
+            view, request, args, kwargs, concurrent)
+    return async_view
+
+
+class AsyncRouter(SimpleRouter):
+    """SimpleRouter registering the async variants of the viewsets
+
+    The STREAMING_ACTIONS views are kept sync : they refuse ASGI
+    requests (is_asgi_request), their streams block.
+    """
+
+    def get_urls(self):
+        urls = super().get_urls()
+        for url in urls:
+            actions = url.callback.actions.values()
+            if not any(action in STREAMING_ACTIONS for action in actions):
+                url.callback = as_async_view(url.callback)
+        return urls
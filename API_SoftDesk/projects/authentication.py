@@ -0,0 +1,145 @@
+# Python Libs
+import threading
+import time
+from collections import OrderedDict
+
+# Django Libs
+from django.contrib.auth.models import User
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils.functional import cached_property
+
+# Django REST Libs
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.models import TokenUser
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+from rest_framework_simplejwt.settings import api_settings
+
+# Local Libs
+from .conf import softdesk_setting
+
+
+class UserStatusCache():
+    """Current (is_active, is_superuser) of each user
+
+    Revocation check of the stateless authentication : a deactivated
+    or deleted user is refused at most AUTH_STATUS_CACHE_TIMEOUT
+    seconds after the change (immediately in the process saving it).
+
+    Eviction :
+        - least recently used user once AUTH_STATUS_CACHE_SIZE is reached
+        - entry expired after AUTH_STATUS_CACHE_TIMEOUT seconds
+    """
+    def __init__(self):
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        # Bumped on each invalidation, prevent storing a stale load
+        self._generation = 0
+
+    def status(self, user_id):
+        """(is_active, is_superuser), None if the user doesn't exist"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(user_id)
+                return entry[1]
+            generation = self._generation
+        status = User.objects.filter(id=user_id).values_list(
+            "is_active", "is_superuser").first()
+        max_users = softdesk_setting("AUTH_STATUS_CACHE_SIZE")
+        timeout = softdesk_setting("AUTH_STATUS_CACHE_TIMEOUT")
+        with self._lock:
+            if generation == self._generation and max_users > 0:
+                self._entries[user_id] = (now + timeout, status)
+                self._entries.move_to_end(user_id)
+                while len(self._entries) > max_users:
+                    self._entries.popitem(last=False)
+        return status
+
+    def invalidate(self, *user_ids):
+        """Forget the status of the users"""
+        with self._lock:
+            self._generation += 1
+            for user_id in user_ids:
+                self._entries.pop(user_id, None)
+
+    def clear(self):
+        """Forget all status"""
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+
+user_status_cache = UserStatusCache()
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def _user_changed(sender, instance, **kwargs):
+    user_status_cache.invalidate(instance.id)
+
+
+class ClaimsTokenObtainPairSerializer(TokenObtainPairSerializer):
+    """Login serializer adding is_superuser and is_active claims"""
+
+    @classmethod
+    def get_token(cls, user):
+        token = super().get_token(user)
+        token["is_superuser"] = user.is_superuser
+        token["is_active"] = user.is_active
+        return token
+
+
+class ClaimsUser(TokenUser):
+    """Request user built from the token claims
+
+        - id           : user_id claim
+        - is_superuser : claim, dropped if revoked since the login
+        - is_active    : claim
+
+    Related objects are written with their ids :
+        Issue(author_user_id_id=request.user.id, ...)
+    """
+    def __init__(self, token, status):
+        super().__init__(token)
+        self.status = status
+
+    @cached_property
+    def is_active(self):
+        return self.token.get("is_active", True) and self.status[0]
+
+    @cached_property
+    def is_superuser(self):
+        # Tokens issued before the claim existed : current status
+        claim = self.token.get("is_superuser", self.status[1])
+        return claim and self.status[1]
+
+
+class StatelessJWTAuthentication(JWTAuthentication):
+    """JWT authentication without the auth_user SELECT
+
+    The request user is a ClaimsUser built from the token, the only
+    lookup is the revocation check of UserStatusCache (one query per
+    user and AUTH_STATUS_CACHE_TIMEOUT).
+
+    Errors :
+        - 401 : no user claim, user deleted or inactive
+    """
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken("Token contained no recognizable "
+                               "user identification")
+        status = user_status_cache.status(user_id)
+        if status is None:
+            raise AuthenticationFailed("User not found",
+                                       code="user_not_found")
+        user = ClaimsUser(validated_token, status)
+        if not user.is_active:
+            raise AuthenticationFailed("User is inactive",
+                                       code="user_inactive")
+        return user
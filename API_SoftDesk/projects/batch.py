@@ -0,0 +1,200 @@
+# Python Libs
+import asyncio
+import io
+import json
+from urllib.parse import urlsplit
+
+# Django Libs
+from asgiref.sync import async_to_sync
+from django.core.handlers.wsgi import WSGIRequest
+from django.urls import Resolver404, resolve
+
+# Django REST Libs
+from rest_framework import status, viewsets
+from rest_framework.response import Response
+
+# Local Libs
+from .async_views import (STREAMING_ACTIONS,)
+from .conf import (softdesk_setting,)
+from .instrumentation import (TimedPermissionsMixin,)
+from .permissions import (BatchPermissions,)
+
+
+BATCH_METHODS = ("GET", "POST", "PUT", "DELETE")
+SAFE_METHODS = ("GET",)
+# Headers of the outer request not passed to the sub-requests
+OUTER_HEADERS = ("HTTP_AUTHORIZATION", "HTTP_IF_NONE_MATCH",
+                 "HTTP_IF_MODIFIED_SINCE", "HTTP_IF_MATCH",
+                 "HTTP_IF_UNMODIFIED_SINCE", "CONTENT_TYPE",
+                 "CONTENT_LENGTH")
+
+
+def _invalid_sub_request(item):
+    """
+    Check a sub-request of a batch.
+
+    Return the error detail, None if the sub-request is valid.
+    """
+    if not isinstance(item, dict):
+        return "Invalid form."
+    if item.get("method") not in BATCH_METHODS:
+        return "Invalid method."
+    path = item.get("path")
+    if not isinstance(path, str) or not path.startswith("/"):
+        return "Invalid path."
+    headers = item.get("headers", dict())
+    if not isinstance(headers, dict) or not all(
+            isinstance(value, str) for value in headers.values()):
+        return "Invalid headers."
+    return None
+
+
+def _sub_request(request, item):
+    """
+    HttpRequest of a sub-request, authenticated as the batch.
+
+    Built from the environ of the batch request (host, scheme, client
+    address), without its body, authorization and conditional headers.
+    The user and token of the batch are forced : the JWT is checked
+    once, by the batch request.
+    """
+    http_request = request._request
+    url = urlsplit(item["path"])
+    body = (b"" if item.get("body") is None
+            else json.dumps(item["body"]).encode())
+    environ = {key: value for key, value in http_request.META.items()
+               if key not in OUTER_HEADERS}
+    environ.update({
+        "PATH_INFO": url.path,
+        "QUERY_STRING": url.query,
+        "REQUEST_METHOD": item["method"],
+        "CONTENT_TYPE": "application/json",
+        "CONTENT_LENGTH": str(len(body)),
+        "wsgi.input": io.BytesIO(body),
+    })
+    for header, value in item.get("headers", dict()).items():
+        key = "HTTP_" + header.upper().replace("-", "_")
+        if key != "HTTP_AUTHORIZATION":
+            environ[key] = value
+    sub_request = WSGIRequest(environ)
+    sub_request._force_auth_user = request.user
+    sub_request._force_auth_token = request.auth
+    return sub_request
+
+
+def _body(response):
+    """Data of a sub-response (DRF data, else JSON content, else None)"""
+    if hasattr(response, "data"):
+        return response.data
+    try:
+        return json.loads(response.content) if response.content else None
+    except ValueError:
+        return None
+
+
+class BatchCRUD(TimedPermissionsMixin, viewsets.ViewSet):
+    """Batch of API requests
+
+    Methods:
+        - POST   : create
+
+    Generic Error:
+        (HTTP status_code | detail)
+        - 401 : JWT authentification failed
+    """
+    permission_classes = (BatchPermissions,)
+
+    def create(self, request):
+        """
+        POST request
+        Method create
+
+        Run a list of API requests in one round trip, in order.
+
+        The JWT is checked once for the batch. The sub-requests run
+        in-process, through the urls of the API and the same views
+        (permissions, conditional GET, caches) : each result is the
+        response of the same request sent alone. The project scopes
+        (projects.scope) are shared by the sub-requests until one of
+        them writes. Every sub-request is applied on its own (no
+        transaction around the batch) : an error response doesn't
+        cancel the others.
+
+        Form : list (at most BATCH_MAX_REQUESTS) of
+            - method    : GET | POST | PUT | DELETE
+            - path      : url path, with its query string
+                          (/projects/1/issues/?page_size=10)
+            - (body)    : JSON body
+            - (headers) : headers (If-None-Match...)
+
+        Validate :
+            (HTTP status_code | detail)
+            - 200 : results (status, headers, body), in order
+                    results (status, body : detail)
+                    - 400 : Invalid method, path or headers
+                    - 400 : Streaming response (export, events)
+                    - 404 : Not found
+        Errors :
+            (HTTP status_code | detail)
+            - 400 : Invalid form
+            - 400 : Empty form
+            - 400 : Too many requests
+        """
+        items = request.data
+        if not isinstance(items, list):
+            content = {"detail": "Invalid form."}
+            return Response(data=content,
+                            status=status.HTTP_400_BAD_REQUEST)
+        if not items:
+            content = {"detail": "Empty form."}
+            return Response(data=content,
+                            status=status.HTTP_400_BAD_REQUEST)
+        if len(items) > softdesk_setting("BATCH_MAX_REQUESTS"):
+            content = {"detail": "Too many requests."}
+            return Response(data=content,
+                            status=status.HTTP_400_BAD_REQUEST)
+        project_scopes = dict()
+        results = []
+        for item in items:
+            error = _invalid_sub_request(item)
+            if error:
+                results.append({"status": status.HTTP_400_BAD_REQUEST,
+                                "body": {"detail": error}})
+                continue
+            sub_request = _sub_request(request, item)
+            sub_request.project_scopes = project_scopes
+            results.append(self._run(sub_request))
+            if item["method"] not in SAFE_METHODS:
+                # Scopes read before a write may be stale
+                project_scopes.clear()
+        return Response(data={"results": results},
+                        status=status.HTTP_200_OK)
+
+    def _run(self, sub_request):
+        """Result of a sub-request"""
+        try:
+            match = resolve(sub_request.path_info)
+        except Resolver404:
+            match = None
+        view_class = getattr(getattr(match, "func", None), "cls", None)
+        if view_class is None or issubclass(view_class, BatchCRUD):
+            # Batched requests : API views only, no nested batch
+            return {"status": status.HTTP_404_NOT_FOUND,
+                    "body": {"detail": "Not found."}}
+        view = match.func
+        action = getattr(view, "actions", dict()).get(
+            sub_request.method.lower())
+        if action in STREAMING_ACTIONS:
+            # Not run : a stream is not a batched result
+            return {"status": status.HTTP_400_BAD_REQUEST,
+                    "body": {"detail": "Streaming response."}}
+        if asyncio.iscoroutinefunction(view):
+            # Async variant (ASYNC_VIEWS), from the batch thread
+            view = async_to_sync(view)
+        response = view(sub_request, *match.args, **match.kwargs)
+        headers = {header: response[header]
+                   for header in ("ETag", "Last-Modified", "Allow")
+                   if response.has_header(header)}
+        return {"status": response.status_code,
+                "headers": headers,
+                "body": _body(response)}
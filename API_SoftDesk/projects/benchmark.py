@@ -0,0 +1,379 @@
+# Python Libs
+import base64
+import itertools
+import json
+import math
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from collections import defaultdict, namedtuple
+
+
+# Path segment followed by the ID of its element
+ID_SEGMENTS = {"projects": "project_id",
+               "issues": "issue_id",
+               "comments": "comment_id",
+               "users": "user_id"}
+PERCENTILES = (("p50", 0.50), ("p95", 0.95), ("p99", 0.99))
+
+Endpoint = namedtuple("Endpoint", ("name", "method", "path"))
+
+
+class FlowError(Exception):
+    """Unexpected response : the rest of the flow is skipped"""
+
+
+def _path_template(url):
+    """
+    Path of a Postman url with ID placeholders :
+    http://127.0.0.1:8000/projects/1/issues/{{issue_id}}/
+    gives /projects/{project_id}/issues/{issue_id}/
+    """
+    if isinstance(url, dict):
+        url = url["raw"]
+    path = urllib.parse.urlsplit(
+        url if "://" in url else "http://" + url).path
+    parts = path.strip("/").split("/")
+    for index in range(1, len(parts)):
+        if parts[index - 1] in ID_SEGMENTS:
+            parts[index] = "{" + ID_SEGMENTS[parts[index - 1]] + "}"
+    return "/" + "/".join(parts) + "/"
+
+
+def load_collection(path):
+    """
+    Endpoints of a Postman collection : {request name: Endpoint}.
+
+    Numeric and {{variable}} IDs of the urls are replaced by
+    placeholders ({project_id}, {issue_id}, ...), the first request
+    of a name wins.
+    """
+    with open(path, encoding="utf-8") as collection:
+        items = json.load(collection)["item"]
+    endpoints = dict()
+    while items:
+        item = items.pop(0)
+        if "item" in item:
+            items = item["item"] + items
+            continue
+        request = item["request"]
+        endpoints.setdefault(item["name"], Endpoint(
+            item["name"], request["method"],
+            _path_template(request["url"])))
+    return endpoints
+
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of sorted values"""
+    if not values:
+        return None
+    return values[max(math.ceil(fraction * len(values)) - 1, 0)]
+
+
+class Recorder():
+    """Latencies and errors by endpoint, shared by the clients"""
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(int)
+        self.flows = defaultdict(lambda: {"runs": 0, "errors": 0})
+
+    def request(self, label, seconds, ok):
+        with self._lock:
+            self.latencies[label].append(seconds)
+            if not ok:
+                self.errors[label] += 1
+
+    def flow(self, name, error=None):
+        with self._lock:
+            self.flows[name]["runs"] += 1
+            if error is not None:
+                self.flows[name]["errors"] += 1
+                # Last failure, for the report
+                self.flows[name]["error"] = error
+
+    def summary(self, elapsed):
+        """Throughput (requests/s) and latency percentiles (ms)"""
+        def stats(latencies, errors):
+            latencies = sorted(latencies)
+            result = {"requests": len(latencies),
+                      "errors": errors,
+                      "throughput": round(len(latencies) / elapsed, 2)}
+            for name, fraction in PERCENTILES:
+                result[name] = round(percentile(latencies, fraction)
+                                     * 1000, 2) if latencies else None
+            return result
+
+        with self._lock:
+            return {
+                "total": stats(
+                    itertools.chain.from_iterable(self.latencies.values()),
+                    sum(self.errors.values())),
+                "endpoints": {label: stats(latencies, self.errors[label])
+                              for label, latencies
+                              in sorted(self.latencies.items())},
+                "flows": {name: dict(flow)
+                          for name, flow in sorted(self.flows.items())},
+            }
+
+
+class Client():
+    """HTTP client of one virtual user (standard library only)"""
+    def __init__(self, base_url, endpoints, recorder, timeout=30):
+        self.base_url = base_url.rstrip("/")
+        self.endpoints = endpoints
+        self.recorder = recorder
+        self.timeout = timeout
+        self.token = None
+        self.user_id = None
+
+    def call(self, name, expect, data=None, query=None, **ids):
+        """
+        Send the request of a collection endpoint, return the JSON body.
+
+        Arguments:
+            - name   : request name in the collection
+            - expect : expected status code (int or tuple)
+            - data   : form fields
+            - query  : query parameters
+            - ids    : values of the path placeholders
+        Raise FlowError on an unexpected status.
+        """
+        endpoint = self.endpoints[name]
+        url = self.base_url + endpoint.path.format(**ids)
+        if query:
+            url += "?" + urllib.parse.urlencode(query)
+        body = (urllib.parse.urlencode(data).encode()
+                if data is not None else None)
+        request = urllib.request.Request(url, data=body,
+                                         method=endpoint.method)
+        if self.token is not None:
+            request.add_header("Authorization", f"Bearer {self.token}")
+        start = time.perf_counter()
+        try:
+            with urllib.request.urlopen(request,
+                                        timeout=self.timeout) as response:
+                status, content = response.status, response.read()
+        except urllib.error.HTTPError as error:
+            status, content = error.code, error.read()
+        expect = expect if isinstance(expect, tuple) else (expect,)
+        self.recorder.request(f"{endpoint.method} {endpoint.path}",
+                              time.perf_counter() - start,
+                              status in expect)
+        if status not in expect:
+            raise FlowError(f"{endpoint.method} {url} : HTTP {status}")
+        return json.loads(content) if content else None
+
+    def login(self, username, password):
+        """Obtain a token, read the user ID from its claims"""
+        self.token = None
+        tokens = self.call("authentification", 200,
+                           data={"username": username,
+                                 "password": password})
+        self.token = tokens["access"]
+        claims = self.token.split(".")[1]
+        claims = json.loads(base64.urlsafe_b64decode(
+            claims + "=" * (-len(claims) % 4)))
+        self.user_id = claims["user_id"]
+
+
+def _results(content):
+    """Elements of a list response (paginated or not, None if empty)"""
+    if isinstance(content, dict):
+        return content["results"]
+    return content or []
+
+
+def story_flow(client, context, iteration):
+    """
+    "Exemple user story" folder : 3 signups, project, contributor,
+    issue, comments, refused accesses, issue deletion.
+    """
+    names = [f"{context['prefix']}_{iteration}_{user}"
+             for user in ("aa", "ac", "anc")]
+    password = context["password"]
+    for name in names:
+        client.call("signup a User", 201,
+                    data={"username": name,
+                          "first_name": name,
+                          "last_name": "bench",
+                          "email": f"{name}@softdesk.test",
+                          "password": password})
+    client.login(names[1], password)
+    contributor_id = client.user_id
+    client.login(names[0], password)
+    project = client.call("create project", 201,
+                          data={"title": f"Project {iteration}",
+                                "description": "Benchmark project",
+                                "type": "back-end"})
+    ids = {"project_id": project["id"]}
+    client.call("add contributor to project", 201,
+                data={"role": "tester", "user_id": contributor_id}, **ids)
+    client.login(names[1], password)
+    issue = client.call("create issue for project", 201,
+                        data={"title": "problem n1",
+                              "desc": "this is a big problem",
+                              "tag": "bug",
+                              "priority": "high",
+                              "status": "to do",
+                              "assignee_user_id": contributor_id},
+                        **ids)
+    ids["issue_id"] = issue["id"]
+    client.login(names[0], password)
+    comment = client.call("create comment for issue", 201,
+                          data={"description": "commentary"}, **ids)
+    client.call("update comment from issue", 200,
+                data={"description": "more important commentary"},
+                comment_id=comment["id"], **ids)
+    client.login(names[1], password)
+    client.call("list comments from issue", 200, **ids)
+    client.call("update issue from project", 200,
+                data={"desc": "Let's start simple."}, **ids)
+    client.login(names[0], password)
+    client.call("list issues from project", 200, **ids)
+    client.login(names[2], password)
+    # 204 : no project
+    client.call("list projects", (200, 204))
+    client.call("retrieve project", (403, 404), **ids)
+    client.call("delete project", (403, 404), **ids)
+    client.login(names[1], password)
+    client.call("delete project", 403, **ids)
+    client.call("delete issue from project", 200, **ids)
+    client.login(names[0], password)
+    client.call("list issues from project", 200, **ids)
+    client.call("list projects", 200)
+
+
+def read_flow(client, context, iteration):
+    """Seeded user browsing : projects, issues, comments, contributors"""
+    users = context["users"]
+    client.login(users[iteration % len(users)], context["password"])
+    projects = _results(client.call("list projects", (200, 204)))
+    if not projects:
+        return
+    ids = {"project_id": projects[iteration % len(projects)]["id"]}
+    client.call("retrieve project", 200, **ids)
+    client.call("list contributors from project", 200, **ids)
+    issues = _results(client.call("list issues from project", (200, 204),
+                                  **ids))
+    if issues:
+        ids["issue_id"] = issues[0]["id"]
+        comments = _results(client.call("list comments from issue",
+                                        (200, 204), **ids))
+        if comments:
+            client.call("retrieve comment from issue", 200,
+                        comment_id=comments[0]["id"], **ids)
+
+
+def write_flow(client, context, iteration):
+    """Seeded user managing a project, its issues and comments"""
+    users = context["users"]
+    client.login(users[iteration % len(users)], context["password"])
+    project = client.call("create project", 201,
+                          data={"title": f"Project {iteration}",
+                                "description": "Benchmark project",
+                                "type": "back-end"})
+    ids = {"project_id": project["id"]}
+    client.call("update project", 200,
+                data={"title": f"Project {iteration} A",
+                      "description": "Updated",
+                      "type": "Android"}, **ids)
+    issue = client.call("create issue for project", 201,
+                        data={"title": "problem n1",
+                              "desc": "this is a big problem",
+                              "tag": "bug",
+                              "priority": "low",
+                              "status": "to do",
+                              "assignee_user_id": client.user_id},
+                        **ids)
+    ids["issue_id"] = issue["id"]
+    client.call("update issue from project", 200,
+                data={"title": "problem n2"}, **ids)
+    comment = client.call("create comment for issue", 201,
+                          data={"description": "comm"}, **ids)
+    comment_ids = dict(ids, comment_id=comment["id"])
+    client.call("retrieve comment from issue", 200, **comment_ids)
+    client.call("update comment from issue", 200,
+                data={"description": "update comm"}, **comment_ids)
+    client.call("list comments from issue", 200, **ids)
+    client.call("delete comment from issue", 200, **comment_ids)
+    client.call("delete issue from project", 200, **ids)
+    client.call("delete project", (200, 202), **ids)
+
+
+FLOWS = {"story": story_flow,
+         "read": read_flow,
+         "write": write_flow}
+
+
+def run(base_url, endpoints, flows, context, concurrency, iterations,
+        timeout=30):
+    """
+    Replay flows against a server.
+
+    Arguments:
+        - base_url    : server url, http://127.0.0.1:8000
+        - endpoints   : load_collection() result
+        - flows       : names of FLOWS, run in turn
+        - context     : dict of the flows (prefix, password, users)
+        - concurrency : number of virtual users (threads)
+        - iterations  : number of flow runs, all clients together
+    Return the Recorder summary, with its duration in seconds.
+    """
+    recorder = Recorder()
+    counter = itertools.count()
+    lock = threading.Lock()
+
+    def worker():
+        client = Client(base_url, endpoints, recorder, timeout)
+        while True:
+            with lock:
+                iteration = next(counter)
+            if iteration >= iterations:
+                return
+            name = flows[iteration % len(flows)]
+            try:
+                FLOWS[name](client, context, iteration)
+            except (FlowError, OSError) as error:
+                # OSError : connection refused or reset, timeout
+                recorder.flow(name, error=str(error))
+            else:
+                recorder.flow(name)
+
+    start = time.perf_counter()
+    threads = [threading.Thread(target=worker, daemon=True)
+               for _ in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    summary = recorder.summary(elapsed)
+    summary["duration"] = round(elapsed, 3)
+    return summary
+
+
+def compare(baseline, current):
+    """
+    Changes from a baseline result : (label, throughput change,
+    p95 change) by endpoint present in both, in percent.
+    """
+    def change(old, new):
+        if not old or new is None:
+            return None
+        return round((new - old) / old * 100, 1)
+
+    rows = []
+    labels = ["total"] + sorted(set(baseline["endpoints"]) &
+                                set(current["endpoints"]))
+    for label in labels:
+        old = (baseline["total"] if label == "total"
+               else baseline["endpoints"][label])
+        new = (current["total"] if label == "total"
+               else current["endpoints"][label])
+        rows.append((label,
+                     change(old["throughput"], new["throughput"]),
+                     change(old["p95"], new["p95"])))
+    return rows
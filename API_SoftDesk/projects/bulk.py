@@ -0,0 +1,70 @@
+# Django Libs
+from django.db import connections, router, transaction
+
+
+def bulk_insert(model, objects, batch_size, ignore_conflicts=False):
+    """
+    Insert objects with bulk_create in batches, in one transaction.
+
+    Primary keys are set on the objects even when the backend cannot
+    return them from a bulk insert (SQLite with Django < 4.0).
+
+    Arguments:
+        - model            : model class
+        - objects          : unsaved model instances
+        - batch_size       : rows per INSERT
+        - ignore_conflicts : skip rows violating a constraint
+                             (pks are not set in that case)
+    """
+    objects = list(objects)
+    if not objects:
+        return objects
+    alias = router.db_for_write(model)
+    connection = connections[alias]
+    with transaction.atomic(using=alias):
+        model.objects.using(alias).bulk_create(
+            objects,
+            batch_size=batch_size,
+            ignore_conflicts=ignore_conflicts)
+        if (not ignore_conflicts and
+                objects[0].pk is None and
+                connection.vendor == "sqlite"):
+            # SQLite has a single writer : from the first INSERT to the
+            # end of the transaction no other connection can insert, so
+            # the last ids of the table are ours, in insertion order.
+            ids = model.objects.using(alias).order_by(
+                "-pk").values_list("pk", flat=True)[:len(objects)]
+            for obj, pk in zip(objects, reversed(list(ids))):
+                obj.pk = pk
+                obj._state.adding = False
+                obj._state.db = alias
+    return objects
+
+
+def insert_rows(model, fields, rows, batch_size):
+    """
+    Insert rows of database values with executemany, in batches.
+
+    Fast path for generated data : no model instances, no field
+    preparation, no signals. Values must be ready for the database
+    (ids included, datetimes adapted by connection.ops).
+
+    Arguments:
+        - model      : model class
+        - fields     : field names, in the order of the row values
+        - rows       : iterable of tuples
+        - batch_size : rows per executemany
+    Return the number of rows inserted.
+    """
+    alias = router.db_for_write(model)
+    connection = connections[alias]
+    quote = connection.ops.quote_name
+    columns = ", ".join(quote(model._meta.get_field(name).column)
+                        for name in fields)
+    sql = (f"INSERT INTO {quote(model._meta.db_table)} ({columns}) "
+           f"VALUES ({', '.join(['%s'] * len(fields))})")
+    rows = list(rows)
+    with transaction.atomic(using=alias), connection.cursor() as cursor:
+        for start in range(0, len(rows), batch_size):
+            cursor.executemany(sql, rows[start:start + batch_size])
+    return len(rows)
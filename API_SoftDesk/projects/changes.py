@@ -0,0 +1,185 @@
+# Python Libs
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+# Django Libs
+from django.utils import timezone
+
+# Local Libs
+from .conf import softdesk_setting
+from .instrumentation import timed
+from .models import (Contributor,
+                     Issue,
+                     Comment,
+                     Tombstone,)
+from .serializers import (ProjectSerializer,
+                          IssueSerializer,
+                          CommentSerializer,
+                          ContributorSerializer,)
+
+
+EPOCH = datetime(1970, 1, 1, tzinfo=dt_timezone.utc)
+MICROSECOND = timedelta(microseconds=1)
+# Column of the changed rows matching the object_id of the tombstones
+OBJECT_KEYS = {"issues": "id", "comments": "id", "contributors": "user_id"}
+
+
+class InvalidCursor(ValueError):
+    """Cursor not produced by changes()"""
+
+
+def encode_cursor(moment):
+    """Cursor of a datetime : microseconds since the epoch"""
+    return str((moment - EPOCH) // MICROSECOND)
+
+
+def decode_cursor(cursor):
+    """Datetime of a cursor, the epoch if None"""
+    if cursor is None:
+        return EPOCH
+    try:
+        return EPOCH + int(cursor) * MICROSECOND
+    except (ValueError, TypeError, OverflowError):
+        raise InvalidCursor(cursor)
+
+
+def record_deletions(project_id, kind, object_ids):
+    """Tombstones of deleted elements of a project"""
+    Tombstone.objects.bulk_create(
+        [Tombstone(project_id=project_id, kind=kind, object_id=object_id)
+         for object_id in object_ids])
+
+
+def record_project_deletion(project_id):
+    """
+    Tombstone of a deleted project.
+
+    Replace the tombstones of its elements : clients drop the whole
+    project.
+    """
+    Tombstone.objects.filter(project_id=project_id).delete()
+    record_deletions(project_id, "project", [project_id])
+
+
+def project_deletion(project_id):
+    """Tombstone of a deleted project, None if not deleted"""
+    try:
+        return Tombstone.objects.filter(project_id=project_id,
+                                        kind="project").first()
+    except (ValueError, TypeError):
+        # Malformed ids are handled as missing elements
+        return None
+
+
+def _sources(project):
+    """(name, serializer, queryset, time field) of the changed rows"""
+    return (
+        ("issues", IssueSerializer,
+         Issue.objects.filter(project_id=project.id), "updated_time"),
+        ("comments", CommentSerializer,
+         Comment.objects.filter(issue_id__project_id=project.id),
+         "updated_time"),
+        ("contributors", ContributorSerializer,
+         Contributor.objects.filter(project_id=project.id),
+         "updated_time"),
+        ("deleted", None,
+         Tombstone.objects.filter(project_id=project.id).values(
+             "kind", "object_id", "deleted_time"),
+         "deleted_time"),
+    )
+
+
+def _fetch(serializer, queryset, field, since, until, limit):
+    """values() rows changed in (since, until), limit + 1 at most"""
+    if serializer is not None:
+        queryset = serializer.values(queryset)
+    queryset = queryset.filter(**{f"{field}__gt": since})
+    if until is not None:
+        queryset = queryset.filter(**{f"{field}__lt": until})
+    queryset = queryset.order_by(field, "id")
+    if limit is not None:
+        queryset = queryset[:limit + 1]
+    return list(queryset)
+
+
+def changes(project, cursor=None, limit=None):
+    """
+    Elements of a project changed after a cursor.
+
+    Arguments:
+        - project : Project
+        - cursor  : cursor of a previous call, None for a full sync
+        - limit   : rows by kind (default CHANGES_MAX_ITEMS)
+
+    Return a dict :
+        - cursor       : cursor of the next call
+        - more         : more changes after cursor
+        - project      : project if changed, else None
+        - issues, comments, contributors : changed elements
+        - deleted      : {issues, comments, contributors} deleted IDs
+
+    Rows are read in (updated_time, id) order. When a kind has more
+    than limit changes, every kind stops before the first row left
+    out, so the next call resumes without gap. Rows changed in the
+    last CHANGES_SETTLE_TIME seconds are sent again by the next call :
+    clients apply changes by ID.
+    An element deleted then added again (contributor removed and
+    re-added) is sent as changed only : its tombstone is dropped when
+    the live row is as recent.
+
+    Raise InvalidCursor.
+    """
+    since = decode_cursor(cursor)
+    limit = limit or softdesk_setting("CHANGES_MAX_ITEMS")
+    sources = _sources(project)
+    rows = {name: _fetch(serializer, queryset, field, since, None, limit)
+            for name, serializer, queryset, field in sources}
+    # First time left out by a truncated kind
+    until = min((rows[name][limit][field]
+                 for name, _, _, field in sources
+                 if len(rows[name]) > limit),
+                default=None)
+    if until is not None:
+        rows = {name: [row for row in rows[name] if row[field] < until]
+                for name, _, _, field in sources}
+        if not any(rows.values()):
+            # More than limit rows at the same time : all of them
+            until += MICROSECOND
+            rows = {name: _fetch(serializer, queryset, field,
+                                 since, until, None)
+                    for name, serializer, queryset, field in sources}
+        next_since = until - MICROSECOND
+    else:
+        next_since = max([rows[name][-1][field]
+                          for name, _, _, field in sources if rows[name]]
+                         + [since, project.updated_time])
+        # Times are taken before commit : the rows of the writes still
+        # running are sent again by the next call rather than missed
+        settled = timezone.now() - timedelta(
+            seconds=softdesk_setting("CHANGES_SETTLE_TIME"))
+        next_since = max(since, min(next_since, settled))
+    live = {(name, row[key]): row["updated_time"]
+            for name, key in OBJECT_KEYS.items()
+            for row in rows[name]}
+    deleted = {"issues": [], "comments": [], "contributors": []}
+    for tombstone in rows.pop("deleted"):
+        name = tombstone["kind"] + "s"
+        updated_time = live.get((name, tombstone["object_id"]))
+        if (updated_time is not None and
+                updated_time >= tombstone["deleted_time"]):
+            # Added again after the deletion
+            continue
+        deleted[name].append(tombstone["object_id"])
+    # Once by element (removed several times)
+    deleted = {name: list(dict.fromkeys(object_ids))
+               for name, object_ids in deleted.items()}
+    content = {
+        "cursor": encode_cursor(next_since),
+        "more": until is not None,
+        "project": (ProjectSerializer(project).data
+                    if project.updated_time > since else None),
+    }
+    with timed("serialize"):
+        for name, serializer, _, _ in sources[:3]:
+            content[name] = serializer.represent(rows[name])
+    content["deleted"] = deleted
+    return content
@@ -0,0 +1,90 @@
+# Python Libs
+import hashlib
+
+# Django Libs
+from django.db.models import F
+from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+# Local Libs
+from .models import (Project,)
+
+
+def bump_version(project_id):
+    """Mark a project (or its issues, comments, contributors) as changed"""
+    Project.objects.filter(id=project_id).update(
+        version=F("version") + 1,
+        version_time=timezone.now())
+
+
+def _etag(*parts):
+    """Weak ETag of validator parts"""
+    digest = hashlib.blake2b(repr(parts).encode(), digest_size=12)
+    return "W/" + quote_etag(digest.hexdigest())
+
+
+def _last_modified(version_time):
+    """
+    Last-Modified timestamp (whole seconds) of a version time.
+
+    None while its second is not over : a later write in the same
+    second would keep the same Last-Modified, and If-Modified-Since
+    would get a stale 304. The ETag validates these responses.
+    """
+    if version_time is None:
+        return None
+    last_modified = int(version_time.timestamp())
+    if last_modified >= int(timezone.now().timestamp()):
+        return None
+    return last_modified
+
+
+def project_validators(request, project, resource):
+    """
+    (ETag, Last-Modified timestamp) of a resource of a project,
+    from its version stamp : nothing is serialized.
+
+    The query string is part of the ETag (pages, cursors).
+    """
+    etag = _etag(resource, project.id, project.version,
+                 request.META.get("QUERY_STRING", ""))
+    return etag, _last_modified(project.version_time)
+
+
+def projects_validators(request, projects):
+    """(ETag, Last-Modified timestamp) of a list of projects"""
+    stamps = sorted(projects.values_list("id", "version", "version_time"))
+    last_modified = max((version_time for _, _, version_time in stamps),
+                        default=None)
+    etag = _etag("projects",
+                 [(project_id, version) for project_id, version, _ in stamps],
+                 request.META.get("QUERY_STRING", ""))
+    return etag, _last_modified(last_modified)
+
+
+def conditional(request, validators, build_response):
+    """
+    Conditional GET.
+
+    Arguments:
+        - validators     : (etag, last_modified timestamp)
+        - build_response : called only if the client copy is stale
+
+    Return 304 (Not Modified) if If-None-Match / If-Modified-Since
+    match the validators, else the built response. Both carry the
+    ETag and Last-Modified headers (no Last-Modified while the second
+    of the last write is not over).
+    """
+    etag, last_modified = validators
+    response = get_conditional_response(request,
+                                        etag=etag,
+                                        last_modified=last_modified)
+    if response is None:
+        response = build_response()
+        if response.status_code != 200:
+            return response
+    response["ETag"] = etag
+    if last_modified is not None:
+        response["Last-Modified"] = http_date(last_modified)
+    return response
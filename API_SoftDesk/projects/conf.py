@@ -0,0 +1,66 @@
+# Django Libs
+from django.conf import settings
+
+
+# Default values of the SOFTDESK settings dictionary
+DEFAULTS = {
+    # Membership cache (projects.membership)
+    'MEMBERSHIP_CACHE_SIZE': 10000,
+    'MEMBERSHIP_CACHE_TIMEOUT': 300,
+    # Keyset pagination (projects.pagination)
+    'PAGE_SIZE': 100,
+    'MAX_PAGE_SIZE': 1000,
+    # values() serialization of list responses (projects.serializers),
+    # opt-in
+    'FAST_LIST_SERIALIZERS': False,
+    # Bulk endpoints
+    'BULK_MAX_ITEMS': 50000,
+    'BULK_BATCH_SIZE': 500,
+    # NDJSON export (projects.export)
+    'EXPORT_CHUNK_SIZE': 2000,
+    # Full-text search (projects.search)
+    'SEARCH_MAX_PAGE': 50,
+    # Revocation check of the stateless JWT authentication
+    # (projects.authentication)
+    'AUTH_STATUS_CACHE_SIZE': 10000,
+    'AUTH_STATUS_CACHE_TIMEOUT': 60,
+    # List responses cache (projects.response_cache),
+    # Django cache alias or None
+    'RESPONSE_CACHE_ALIAS': 'default',
+    'RESPONSE_CACHE_TIMEOUT': 300,
+    # Delta sync (projects.changes) : rows by kind and by call,
+    # seconds of overlap between two calls
+    'CHANGES_MAX_ITEMS': 1000,
+    'CHANGES_SETTLE_TIME': 2,
+    # Activity events stream (projects.events) : pub/sub backend class,
+    # events queued by subscriber, seconds between heartbeats,
+    # seconds by connection, open streams by process (each one holds
+    # a WSGI worker thread)
+    'EVENTS_BACKEND': 'projects.events.LocalBackend',
+    'EVENTS_QUEUE_SIZE': 100,
+    'EVENTS_HEARTBEAT': 15,
+    'EVENTS_STREAM_TIMEOUT': 30,
+    'EVENTS_MAX_STREAMS': 10,
+    # Project deletion (projects.deletion) : "inline" cascade in the
+    # request, or "background" worker thread ; rows by DELETE
+    'PROJECT_DELETION': 'inline',
+    'DELETION_BATCH_SIZE': 500,
+    # Sub-requests by batch (projects.batch)
+    'BATCH_MAX_REQUESTS': 20,
+    # Async variants of the viewsets in projects.urls (ASGI)
+    'ASYNC_VIEWS': False,
+    # Share of the requests instrumented (projects.instrumentation),
+    # Server-Timing header of the instrumented requests (always with
+    # settings.DEBUG) : SQL counts and timings shown to the clients
+    'INSTRUMENTATION_SAMPLE_RATE': 0.01,
+    'SERVER_TIMING': False,
+}
+
+
+def softdesk_setting(name):
+    """
+    Get a SoftDesk setting.
+
+    Value from settings.SOFTDESK if defined, else default value.
+    """
+    return getattr(settings, "SOFTDESK", dict()).get(name, DEFAULTS[name])
@@ -1,6 +1,7 @@
 # Django Libs
-from django.contrib.auth.models import User
+from django.db import transaction
 from django.db.models import Q
+from django.utils import timezone
 
 # Other frameworks Libs
 from rest_framework import viewsets
@@ -8,15 +9,22 @@ from rest_framework.response import Response
 from rest_framework import status
 
 # Local packages
-from .models import (Project,
-                     Contributor,
-                     Issue,
-                     Comment,)
+from . import search, stats
+from .changes import (record_deletions,)
+from .conditional import (bump_version,
+                          conditional,
+                          project_validators,)
+from .events import (event_bus,)
+from .instrumentation import (TimedPermissionsMixin,)
+from .models import (Comment,)
+from .pagination import (KeysetPagination,)
 from .permissions import (CommentPermissions,)
+from .response_cache import (response_cache,)
+from .scope import (get_project_scope,)
 from .serializers import (CommentSerializer)
 
 
-class CommentCRUD(viewsets.ViewSet):
+class CommentCRUD(TimedPermissionsMixin, viewsets.ViewSet):
     """Comment management
 
     Generic arguments:
@@ -56,46 +64,68 @@ class CommentCRUD(viewsets.ViewSet):
 
         Need to be a contributor to list comments.
 
+        Paginated by cursor, ordered by (created_time, id).
+
+        Query parameters:
+            - (cursor)
+            - (page_size)
+
+        Conditional GET : ETag / Last-Modified from the project version.
+        Cached by project version (projects.response_cache).
+
         Validate :
             (HTTP status_code | detail)
             - 200 : comments' list
+                    next
+                    results
             - 204 : No comment
+            - 304 : Not modified
         Errors :
             (HTTP status_code | detail)
+            - 400 : Invalid cursor or page size
             - 403 : Not permission to list
             - 404 : Element doesn't exist
         """
+        scope = get_project_scope(request, id, issue_id)
         # Check if project exist
-        try:
-            Project.objects.get(id=id)
-        except Project.DoesNotExist:
+        if scope.project is None:
             content = {"detail": "Project doesn't exist."}
             return Response(data=content,
                             status=status.HTTP_404_NOT_FOUND)
         # Check user is contributor
-        try:
-            Contributor.objects.get(Q(project_id=id) &
-                                    Q(user_id=request.user.id))
-        except Contributor.DoesNotExist:
+        if not scope.is_contributor:
             content = {"detail": "No contributor for the project."}
             return Response(data=content,
                             status=status.HTTP_403_FORBIDDEN)
-        # Check if issue exists
-        try:
-            Issue.objects.get(id=issue_id)
-        except Issue.DoesNotExist:
+        # Check if issue exist
+        if scope.issue is None:
             content = {"detail": "Issue doesn't exist."}
             return Response(data=content,
                             status=status.HTTP_404_NOT_FOUND)
-        comment = Comment.objects.filter(issue_id=issue_id)
-        serialized_comment = CommentSerializer(comment, many=True)
+        # Not modified since the client copy : 304
+        return conditional(
+            request,
+            project_validators(request, scope.project,
+                               ("comments", scope.issue.id)),
+            lambda: response_cache.response(
+                request, scope.project, f"comments.{scope.issue.id}",
+                lambda: self._list_page(request, issue_id)))
+
+    def _list_page(self, request, issue_id):
+        """Page of the comments of an issue"""
+        comments = CommentSerializer.list_queryset(
+            Comment.objects.filter(issue_id=issue_id))
+        paginator = KeysetPagination()
+        page = paginator.paginate_queryset(comments, request, view=self)
+        serialized_comment = CommentSerializer.list_data(page)
+        content = paginator.get_paginated_data(serialized_comment)
         # Check if comments exist
-        if comment:
-            return Response(data=serialized_comment.data,
+        if page:
+            return Response(data=content,
                             status=status.HTTP_200_OK)
         else:
-            # Return an empty json : []
-            return Response(data=serialized_comment.data,
+            # Return an empty page : results = []
+            return Response(data=content,
                             status=status.HTTP_204_NO_CONTENT)
 
     def create(self, request, id, issue_id):
@@ -118,26 +148,19 @@ class CommentCRUD(viewsets.ViewSet):
             - 403 : Not permission to create
             - 404 : Element doesn't exist
         """
+        scope = get_project_scope(request, id, issue_id)
         # Check if project exist
-        try:
-            # Check if contributor to project
-            Project.objects.get(id=id)
-        except Project.DoesNotExist:
+        if scope.project is None:
             content = {"detail": "Project doesn't exist."}
             return Response(data=content,
                             status=status.HTTP_404_NOT_FOUND)
         # Check user is contributor
-        try:
-            Contributor.objects.get(Q(project_id=id) &
-                                    Q(user_id=request.user.id))
-        except Contributor.DoesNotExist:
+        if not scope.is_contributor:
             content = {"detail": "No contributor for the project."}
             return Response(data=content,
                             status=status.HTTP_403_FORBIDDEN)
         # Check if issue exist
-        try:
-            Issue.objects.get(id=issue_id)
-        except Issue.DoesNotExist:
+        if scope.issue is None:
             content = {"detail": "Issue doesn't exist."}
             return Response(data=content,
                             status=status.HTTP_404_NOT_FOUND)
@@ -154,9 +177,8 @@ class CommentCRUD(viewsets.ViewSet):
             try:
                 data = dict()
                 data["description"] = content["description"]
-                user_id = User.objects.get(id=request.user.id)
-                data["author_user_id"] = user_id
-                data["issue_id"] = Issue.objects.get(id=issue_id)
+                data["author_user_id_id"] = request.user.id
+                data["issue_id"] = scope.issue
             except Exception:
                 content = {"detail": "Invalid form."}
                 return Response(data=content,
@@ -168,9 +190,15 @@ class CommentCRUD(viewsets.ViewSet):
                 content = {"detail": "Invalid form."}
                 return Response(data=content,
                                 status=status.HTTP_400_BAD_REQUEST)
-            comment.save()
+            with transaction.atomic():
+                comment.save()
+                stats.comments_changed(scope.project.id, 1)
+                bump_version(scope.project.id)
+                search.index_comments(scope.project.id, [comment])
 
             serialized_comment = CommentSerializer(comment)
+            event_bus.publish(scope.project.id, "comment", "created",
+                              comment.id, serialized_comment.data)
             return Response(data=serialized_comment.data,
                             status=status.HTTP_201_CREATED)
         else:
@@ -185,40 +213,46 @@ class CommentCRUD(viewsets.ViewSet):
 
         Need to be a contributor to get a comment.
 
+        Conditional GET : ETag / Last-Modified from the project version.
+
         Validate :
             (HTTP status_code | detail)
             - 200 : data retrieve
+            - 304 : Not modified
         Errors :
             (HTTP status_code | detail)
             - 403 : Not permission to retrieve
             - 404 : Element doesn't exist
         """
-        # Project exist
-        try:
-            # is contributor to project
-            Project.objects.get(id=id)
-        except Project.DoesNotExist:
+        scope = get_project_scope(request, id, issue_id)
+        # Check if project exist
+        if scope.project is None:
             content = {"detail": "Project doesn't exist."}
             return Response(data=content,
                             status=status.HTTP_404_NOT_FOUND)
         # Check user is contributor
-        try:
-            Contributor.objects.get(Q(project_id=id) &
-                                    Q(user_id=request.user.id))
-        except Contributor.DoesNotExist:
+        if not scope.is_contributor:
             content = {"detail": "No contributor for the project."}
             return Response(data=content,
                             status=status.HTTP_403_FORBIDDEN)
-        # issue exist
-        try:
-            Issue.objects.get(id=issue_id)
-        except Issue.DoesNotExist:
+        # Check if issue exist
+        if scope.issue is None:
             content = {"detail": "Issue doesn't exist."}
             return Response(data=content,
                             status=status.HTTP_404_NOT_FOUND)
+        # Not modified since the client copy : 304
+        return conditional(
+            request,
+            project_validators(request, scope.project,
+                               ("comment", scope.issue.id, str(pk))),
+            lambda: self._retrieve_comment(request, issue_id, pk))
+
+    def _retrieve_comment(self, request, issue_id, pk):
+        """Response of one comment of an issue"""
         # get comment if exist
         try:
-            comment = Comment.objects.get(id=pk)
+            comment = Comment.objects.get(Q(id=pk) &
+                                          Q(issue_id=issue_id))
         except Comment.DoesNotExist:
             content = {"detail": "Comment doesn't exist."}
             return Response(data=content,
@@ -253,23 +287,21 @@ class CommentCRUD(viewsets.ViewSet):
             - 403 : Not permission to update
             - 404 : Element doesn't exist
         """
-        try:
-            # is contributor to project
-            Project.objects.get(id=id)
-        except Project.DoesNotExist:
+        scope = get_project_scope(request, id, issue_id)
+        # Check if project exists
+        if scope.project is None:
             content = {"detail": "Project doesn't exist."}
             return Response(data=content,
                             status=status.HTTP_404_NOT_FOUND)
-        try:
-            # issue exist
-            Issue.objects.get(id=issue_id)
-        except Issue.DoesNotExist:
+        # Check if issue exist
+        if scope.issue is None:
             content = {"detail": "Issue doesn't exist."}
             return Response(data=content,
                             status=status.HTTP_404_NOT_FOUND)
         # get comment if exist
         try:
-            comment = Comment.objects.get(id=pk)
+            comment = Comment.objects.get(Q(id=pk) &
+                                          Q(issue_id=issue_id))
         except Comment.DoesNotExist:
             content = {"detail": "Comment doesn't exist."}
             return Response(data=content,
@@ -298,13 +330,20 @@ class CommentCRUD(viewsets.ViewSet):
                                 status=status.HTTP_404_NOT_FOUND)
             # Check if form is valid
             try:
-                comment.update(description=content["description"])
+                with transaction.atomic():
+                    # update() skips auto_now
+                    comment.update(description=content["description"],
+                                   updated_time=timezone.now())
+                    comment = Comment.objects.get(id=pk)
+                    search.index_comments(scope.project.id, [comment])
+                    bump_version(scope.project.id)
             except Exception:
                 content = {"detail": "Invalid form."}
                 return Response(data=content,
                                 status=status.HTTP_400_BAD_REQUEST)
-            comment = Comment.objects.get(id=pk)
             serialized_comment = CommentSerializer(comment)
+            event_bus.publish(scope.project.id, "comment", "updated",
+                              comment.id, serialized_comment.data)
             return Response(data=serialized_comment.data,
                             status=status.HTTP_200_OK)
         else:
@@ -330,24 +369,21 @@ class CommentCRUD(viewsets.ViewSet):
             - 403 : Not permission to delete
             - 404 : Element doesn't exist
         """
+        scope = get_project_scope(request, id, issue_id)
         # Check if project exists
-        try:
-            # is contributor to project
-            Project.objects.get(id=id)
-        except Project.DoesNotExist:
+        if scope.project is None:
             content = {"detail": "Project doesn't exist."}
             return Response(data=content,
                             status=status.HTTP_404_NOT_FOUND)
-        try:
-            # issue exist
-            Issue.objects.get(id=issue_id)
-        except Issue.DoesNotExist:
+        # Check if issue exist
+        if scope.issue is None:
             content = {"detail": "Issue doesn't exist."}
             return Response(data=content,
                             status=status.HTTP_404_NOT_FOUND)
         # get comment if exist
         try:
-            comment = Comment.objects.get(id=pk)
+            comment = Comment.objects.get(Q(id=pk) &
+                                          Q(issue_id=issue_id))
         except Comment.DoesNotExist:
             content = {"detail": "Comment doesn't exist."}
             return Response(data=content,
@@ -359,7 +395,13 @@ class CommentCRUD(viewsets.ViewSet):
                             status=status.HTTP_403_FORBIDDEN)
         self.check_object_permissions(request, comment)
         # Delete process
-        comment.delete()
+        with transaction.atomic():
+            search.unindex(comment_ids=[comment.id])
+            record_deletions(scope.project.id, "comment", [comment.id])
+            comment.delete()
+            stats.comments_changed(scope.project.id, -1)
+            bump_version(scope.project.id)
+        event_bus.publish(scope.project.id, "comment", "deleted", int(pk))
         content = {"detail": f"Successfully delete comment {pk}.",
                    "project_id": id,
                    "issue_id": issue_id,
@@ -1,20 +1,89 @@
 # Django Libs
 from django.contrib.auth.models import User
-from django.db.models import Q
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
 
 # Other frameworks Libs
 from rest_framework import viewsets
+from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework import status
 
 # Local packages
-from .models import (Contributor, Project,
-                     Issue,)
+from . import search, stats
+from .changes import (record_deletions,)
+from .bulk import (bulk_insert,)
+from .conditional import (bump_version,
+                          conditional,
+                          project_validators,)
+from .conf import (softdesk_setting,)
+from .events import (event_bus,)
+from .filters import (IssueFilter,)
+from .instrumentation import (TimedPermissionsMixin,)
+from .labels import (labels,)
+from .models import (Issue,
+                     Comment,)
+from .pagination import (KeysetPagination,)
 from .permissions import (IssuePermissions,)
-from .serializers import (IssueSerializer,)
+from .response_cache import (response_cache,)
+from .scope import (get_project_scope,)
+from .serializers import (AssignedIssueSerializer,
+                          IssueSerializer,)
 
 
-class IssueCRUD(viewsets.ViewSet):
+ISSUE_FORM_FIELDS = ("title", "desc", "tag", "priority", "status")
+# Fields of the update form, the other columns are written by the API
+# only (project, author, times)
+ISSUE_UPDATE_FIELDS = ISSUE_FORM_FIELDS + ("assignee_user_id",)
+# Fields stored as label codes : names of the IssueLabel table only,
+# a request never creates a label
+ISSUE_LABEL_FIELDS = ("tag", "priority", "status")
+
+
+def _unknown_label(content):
+    """
+    Check the label fields of a form.
+
+    Return the error detail, None if every name has a label.
+    """
+    for field in ISSUE_LABEL_FIELDS:
+        if field in content and not labels.known(field, str(content[field])):
+            return f"Unknown {field}."
+    return None
+
+
+def _invalid_issue(item, known_assignees):
+    """
+    Check an issue of a bulk form.
+
+    Return the error detail, None if the issue is valid.
+    """
+    if not isinstance(item, dict):
+        return "Invalid form."
+    for field in ISSUE_FORM_FIELDS:
+        if field not in item:
+            return f"Missing field {field}."
+        value = item[field]
+        model_field = Issue._meta.get_field(field)
+        if value is None and model_field.null:
+            continue
+        if not isinstance(value, str):
+            return f"Invalid field {field}."
+        if not value and not model_field.blank:
+            return f"Empty field {field}."
+        if len(value) > model_field.max_length:
+            return f"Field {field} is too long."
+    error = _unknown_label(item)
+    if error:
+        return error
+    if ("assignee_user_id" in item and
+            str(item["assignee_user_id"]) not in known_assignees):
+        return "Assignee doesn't exist."
+    return None
+
+
+class IssueCRUD(TimedPermissionsMixin, viewsets.ViewSet):
     """Issue management
 
     Generic arguments:
@@ -24,6 +93,7 @@ class IssueCRUD(viewsets.ViewSet):
     Methods:
         - GET    : list
         - POST   : create
+        - POST   : bulk
         - PUT    : update
         - DELETE : delete
 
@@ -31,9 +101,11 @@ class IssueCRUD(viewsets.ViewSet):
         Contributor :
             - list
             - create
+            - bulk
         Owner :
             - list
             - create
+            - bulk
             - update
             - destroy
 
@@ -50,34 +122,65 @@ class IssueCRUD(viewsets.ViewSet):
 
         List all issues from a project if user is a contributor
 
+        Paginated by cursor, ordered by (created_time, id) by default.
+
+        Query parameters:
+            - (cursor)
+            - (page_size)
+            - (status, priority, tag) : values separated by commas
+            - (assignee_user_id, author_user_id) : IDs separated by commas
+            - (created_after, created_before) : ISO 8601 datetimes
+            - (ordering) : [-]created_time | [-]updated_time
+
+        Conditional GET : ETag / Last-Modified from the project version.
+        Cached by project version (projects.response_cache).
+
         Validate :
             (HTTP status_code | detail)
             - 200 : issue's list
+                    next
+                    results
+            - 304 : Not modified
         Errors :
             (HTTP status_code | detail)
+            - 400 : Invalid cursor or page size
+            - 400 : Unknown or invalid filter, invalid ordering
             - 403 : Not permission to list
             - 404 : Element doesn't exist
         """
+        scope = get_project_scope(request, id)
         # Check if project exist
-        try:
-            Project.objects.get(id=id)
-        except Project.DoesNotExist:
+        if scope.project is None:
             content = {"detail": "Project doesn't exist."}
             return Response(data=content,
                             status=status.HTTP_404_NOT_FOUND)
         # Check user is contributor
-        try:
-            Contributor.objects.get(Q(project_id=id) &
-                                    Q(user_id=request.user.id))
-        except Contributor.DoesNotExist:
+        if not scope.is_contributor:
             content = {"detail": "No contributor for the project."}
             return Response(data=content,
                             status=status.HTTP_403_FORBIDDEN)
-        # List issues
-        issues = Issue.objects.filter(project_id=id)
-        serialized_issues = IssueSerializer(issues, many=True)
-        return Response(data=serialized_issues.data,
-                        status=status.HTTP_200_OK)
+        # Invalid filters : 400, even for a matching If-None-Match
+        issue_filter = IssueFilter(request)
+        predicate = issue_filter.predicate()
+        ordering = issue_filter.ordering()
+        # Not modified since the client copy : 304
+        return conditional(
+            request,
+            project_validators(request, scope.project, "issues"),
+            lambda: response_cache.response(
+                request, scope.project, "issues",
+                lambda: self._list_page(request, id, predicate, ordering)))
+
+    def _list_page(self, request, id, predicate, ordering):
+        """Page of the issues of a project, filtered"""
+        issues = IssueSerializer.list_queryset(
+            Issue.objects.filter(predicate, project_id=id))
+        paginator = KeysetPagination(ordering=ordering)
+        page = paginator.paginate_queryset(issues, request, view=self)
+        serialized_issues = IssueSerializer.list_data(page)
+        return Response(
+            data=paginator.get_paginated_data(serialized_issues),
+            status=status.HTTP_200_OK)
 
     def create(self, request, id):
         """
@@ -100,23 +203,19 @@ class IssueCRUD(viewsets.ViewSet):
         Errors :
             (HTTP status_code | detail)
             - 400 : Invalid form
+            - 400 : Unknown tag, priority or status (no label)
             - 403 : Not permission to create
             - 404 : Element doesn't exist
         """
+        scope = get_project_scope(request, id)
         # Check if project exist
-        try:
-            # Check if user is contributor
-            Project.objects.get(id=id)
-        except Project.DoesNotExist:
+        if scope.project is None:
             content = {"detail": "Project doesn't exist."}
             return Response(data=content,
                             status=status.HTTP_404_NOT_FOUND)
 
         # Check user is contributor
-        try:
-            Contributor.objects.get(Q(project_id=id) &
-                                    Q(user_id=request.user.id))
-        except Contributor.DoesNotExist:
+        if not scope.is_contributor:
             content = {"detail": "No contributor for the project."}
             return Response(data=content,
                             status=status.HTTP_403_FORBIDDEN)
@@ -129,6 +228,11 @@ class IssueCRUD(viewsets.ViewSet):
             return Response(data=content,
                             status=status.HTTP_400_BAD_REQUEST)
         if content:
+            error = _unknown_label(content)
+            if error:
+                content = {"detail": error}
+                return Response(data=content,
+                                status=status.HTTP_400_BAD_REQUEST)
             # Issue creation
             try:
                 data = dict()
@@ -136,18 +240,17 @@ class IssueCRUD(viewsets.ViewSet):
                 data["desc"] = content["desc"]
                 data["tag"] = content["tag"]
                 data["priority"] = content["priority"]
-                data["project_id"] = Project.objects.get(id=id)
+                data["project_id"] = scope.project
                 data["status"] = content["status"]
-                auth_id = User.objects.get(id=request.user.id)
                 # assignee:
                 if "assignee_user_id" in content:
                     assignee_id = User.objects.get(
                                         id=content["assignee_user_id"])
+                    data["assignee_user_id"] = assignee_id
                 # if no assignee, set assignee_user_id = request.user.id
                 else:
-                    assignee_id = User.objects.get(id=request.user.id)
-                data["author_user_id"] = auth_id
-                data["assignee_user_id"] = assignee_id
+                    data["assignee_user_id_id"] = request.user.id
+                data["author_user_id_id"] = request.user.id
                 # 'created_time' is automatically implemented
             except Exception:
                 content = {"detail": "Invalid form."}
@@ -161,9 +264,15 @@ class IssueCRUD(viewsets.ViewSet):
                 return Response(data=content,
                                 status=status.HTTP_400_BAD_REQUEST)
             # Saving process
-            issue.save()
+            with transaction.atomic():
+                issue.save()
+                stats.issues_created(scope.project.id, [issue])
+                bump_version(scope.project.id)
+                search.index_issues([issue])
             # Serialize issue
             serialized_issue = IssueSerializer(issue)
+            event_bus.publish(scope.project.id, "issue", "created",
+                              issue.id, serialized_issue.data)
             return Response(data=serialized_issue.data,
                             status=status.HTTP_201_CREATED)
         else:
@@ -171,6 +280,118 @@ class IssueCRUD(viewsets.ViewSet):
             return Response(data=content,
                             status=status.HTTP_400_BAD_REQUEST)
 
+    @action(detail=False, methods=["post"], url_path="bulk")
+    def bulk(self, request, id):
+        """
+        POST request
+        Method bulk
+
+        Need to be a contributor of the project to create issues.
+        Valid issues are created in one transaction,
+        invalid ones are reported by index.
+
+        Form: (list, at most BULK_MAX_ITEMS elements)
+            - title
+            - desc
+            - tag
+            - priority
+            - status
+            - (assignee_user_id)
+
+        Validate :
+            (HTTP status_code | detail)
+            - 201 : all issues created
+                    created
+                    results (index, status, id)
+            - 207 : some issues created
+                    created
+                    results (index, status, id | detail)
+        Errors :
+            (HTTP status_code | detail)
+            - 400 : Invalid form
+            - 403 : Not permission to create
+            - 404 : Element doesn't exist
+        """
+        scope = get_project_scope(request, id)
+        # Check if project exist
+        if scope.project is None:
+            content = {"detail": "Project doesn't exist."}
+            return Response(data=content,
+                            status=status.HTTP_404_NOT_FOUND)
+        # Check user is contributor
+        if not scope.is_contributor:
+            content = {"detail": "No contributor for the project."}
+            return Response(data=content,
+                            status=status.HTTP_403_FORBIDDEN)
+        # Check if form is a list of issues
+        items = request.data
+        if not isinstance(items, list) or not items:
+            content = {"detail": "Invalid form. Expected a list of issues."}
+            return Response(data=content,
+                            status=status.HTTP_400_BAD_REQUEST)
+        if len(items) > softdesk_setting("BULK_MAX_ITEMS"):
+            content = {"detail": "Too many issues, at most "
+                                 f"{softdesk_setting('BULK_MAX_ITEMS')}."}
+            return Response(data=content,
+                            status=status.HTTP_400_BAD_REQUEST)
+        # Resolve all assignees in one query
+        assignee_ids = set()
+        for item in items:
+            if isinstance(item, dict) and "assignee_user_id" in item:
+                assignee_ids.add(str(item["assignee_user_id"]))
+        known_ids = set()
+        wanted_ids = [assignee for assignee in assignee_ids
+                      if assignee.isdigit()]
+        if wanted_ids:
+            known_ids = {str(user_id) for user_id in User.objects.filter(
+                id__in=wanted_ids).values_list("id", flat=True)}
+        # Validate issues
+        results = []
+        issues = []
+        for index, item in enumerate(items):
+            error = _invalid_issue(item, known_ids)
+            if error:
+                results.append({"index": index,
+                                "status": status.HTTP_400_BAD_REQUEST,
+                                "detail": error})
+                continue
+            issues.append(Issue(
+                title=item["title"],
+                desc=item["desc"],
+                tag=item["tag"],
+                priority=item["priority"],
+                status=item["status"],
+                project_id=scope.project,
+                author_user_id_id=request.user.id,
+                assignee_user_id_id=item.get("assignee_user_id",
+                                             request.user.id)))
+            results.append({"index": index,
+                            "status": status.HTTP_201_CREATED})
+        # Saving process
+        with transaction.atomic():
+            bulk_insert(Issue, issues, softdesk_setting("BULK_BATCH_SIZE"))
+            stats.issues_created(scope.project.id, issues)
+            bump_version(scope.project.id)
+            search.index_issues(issues)
+        if issues:
+            event_bus.publish(scope.project.id, "issue", "bulk_created",
+                              data={"created": len(issues)})
+        created = iter(issues)
+        for result in results:
+            if result["status"] == status.HTTP_201_CREATED:
+                result["id"] = next(created).id
+        content = {"created": len(issues),
+                   "results": results}
+        if not issues:
+            return Response(data=content,
+                            status=status.HTTP_400_BAD_REQUEST)
+        elif len(issues) < len(items):
+            return Response(data=content,
+                            status=status.HTTP_207_MULTI_STATUS)
+        else:
+            return Response(data=content,
+                            status=status.HTTP_201_CREATED)
+
     def update(self, request, id, pk):
         """
         PUT request
@@ -185,6 +406,7 @@ class IssueCRUD(viewsets.ViewSet):
             - (priority)
             - (status)
             - (assignee_user_id)
+        Other fields (project_id, author_user_id, times) are refused.
 
         Validate :
             (HTTP status_code | detail)
@@ -192,26 +414,23 @@ class IssueCRUD(viewsets.ViewSet):
         Errors :
             (HTTP status_code | detail)
             - 400 : Invalid form
+            - 400 : Unknown tag, priority or status (no label)
             - 403 : Not permission to update
             - 404 : Element doesn't exist
         """
+        scope = get_project_scope(request, id, pk)
         # Check if project exist
-        try:
-            # is contributor
-            Project.objects.get(id=id)
-        except Project.DoesNotExist:
+        if scope.project is None:
             content = {"detail": "Project doesn't exist."}
             return Response(data=content,
                             status=status.HTTP_404_NOT_FOUND)
         # Check if issue exist
-        try:
-            issue = Issue.objects.get(id=pk)
-        except Issue.DoesNotExist:
+        if scope.issue is None:
             content = {"detail": "Issue doesn't exist."}
             return Response(data=content,
                             status=status.HTTP_404_NOT_FOUND)
         # Check permissions issue
-        self.check_object_permissions(request, issue)
+        self.check_object_permissions(request, scope.issue)
         # Check if content is a valid form
         try:
             content = dict(request.data.items())
@@ -219,17 +438,34 @@ class IssueCRUD(viewsets.ViewSet):
             content = {"detail": "Invalid form."}
             return Response(data=content,
                             status=status.HTTP_400_BAD_REQUEST)
+        if set(content) - set(ISSUE_UPDATE_FIELDS):
+            content = {"detail": "Invalid form."}
+            return Response(data=content,
+                            status=status.HTTP_400_BAD_REQUEST)
         # Check if content is not empty
         if content:
+            error = _unknown_label(content)
+            if error:
+                content = {"detail": error}
+                return Response(data=content,
+                                status=status.HTTP_400_BAD_REQUEST)
             # Check if content is valid
             try:
-                Issue.objects.filter(id=pk).update(**content)
+                # update() skips auto_now
+                content["updated_time"] = timezone.now()
+                with transaction.atomic():
+                    Issue.objects.filter(id=pk).update(**content)
+                    issue = Issue.objects.get(id=pk)
+                    stats.issue_updated(scope.issue, issue)
+                    bump_version(scope.project.id)
+                    search.index_issues([issue])
             except Exception:
                 content = {"detail": "Invalid form."}
                 return Response(data=content,
                                 status=status.HTTP_400_BAD_REQUEST)
-            issue = Issue.objects.get(id=pk)
             serialized_issue = IssueSerializer(issue)
+            event_bus.publish(scope.project.id, "issue", "updated",
+                              issue.id, serialized_issue.data)
             return Response(data=serialized_issue.data,
                             status=status.HTTP_200_OK)
         else:
@@ -255,27 +491,30 @@ class IssueCRUD(viewsets.ViewSet):
             - 404 : Element doesn't exist
             - 500 : Delete failed
         """
+        scope = get_project_scope(request, id, pk)
         # Check if project exist
-        try:
-            # is contributor
-            Project.objects.get(id=id)
-        except Project.DoesNotExist:
+        if scope.project is None:
             content = {"detail": "Project doesn't exist."}
             return Response(data=content,
                             status=status.HTTP_404_NOT_FOUND)
         # Check if issue exist
-        try:
-            issue = Issue.objects.get(
-                Q(id=pk) &
-                Q(project_id=Project.objects.get(id=id)))
-        except Issue.DoesNotExist:
+        if scope.issue is None:
             content = {"detail": "Issue doesn't exist."}
             return Response(data=content,
                             status=status.HTTP_404_NOT_FOUND)
         # Check permissions issue
-        self.check_object_permissions(request, issue)
+        self.check_object_permissions(request, scope.issue)
         try:
-            issue.delete()
+            with transaction.atomic():
+                comment_ids = list(Comment.objects.filter(
+                    issue_id=pk).values_list("id", flat=True))
+                search.unindex(issue_ids=[scope.issue.id],
+                               comment_ids=comment_ids)
+                record_deletions(scope.project.id, "issue", [pk])
+                scope.issue.delete()
+                stats.issue_deleted(scope.issue, len(comment_ids))
+                bump_version(scope.project.id)
+            event_bus.publish(scope.project.id, "issue", "deleted", int(pk))
             content = {"detail": f"Successfully delete issue {pk}.",
                        "project_id": id,
                        "issue_id": pk}
@@ -285,3 +524,64 @@ class IssueCRUD(viewsets.ViewSet):
             content = {"detail": "Delete not applied."}
             return Response(data=content,
                             status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+class AssignedIssueCRUD(TimedPermissionsMixin, viewsets.ViewSet):
+    """Issues assigned to the user, across projects
+
+    Methods:
+        - GET    : assigned
+
+    Generic Error:
+        (HTTP status_code | detail)
+        - 401 : JWT authentification failed
+    """
+    permission_classes = (IssuePermissions,)
+
+    @staticmethod
+    def assigned_queryset(user_id):
+        """
+        Issues assigned to a user in the projects they contribute to.
+
+        One query : range of the (assignee_user_id, created_time, id)
+        index, joined to the project (title, not deleted) and to the
+        contributor row of the user (unique by project and user).
+        """
+        return Issue.objects.filter(
+            assignee_user_id=user_id,
+            project_id__deleted_time__isnull=True,
+            project_id__contributor__user_id=user_id).annotate(
+                project_title=F("project_id__title"))
+
+    @action(detail=False, methods=["get"])
+    def assigned(self, request):
+        """
+        GET request
+        Method assigned
+
+        List the issues assigned to the user in every project
+        they contribute to, with the title of the project.
+
+        Paginated by cursor, ordered by (created_time, id).
+
+        Query parameters:
+            - (cursor)
+            - (page_size)
+
+        Validate :
+            (HTTP status_code | detail)
+            - 200 : issue's list
+                    next
+                    results (issue fields, project_title)
+        Errors :
+            (HTTP status_code | detail)
+            - 400 : Invalid cursor or page size
+        """
+        issues = AssignedIssueSerializer.list_queryset(
+            self.assigned_queryset(request.user.id))
+        paginator = KeysetPagination()
+        page = paginator.paginate_queryset(issues, request, view=self)
+        serialized_issues = AssignedIssueSerializer.list_data(page)
+        return Response(
+            data=paginator.get_paginated_data(serialized_issues),
+            status=status.HTTP_200_OK)
@@ -1,20 +1,51 @@
 # Django Libs
-from django.contrib.auth.models import User
+from django.db import transaction
+from django.http import StreamingHttpResponse
+from django.utils import timezone
 # from django.db.models import Q
 
 # Other frameworks Libs
 from rest_framework import viewsets
+from rest_framework.decorators import action
 from rest_framework.response import Response
+from rest_framework.settings import api_settings
 from rest_framework import status
 
 # Local packages
+from . import search
+from .async_views import (is_asgi_request,)
+from .changes import (InvalidCursor,
+                      changes,
+                      project_deletion,)
+from .conditional import (bump_version,
+                          conditional,
+                          project_validators,
+                          projects_validators,)
+from .conf import (softdesk_setting,)
+from .deletion import (request_deletion,
+                       run_deletion,
+                       start_worker,)
+from .events import (EventStreamRenderer,
+                     event_bus,)
+from .export import (export_project,)
+from .instrumentation import (TimedPermissionsMixin,)
+from .membership import (membership_cache,)
 from .models import (Project,
                      Contributor,)
+from .pagination import (RankedPagination,)
 from .permissions import (ProjectPermissions,)
+from .response_cache import (response_cache,)
+from .scope import (get_project_scope,)
 from .serializers import (ProjectSerializer,)
+from .stats import (project_stats,)
 
 
-class ProjectCRUD(viewsets.ViewSet):
+# Fields of the create and update forms, the other columns are
+# written by the API only (author, version, times)
+PROJECT_FORM_FIELDS = ("title", "description", "type")
+
+
+class ProjectCRUD(TimedPermissionsMixin, viewsets.ViewSet):
     """Projects management
 
     Generic argument:
@@ -23,6 +54,12 @@ class ProjectCRUD(viewsets.ViewSet):
     Methods:
         - GET    : list
         - GET    : retrieve
+        - GET    : export
+        - GET    : stats
+        - GET    : search
+        - GET    : changes
+        - GET    : events
+        - GET    : cache
         - POST   : create
         - PUT    : update
         - DELETE : delete
@@ -33,11 +70,23 @@ class ProjectCRUD(viewsets.ViewSet):
         Contributor :
             - list
             - retrieve
+            - export
+            - stats
+            - search
+            - changes
+            - events
         Owner :
             - list
             - retrieve
+            - export
+            - stats
+            - search
+            - changes
+            - events
             - update
             - destroy
+        Superuser :
+            - cache
 
     Generic Error:
         (HTTP status_code | detail)
@@ -52,30 +101,36 @@ class ProjectCRUD(viewsets.ViewSet):
 
         Show all projects linked to the authenticated user
 
+        Conditional GET : ETag / Last-Modified from the projects versions.
+
         Validate :
             (HTTP status_code | detail)
             - 200 : projects' list
             - 204 : No project
+            - 304 : Not modified
         Errors :
             (HTTP status_code | detail)
             - 403 : Not permission to list
         """
         # Show all projects
         projects = Project.objects.all()
-        # Select them all if admin
-        if request.user.is_superuser:
-            serialized_list = ProjectSerializer(projects,
-                                                many=True)
         # Select user's projects if not admin
-        else:
-            contrib_projects = projects.filter(
+        if not request.user.is_superuser:
+            projects = projects.filter(
                 id__in=Contributor.objects.filter(
                     user_id=request.user.id).values_list("project_id"))
-            serialized_list = ProjectSerializer(contrib_projects,
-                                                many=True)
+        # Not modified since the client copy : 304
+        return conditional(request,
+                           projects_validators(request, projects),
+                           lambda: self._list_projects(projects))
+
+    def _list_projects(self, projects):
+        """Response of a list of projects"""
+        serialized_list = ProjectSerializer.list_data(
+            ProjectSerializer.list_queryset(projects))
         # Content available
-        if serialized_list.data:
-            content = serialized_list.data
+        if serialized_list:
+            content = serialized_list
             return Response(data=content,
                             status=status.HTTP_200_OK)
         # Content not available
@@ -91,9 +146,12 @@ class ProjectCRUD(viewsets.ViewSet):
 
         Get a specific project for the authenticated user.
 
+        Conditional GET : ETag / Last-Modified from the project version.
+
         Validate :
             (HTTP status_code | detail)
             - 200 : retrieved project
+            - 304 : Not modified
         Errors :
             (HTTP status_code | detail)
             - 400 : Invalid form
@@ -101,18 +159,24 @@ class ProjectCRUD(viewsets.ViewSet):
             - 404 : Element doesn't exist
         """
         # Get one project : id=pk
-        try:
-            project = Project.objects.get(id=pk)
-        except Exception:
+        project = get_project_scope(request, pk).project
+        if project is None:
             content = {"detail": "Project doesn't exist."}
             return Response(data=content,
                             status=status.HTTP_404_NOT_FOUND)
+        # Check is user has permission to access this project
+        self.check_object_permissions(request, project)
+        # Not modified since the client copy : 304
+        return conditional(
+            request,
+            project_validators(request, project, "project"),
+            lambda: self._retrieve_project(project))
 
+    def _retrieve_project(self, project):
+        """Response of one project"""
         serialized_project = ProjectSerializer(project)
         if serialized_project.data:
             content = serialized_project.data
-            # Check is user has permission to access this project
-            self.check_object_permissions(request, project)
             return Response(content,
                             status=status.HTTP_200_OK)
         else:
@@ -120,6 +184,255 @@ class ProjectCRUD(viewsets.ViewSet):
             return Response(content,
                             status=status.HTTP_400_BAD_REQUEST)
 
+    @action(detail=True, methods=["get"])
+    def export(self, request, pk):
+        """
+        GET request
+        Method export
+
+        Stream the whole project as NDJSON (one JSON record per line) :
+        project, contributors, issues and comments.
+        Need to be a contributor of the project.
+        WSGI servers only : the stream runs its queries while it is
+        sent (see the export_project command).
+
+        Validate :
+            (HTTP status_code | detail)
+            - 200 : NDJSON stream
+        Errors :
+            (HTTP status_code | detail)
+            - 403 : Not permission to export
+            - 404 : Element doesn't exist
+            - 501 : Streaming response under ASGI
+        """
+        if is_asgi_request(request):
+            content = {"detail": "Streaming response under ASGI."}
+            return Response(data=content,
+                            status=status.HTTP_501_NOT_IMPLEMENTED)
+        try:
+            project = Project.objects.get(id=pk)
+        except Exception:
+            content = {"detail": "Project doesn't exist."}
+            return Response(data=content,
+                            status=status.HTTP_404_NOT_FOUND)
+        # Check is user has permission to export this project
+        self.check_object_permissions(request, project)
+        response = StreamingHttpResponse(
+            export_project(project),
+            content_type="application/x-ndjson")
+        response["Content-Disposition"] = (
+            f'attachment; filename="project-{project.id}.ndjson"')
+        return response
+
+    @action(detail=True, methods=["get"])
+    def stats(self, request, pk):
+        """
+        GET request
+        Method stats
+
+        Counters of the project, read from the denormalized
+        ProjectStats table. Need to be a contributor of the project.
+
+        Validate :
+            (HTTP status_code | detail)
+            - 200 : project_id
+                    issues
+                    status
+                    priority
+                    tag
+                    comments
+        Errors :
+            (HTTP status_code | detail)
+            - 403 : Not permission to get stats
+            - 404 : Element doesn't exist
+        """
+        scope = get_project_scope(request, pk)
+        if scope.project is None:
+            content = {"detail": "Project doesn't exist."}
+            return Response(data=content,
+                            status=status.HTTP_404_NOT_FOUND)
+        # Check is user has permission to access this project
+        self.check_object_permissions(request, scope.project)
+        content = {"project_id": scope.project.id}
+        content.update(project_stats(scope.project.id))
+        return Response(data=content,
+                        status=status.HTTP_200_OK)
+
+    @action(detail=False, methods=["get"])
+    def search(self, request):
+        """
+        GET request
+        Method search
+
+        Full-text search of the issues (title, desc) and comments
+        (description) of the projects the user contributes to.
+        Every word of the query must match, results are ranked
+        by relevance.
+
+        Query parameters:
+            - q         : searched words
+            - (project) : ID of one of the user's projects
+            - (page)
+            - (page_size)
+
+        Validate :
+            (HTTP status_code | detail)
+            - 200 : next
+                    results (type, id, project_id, issue_id,
+                             title, snippet)
+        Errors :
+            (HTTP status_code | detail)
+            - 400 : Empty query
+            - 400 : Invalid page
+            - 404 : Project doesn't exist
+        """
+        query = request.query_params.get("q", "").strip()
+        if not query:
+            content = {"detail": "Empty query."}
+            return Response(data=content,
+                            status=status.HTTP_400_BAD_REQUEST)
+        project_ids = membership_cache.projects(request.user.id)
+        if "project" in request.query_params:
+            project_id = request.query_params["project"]
+            if not membership_cache.is_contributor(request.user.id,
+                                                   project_id):
+                content = {"detail": "Project doesn't exist."}
+                return Response(data=content,
+                                status=status.HTTP_404_NOT_FOUND)
+            project_ids = [project_id]
+        paginator = RankedPagination()
+        results = paginator.paginate_results(
+            lambda offset, limit: search.search(query, project_ids,
+                                                offset, limit),
+            request)
+        return Response(data=paginator.get_paginated_data(results),
+                        status=status.HTTP_200_OK)
+
+    @action(detail=True, methods=["get"])
+    def changes(self, request, pk):
+        """
+        GET request
+        Method changes
+
+        Delta sync : elements of the project changed after a cursor.
+        Call again with the returned cursor (while more is true).
+        Need to be a contributor of the project.
+
+        Query parameters:
+            - (since) : cursor of the previous call, none for a full sync
+
+        Validate :
+            (HTTP status_code | detail)
+            - 200 : cursor
+                    more
+                    project (None if not changed)
+                    issues
+                    comments
+                    contributors
+                    deleted (issues, comments, contributors IDs)
+        Errors :
+            (HTTP status_code | detail)
+            - 400 : Invalid cursor
+            - 403 : Not permission to sync
+            - 404 : Element doesn't exist
+            - 410 : Project deleted
+        """
+        scope = get_project_scope(request, pk)
+        if scope.project is None:
+            if project_deletion(pk) is not None:
+                content = {"detail": "Project deleted.",
+                           "project_id": pk}
+                return Response(data=content,
+                                status=status.HTTP_410_GONE)
+            content = {"detail": "Project doesn't exist."}
+            return Response(data=content,
+                            status=status.HTTP_404_NOT_FOUND)
+        # Check is user has permission to access this project
+        self.check_object_permissions(request, scope.project)
+        try:
+            content = changes(scope.project,
+                              request.query_params.get("since"))
+        except InvalidCursor:
+            content = {"detail": "Invalid cursor."}
+            return Response(data=content,
+                            status=status.HTTP_400_BAD_REQUEST)
+        return Response(data=content,
+                        status=status.HTTP_200_OK)
+
+    @action(detail=True, methods=["get"],
+            renderer_classes=(api_settings.DEFAULT_RENDERER_CLASSES
+                              + [EventStreamRenderer]))
+    def events(self, request, pk):
+        """
+        GET request
+        Method events
+
+        Server-Sent Events (text/event-stream) of the project activity :
+        "<kind>.<action>" events (kind : project, issue, comment,
+        contributor ; action : created, updated, deleted, bulk_created,
+        bulk_changed)
+        with the element representation.
+        A "stream.resync" event replaces the events dropped for a slow
+        client : get the changes since the last cursor.
+        Need to be a contributor of the project.
+        WSGI servers only : each stream holds a worker thread, for
+        EVENTS_STREAM_TIMEOUT seconds at most.
+
+        Validate :
+            (HTTP status_code | detail)
+            - 200 : events stream
+        Errors :
+            (HTTP status_code | detail)
+            - 403 : Not permission to follow
+            - 404 : Element doesn't exist
+            - 501 : Streaming response under ASGI
+            - 503 : Too many streams (EVENTS_MAX_STREAMS)
+        """
+        if is_asgi_request(request):
+            content = {"detail": "Streaming response under ASGI."}
+            return Response(data=content,
+                            status=status.HTTP_501_NOT_IMPLEMENTED)
+        scope = get_project_scope(request, pk)
+        if scope.project is None:
+            content = {"detail": "Project doesn't exist."}
+            return Response(data=content,
+                            status=status.HTTP_404_NOT_FOUND)
+        # Check is user has permission to access this project
+        self.check_object_permissions(request, scope.project)
+        if event_bus.streams() >= softdesk_setting("EVENTS_MAX_STREAMS"):
+            content = {"detail": "Too many streams."}
+            return Response(data=content,
+                            status=status.HTTP_503_SERVICE_UNAVAILABLE)
+        response = StreamingHttpResponse(event_bus.stream(scope.project.id),
+                                         content_type="text/event-stream")
+        response["Cache-Control"] = "no-cache"
+        # No buffering by reverse proxies (nginx)
+        response["X-Accel-Buffering"] = "no"
+        return response
+
+    @action(detail=False, methods=["get"])
+    def cache(self, request):
+        """
+        GET request
+        Method cache
+
+        Hit / miss counters of the list responses cache (this process).
+        Need to be a superuser.
+
+        Validate :
+            (HTTP status_code | detail)
+            - 200 : alias
+                    hits
+                    misses
+                    hit_ratio
+                    resources (hits and misses by resource)
+        Errors :
+            (HTTP status_code | detail)
+            - 403 : Not permission to monitor
+        """
+        return Response(data=response_cache.counters(),
+                        status=status.HTTP_200_OK)
+
     def create(self, request):
         """
         POST request
@@ -147,11 +460,14 @@ class ProjectCRUD(viewsets.ViewSet):
             content = {"detail": "Form is invalid."}
             return Response(data=content,
                             status=status.HTTP_400_BAD_REQUEST)
+        if set(content) - set(PROJECT_FORM_FIELDS):
+            content = {"detail": "Invalid keys in form."}
+            return Response(data=content,
+                            status=status.HTTP_400_BAD_REQUEST)
         if content:
             # Creation of the projet
-            suser = User.objects.get(id=request.user.id)
             try:
-                content["author_user_id"] = suser
+                content["author_user_id_id"] = request.user.id
                 project = Project(**content)
             except Exception:
                 content = {"detail": "Invalid keys in form."}
@@ -165,7 +481,7 @@ class ProjectCRUD(viewsets.ViewSet):
                 contrib_attrib["permission"] = "1"
                 contrib_attrib["role"] = "author"
                 contrib_attrib["project_id"] = project
-                contrib_attrib["user_id"] = suser
+                contrib_attrib["user_id_id"] = request.user.id
                 contributor = Contributor(**contrib_attrib)
             except Exception:
                 content = {"detail": "Intern error"}
@@ -173,6 +489,7 @@ class ProjectCRUD(viewsets.ViewSet):
                                 status=status.HTTP_500_INTERNAL_SERVER_ERROR)
             # Saving process
             contributor.save()
+            membership_cache.invalidate(contributor.user_id_id)
 
             serialized_project = ProjectSerializer(project)
             return Response(data=serialized_project.data,
@@ -193,6 +510,8 @@ class ProjectCRUD(viewsets.ViewSet):
             - (title)
             - (description)
             - (type)
+        Other fields (version, times...) are refused : a project is
+        deleted by DELETE only (deleted_time).
 
         Validate :
             (HTTP status_code | detail)
@@ -220,15 +539,32 @@ class ProjectCRUD(viewsets.ViewSet):
             content = {"detail": "Form is invalid."}
             return Response(data=content,
                             status=status.HTTP_400_BAD_REQUEST)
+        if set(content) - set(PROJECT_FORM_FIELDS):
+            content = {"detail": "Invalid form."}
+            return Response(data=content,
+                            status=status.HTTP_400_BAD_REQUEST)
         if content:
             try:
-                project.update(**content)
+                # update() skips auto_now
+                content["updated_time"] = timezone.now()
+                with transaction.atomic():
+                    if not project.update(**content):
+                        # Deletion requested since the project was read
+                        raise Project.DoesNotExist
+                    bump_version(pk)
+                    project_updated = project.get()
+            except Project.DoesNotExist:
+                content = {"detail": "Project doesn't exist."}
+                return Response(data=content,
+                                status=status.HTTP_404_NOT_FOUND)
             except Exception:
                 content = {"detail": "Invalid form."}
                 return Response(data=content,
                                 status=status.HTTP_400_BAD_REQUEST)
-            serialized_project = ProjectSerializer(project, many=True)
-            return Response(data=serialized_project.data,
+            serialized_project = ProjectSerializer(project_updated)
+            event_bus.publish(pk, "project", "updated", int(pk),
+                              serialized_project.data)
+            return Response(data=[serialized_project.data],
                             status=status.HTTP_200_OK)
         else:
             content = {"detail": "Empty form."}
@@ -242,10 +578,18 @@ class ProjectCRUD(viewsets.ViewSet):
 
         Need to own the project to delete it.
 
+        The project is hidden at once, its issues, comments and
+        contributors are deleted in batches (projects.deletion) :
+        in the request, or by a background worker if PROJECT_DELETION
+        is "background".
+
         Validate :
             (HTTP status_code | detail)
             - 200 : project deleted
                     project_id
+            - 202 : project deletion started
+                    project_id
+                    deletion_id
         Errors :
             (HTTP status_code | detail)
             - 403 : Not permission to delete
@@ -263,7 +607,16 @@ class ProjectCRUD(viewsets.ViewSet):
         # Check if user has permission to delete the project
         self.check_object_permissions(request, project_deleted)
         try:
-            project_deleted.delete()
+            deletion = request_deletion(project_deleted)
+            event_bus.publish(pk, "project", "deleted", int(pk))
+            if softdesk_setting("PROJECT_DELETION") == "background":
+                transaction.on_commit(start_worker)
+                content = {"detail": f"Project {pk} deletion started.",
+                           "project_id": pk,
+                           "deletion_id": deletion.id}
+                return Response(data=content,
+                                status=status.HTTP_202_ACCEPTED)
+            run_deletion(deletion)
             content = {"detail": f"Project {pk} deleted.",
                        "project_id": pk}
             return Response(data=content,
@@ -0,0 +1,167 @@
+# Python Libs
+import logging
+import threading
+
+# Django Libs
+from django.db import connection, transaction
+from django.utils import timezone
+
+# Local Libs
+from . import search
+from .changes import (record_project_deletion,)
+from .conf import softdesk_setting
+from .membership import (membership_cache,)
+from .models import (Project,
+                     Contributor,
+                     Issue,
+                     Comment,
+                     ProjectStats,
+                     ProjectDeletion,)
+
+
+logger = logging.getLogger("projects.deletion")
+
+# Worker thread of this process (None if not running)
+_worker = None
+_worker_lock = threading.Lock()
+
+
+def request_deletion(project):
+    """
+    Hide a project and record its deletion job.
+
+    The project is excluded from Project.objects at once, its rows
+    are deleted by run_deletion().
+
+    Return the ProjectDeletion.
+    """
+    user_ids = list(Contributor.objects.filter(
+        project_id=project.id).values_list("user_id", flat=True))
+    with transaction.atomic():
+        Project.all_objects.filter(id=project.id).update(
+            deleted_time=timezone.now())
+        record_project_deletion(project.id)
+        deletion = ProjectDeletion.objects.create(project_id=project.id)
+    membership_cache.invalidate(*user_ids)
+    return deletion
+
+
+def _stages(project_id):
+    """(stage, model, queryset of the rows) in deletion order"""
+    return (
+        ("comments", Comment,
+         Comment.objects.filter(issue_id__project_id=project_id)),
+        ("issues", Issue,
+         Issue.objects.filter(project_id=project_id)),
+        ("contributors", Contributor,
+         Contributor.objects.filter(project_id=project_id)),
+        ("stats", ProjectStats,
+         ProjectStats.objects.filter(project_id=project_id)),
+        ("project", Project,
+         Project.all_objects.filter(id=project_id)),
+    )
+
+
+def _delete_rows(model, ids):
+    """DELETE ... WHERE id IN (...) : no collector, no signals"""
+    table = connection.ops.quote_name(model._meta.db_table)
+    placeholders = ", ".join(["%s"] * len(ids))
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {table} WHERE id IN ({placeholders})",
+                       ids)
+
+
+def run_deletion(deletion, batch_size=None, progress=None):
+    """
+    Delete the rows of a deleted project, in batches of batch_size
+    (default DELETION_BATCH_SIZE) rows.
+
+    Each batch is one transaction, with the progress of the job :
+    after a crash, run_deletion() resumes from the committed state.
+
+    progress(deletion) is called after each batch.
+    """
+    batch_size = batch_size or softdesk_setting("DELETION_BATCH_SIZE")
+    stages = _stages(deletion.project_id)
+    names = [stage for stage, _, _ in stages] + ["done"]
+    for index, (stage, model, queryset) in enumerate(stages):
+        if index < names.index(deletion.stage):
+            # Done before a restart
+            continue
+        ids = True
+        while ids:
+            with transaction.atomic():
+                ids = list(queryset.order_by().values_list(
+                    "id", flat=True)[:batch_size])
+                if ids:
+                    if stage == "comments":
+                        search.unindex(comment_ids=ids)
+                    elif stage == "issues":
+                        search.unindex(issue_ids=ids)
+                    _delete_rows(model, ids)
+                # Empty batch : stage done
+                deletion.stage = stage if ids else names[index + 1]
+                deletion.deleted_rows += len(ids)
+                ProjectDeletion.objects.filter(id=deletion.id).update(
+                    stage=deletion.stage,
+                    deleted_rows=deletion.deleted_rows,
+                    updated_time=timezone.now())
+            if progress is not None:
+                progress(deletion)
+        logger.info("project %s : %s deleted (%s rows)",
+                    deletion.project_id, stage, deletion.deleted_rows)
+    return deletion
+
+
+def pending_deletions():
+    """Deletion jobs not done, oldest first"""
+    return ProjectDeletion.objects.exclude(stage="done").order_by("id")
+
+
+def process_deletions(batch_size=None, progress=None):
+    """Run every pending deletion job, return the number of jobs run"""
+    count = 0
+    for deletion in pending_deletions():
+        run_deletion(deletion, batch_size, progress)
+        count += 1
+    return count
+
+
+def start_worker():
+    """
+    Run the pending deletions in a background thread of this process.
+
+    One thread at most : SQLite has a single writer. Jobs left by a
+    crash are resumed by the next worker or by the process_deletions
+    management command.
+    """
+    global _worker
+    with _worker_lock:
+        if _worker is not None:
+            # Running : one more pass for the new job
+            _worker.rerun = True
+            return
+        _worker = threading.Thread(target=_work,
+                                   name="softdesk-deletion",
+                                   daemon=True)
+        _worker.rerun = False
+        _worker.start()
+
+
+def _work():
+    global _worker
+    worker = threading.current_thread()
+    try:
+        while True:
+            process_deletions()
+            with _worker_lock:
+                if not worker.rerun:
+                    _worker = None
+                    return
+                worker.rerun = False
+    except Exception:
+        logger.exception("deletion worker failed")
+        with _worker_lock:
+            _worker = None
+    finally:
+        connection.close()
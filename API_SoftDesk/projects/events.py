@@ -0,0 +1,226 @@
+# Python Libs
+import itertools
+import json
+import threading
+import time
+from collections import deque
+
+# Django Libs
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.utils.module_loading import import_string
+
+# Django REST Libs
+from rest_framework.renderers import BaseRenderer
+
+# Local Libs
+from .conf import softdesk_setting
+
+
+# Event telling the subscriber that events were dropped :
+# fetch the changes (projects.changes) since the last cursor
+RESYNC = {"kind": "stream", "action": "resync"}
+
+
+class Subscription():
+    """Bounded queue of the events of one subscriber
+
+    Backpressure : when the queue is full, the pending events are
+    dropped and replaced by a single RESYNC event. Events published
+    before the subscriber reads it are dropped too (covered by the
+    resync).
+    """
+    def __init__(self, project_id, size):
+        self.project_id = str(project_id)
+        self._size = size
+        self._events = deque()
+        self._condition = threading.Condition()
+        self._resync = False
+
+    def put(self, event):
+        """Queue an event (called by the backend)"""
+        with self._condition:
+            if self._resync:
+                return
+            if len(self._events) >= self._size:
+                self._events.clear()
+                self._events.append(RESYNC)
+                self._resync = True
+            else:
+                self._events.append(event)
+            self._condition.notify()
+
+    def get(self, timeout):
+        """Next event, None if none within timeout seconds"""
+        with self._condition:
+            if not self._events:
+                self._condition.wait(timeout)
+            if not self._events:
+                return None
+            event = self._events.popleft()
+            if event is RESYNC:
+                self._resync = False
+            return event
+
+
+class LocalBackend():
+    """In-process pub/sub backend
+
+    Deliver the events to the subscribers of this process only :
+    single process servers, tests. A multi-process deployment needs a backend
+    with the same methods on a shared broker.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscriptions = dict()
+
+    def subscribe(self, subscription):
+        with self._lock:
+            self._subscriptions.setdefault(
+                subscription.project_id, set()).add(subscription)
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            subscriptions = self._subscriptions.get(subscription.project_id)
+            if subscriptions is not None:
+                subscriptions.discard(subscription)
+                if not subscriptions:
+                    del self._subscriptions[subscription.project_id]
+
+    def publish(self, project_id, event):
+        with self._lock:
+            subscriptions = tuple(
+                self._subscriptions.get(str(project_id), ()))
+        for subscription in subscriptions:
+            subscription.put(event)
+
+    def subscribers(self, project_id):
+        """Number of subscribers of a project"""
+        with self._lock:
+            return len(self._subscriptions.get(str(project_id), ()))
+
+
+class EventBus():
+    """Activity events of the projects
+
+    Backend : instance of the EVENTS_BACKEND class (dotted path),
+    created on first use.
+    """
+    def __init__(self):
+        self._backend = None
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._streams = 0
+
+    @property
+    def backend(self):
+        if self._backend is None:
+            with self._lock:
+                if self._backend is None:
+                    self._backend = import_string(
+                        softdesk_setting("EVENTS_BACKEND"))()
+        return self._backend
+
+    def reset(self):
+        """Drop the backend and its subscribers"""
+        with self._lock:
+            self._backend = None
+
+    def publish(self, project_id, kind, action, id=None, data=None):
+        """
+        Publish an event once the current transaction is committed
+        (immediately out of a transaction).
+
+        Arguments:
+            - project_id
+            - kind   : project | issue | comment | contributor
+            - action : created | updated | deleted | bulk_created |
+                       bulk_changed
+            - id     : ID of the element
+            - data   : representation of the element
+        """
+        event = {"kind": kind,
+                 "action": action,
+                 "project_id": int(project_id),
+                 "id": id,
+                 "data": data}
+        transaction.on_commit(
+            lambda: self.backend.publish(
+                project_id, dict(event, event_id=next(self._ids))))
+
+    def subscribe(self, project_id):
+        """New subscription to the events of a project"""
+        subscription = Subscription(project_id,
+                                    softdesk_setting("EVENTS_QUEUE_SIZE"))
+        self.backend.subscribe(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        self.backend.unsubscribe(subscription)
+
+    def streams(self):
+        """Number of open streams of this process"""
+        with self._lock:
+            return self._streams
+
+    def stream(self, project_id):
+        """
+        Server-Sent Events of a project.
+
+        The subscription is created by the first iteration, and removed
+        when the stream ends or is closed : a response never sent keeps
+        no subscription.
+        A comment line is sent every EVENTS_HEARTBEAT seconds without
+        event : closed connections are detected and the subscription
+        is removed.
+        The stream ends after EVENTS_STREAM_TIMEOUT seconds (worker
+        released), EventSource clients reconnect.
+
+        Blocking generator : WSGI servers only, every open stream holds
+        a worker thread (see EVENTS_MAX_STREAMS).
+        """
+        heartbeat = softdesk_setting("EVENTS_HEARTBEAT")
+        end = time.monotonic() + softdesk_setting("EVENTS_STREAM_TIMEOUT")
+        with self._lock:
+            self._streams += 1
+        try:
+            subscription = self.subscribe(project_id)
+            try:
+                yield ": connected\n\n"
+                while time.monotonic() < end:
+                    event = subscription.get(
+                        min(heartbeat, max(end - time.monotonic(), 0)))
+                    if event is None:
+                        yield ": heartbeat\n\n"
+                    else:
+                        yield format_event(event)
+            finally:
+                self.unsubscribe(subscription)
+        finally:
+            with self._lock:
+                self._streams -= 1
+
+
+def format_event(event):
+    """Server-Sent Event message of an event"""
+    lines = []
+    if "event_id" in event:
+        lines.append(f"id: {event['event_id']}")
+    lines.append(f"event: {event['kind']}.{event['action']}")
+    lines.append("data: " + json.dumps(event, cls=DjangoJSONEncoder))
+    return "\n".join(lines) + "\n\n"
+
+
+class EventStreamRenderer(BaseRenderer):
+    """text/event-stream : error responses of the events stream"""
+    media_type = "text/event-stream"
+    format = "sse"
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        return format_event({"kind": "stream",
+                             "action": "error",
+                             "data": data}).encode()
+
+
+event_bus = EventBus()
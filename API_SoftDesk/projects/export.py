@@ -0,0 +1,64 @@
+# Python Libs
+import json
+
+# Local Libs
+from .conf import softdesk_setting
+from .models import (Contributor,
+                     Issue,
+                     Comment,)
+from .serializers import (ProjectSerializer,
+                          ContributorSerializer,
+                          IssueSerializer,
+                          CommentSerializer,)
+
+
+def _record(kind, data):
+    """One NDJSON line"""
+    return json.dumps({"type": kind, "data": data},
+                      ensure_ascii=False,
+                      separators=(",", ":")) + "\n"
+
+
+def _records(kind, serializer_class, queryset, chunk_size):
+    """Lines of a queryset, read by chunks"""
+    represent_row = serializer_class.representer()
+    rows = serializer_class.values(queryset).iterator(chunk_size=chunk_size)
+    for row in rows:
+        yield _record(kind, represent_row(row))
+
+
+def export_project(project, chunk_size=None):
+    """
+    Generate the NDJSON export of a project.
+
+    Lines (in order):
+        - project
+        - contributor (one per contributor)
+        - issue (one per issue)
+        - comment (one per comment, grouped by issue)
+
+    Rows are read with iterator(chunk_size), so memory stays flat
+    whatever the size of the project.
+    The queries run while the lines are consumed : WSGI responses and
+    the export_project command only, the ORM is sync-only under ASGI.
+    """
+    if chunk_size is None:
+        chunk_size = softdesk_setting("EXPORT_CHUNK_SIZE")
+    yield _record("project", ProjectSerializer(project).data)
+    yield from _records(
+        "contributor",
+        ContributorSerializer,
+        Contributor.objects.filter(project_id=project.id).order_by("id"),
+        chunk_size)
+    yield from _records(
+        "issue",
+        IssueSerializer,
+        Issue.objects.filter(project_id=project.id).order_by(
+            "created_time", "id"),
+        chunk_size)
+    yield from _records(
+        "comment",
+        CommentSerializer,
+        Comment.objects.filter(issue_id__project_id=project.id).order_by(
+            "issue_id", "created_time", "id"),
+        chunk_size)
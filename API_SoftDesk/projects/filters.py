@@ -0,0 +1,91 @@
+# Django Libs
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from django.utils import timezone
+
+# Django REST Libs
+from rest_framework.exceptions import ParseError
+from rest_framework.settings import api_settings
+
+# Local Libs
+from .models import (Issue,)
+
+
+class IssueFilter():
+    """Whitelisted filters and ordering of the issue list
+
+    Query parameters:
+        - status, priority, tag : value, or values separated by commas
+        - assignee_user_id, author_user_id : user ID(s)
+        - created_after  : created_time >= datetime (ISO 8601)
+        - created_before : created_time < datetime (ISO 8601)
+        - ordering : created_time | updated_time, "-" for descending
+
+    Every parameter is translated into a predicate on an issue column,
+    combined with AND. Indexes (project_id, <filter>, created_time, id)
+    back the common combinations (models.Issue).
+
+    Any other parameter than the filters, ordering, the pagination
+    ones and the format (URL_FORMAT_OVERRIDE) is refused.
+    """
+    # query parameter : (field, lookup)
+    filters = {
+        "status": ("status", "in"),
+        "priority": ("priority", "in"),
+        "tag": ("tag", "in"),
+        "assignee_user_id": ("assignee_user_id", "in"),
+        "author_user_id": ("author_user_id", "in"),
+        "created_after": ("created_time", "gte"),
+        "created_before": ("created_time", "lt"),
+    }
+    ordering_query_param = "ordering"
+    orderings = ("created_time", "updated_time")
+    # Parameters of the pagination (projects.pagination)
+    allowed = ("cursor", "page_size")
+
+    def __init__(self, request):
+        self.params = request.query_params
+
+    def predicate(self):
+        """Q of the filters of the request, raise ParseError"""
+        unknown = (set(self.params) - set(self.filters) -
+                   {self.ordering_query_param} - set(self.allowed) -
+                   {api_settings.URL_FORMAT_OVERRIDE})
+        if unknown:
+            raise ParseError(f"Unknown filter {sorted(unknown)[0]}.")
+        predicate = Q()
+        for param, (name, lookup) in self.filters.items():
+            if param in self.params:
+                try:
+                    value = self._value(name, lookup, self.params[param])
+                except (ValidationError, TypeError, ValueError):
+                    raise ParseError(f"Invalid filter {param}.")
+                if lookup == "in" and len(value) == 1:
+                    predicate &= Q(**{name: value[0]})
+                else:
+                    predicate &= Q(**{f"{name}__{lookup}": value})
+        return predicate
+
+    @staticmethod
+    def _value(name, lookup, raw):
+        """Database value(s) of a parameter, raise ValidationError"""
+        field = Issue._meta.get_field(name)
+        values = [field.to_python(value.strip())
+                  for value in (raw.split(",") if lookup == "in"
+                                else [raw])]
+        if any(value in (None, "") for value in values):
+            raise ValidationError("Empty value.")
+        if name == "created_time":
+            values = [timezone.make_aware(value)
+                      if timezone.is_naive(value) else value
+                      for value in values]
+        return values if lookup == "in" else values[0]
+
+    def ordering(self):
+        """Unique ordering of the keyset pagination, raise ParseError"""
+        ordering = self.params.get(self.ordering_query_param,
+                                   self.orderings[0])
+        if ordering.lstrip("-") not in self.orderings:
+            raise ParseError("Invalid ordering.")
+        # id in the same direction : one index scan, forward or backward
+        return (ordering, "-id" if ordering.startswith("-") else "id")
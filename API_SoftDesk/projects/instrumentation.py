@@ -0,0 +1,203 @@
+# Python Libs
+import asyncio
+import contextlib
+import contextvars
+import json
+import logging
+import random
+import time
+
+# Django Libs
+from django.conf import settings
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+# Local Libs
+from .conf import softdesk_setting
+
+
+logger = logging.getLogger("projects.instrumentation")
+
+# Timings of the instrumented request being handled (None otherwise)
+_current = contextvars.ContextVar("softdesk_timings", default=None)
+# View key of each (viewset class, action)
+_view_keys = dict()
+
+
+class RequestTimings():
+    """Measures of one request
+
+        - queries     : number of SQL queries
+        - db          : seconds spent in the database
+        - serialize   : seconds spent in serializers and rendering
+        - permissions : seconds spent in permission checks
+    """
+    def __init__(self):
+        self.queries = 0
+        self.db = 0.0
+        self.serialize = 0.0
+        self.permissions = 0.0
+
+
+def _record_query(execute, sql, params, many, context):
+    """Database execute wrapper, measures the instrumented requests"""
+    timings = _current.get()
+    if timings is None:
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        timings.db += time.perf_counter() - start
+        timings.queries += 1
+
+
+@receiver(connection_created)
+def _instrument_connection(sender, connection, **kwargs):
+    # Every connection of every thread : views run in sync_to_async
+    # threads under ASGI, the contextvar follows the request there
+    if _record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_record_query)
+
+
+@contextlib.contextmanager
+def timed(measure):
+    """Add the time spent in the block to a measure of the request"""
+    timings = _current.get()
+    if timings is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        setattr(timings, measure,
+                getattr(timings, measure) + time.perf_counter() - start)
+
+
+def view_key(view_func, method):
+    """
+    Log key of a view : "<class>.<action>".
+
+    The class is the first one of the MRO defining the action,
+    ProjectCRUD.list for ProjectView.list.
+    """
+    cls = getattr(view_func, "cls", None)
+    actions = getattr(view_func, "actions", None)
+    if cls is None:
+        return getattr(view_func, "__name__", "unknown")
+    action = (actions or dict()).get(method.lower(), method.lower())
+    key = _view_keys.get((cls, action))
+    if key is None:
+        owner = next((klass for klass in cls.__mro__
+                      if action in klass.__dict__), cls)
+        key = f"{owner.__name__}.{action}"
+        _view_keys[(cls, action)] = key
+    return key
+
+
+class InstrumentationMiddleware():
+    """Query count and timings of the requests
+
+    A sampled request (INSTRUMENTATION_SAMPLE_RATE, from 0 to 1) gets :
+        - a Server-Timing header, with settings.DEBUG or SERVER_TIMING
+          only (measures not shown to every client) :
+            db;dur=...;desc="N queries", serialize;dur=...,
+            permissions;dur=..., total;dur=...
+        - an INFO log line (JSON) on the projects.instrumentation logger,
+          keyed by the viewset action (ProjectCRUD.list, ...)
+
+    Other requests only cost one random draw.
+    Sync and async capable : no thread hop under ASGI.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if asyncio.iscoroutinefunction(get_response):
+            # Async mode, as django.utils.deprecation.MiddlewareMixin
+            self._is_coroutine = asyncio.coroutines._is_coroutine
+
+    def __call__(self, request):
+        if asyncio.iscoroutinefunction(self.get_response):
+            return self.__acall__(request)
+        timings = self._sample()
+        if timings is None:
+            return self.get_response(request)
+        token = _current.set(timings)
+        start = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        return self._report(request, response, timings, start)
+
+    async def __acall__(self, request):
+        timings = self._sample()
+        if timings is None:
+            return await self.get_response(request)
+        token = _current.set(timings)
+        start = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current.reset(token)
+        return self._report(request, response, timings, start)
+
+    @staticmethod
+    def _sample():
+        """Timings of the request, None if not sampled"""
+        rate = softdesk_setting("INSTRUMENTATION_SAMPLE_RATE")
+        if rate <= 0 or random.random() >= rate:
+            return None
+        return RequestTimings()
+
+    @staticmethod
+    def _report(request, response, timings, start):
+        """Server-Timing header and log line"""
+        total = time.perf_counter() - start
+        if settings.DEBUG or softdesk_setting("SERVER_TIMING"):
+            response["Server-Timing"] = (
+                f'db;dur={timings.db * 1000:.2f};'
+                f'desc="{timings.queries} queries", '
+                f'serialize;dur={timings.serialize * 1000:.2f}, '
+                f'permissions;dur={timings.permissions * 1000:.2f}, '
+                f'total;dur={total * 1000:.2f}')
+        resolver_match = getattr(request, "resolver_match", None)
+        logger.info(json.dumps({
+            "view": (view_key(resolver_match.func, request.method)
+                     if resolver_match is not None else None),
+            "method": request.method,
+            "path": request.path,
+            "status": response.status_code,
+            "queries": timings.queries,
+            "db_ms": round(timings.db * 1000, 2),
+            "serialize_ms": round(timings.serialize * 1000, 2),
+            "permissions_ms": round(timings.permissions * 1000, 2),
+            "total_ms": round(total * 1000, 2),
+        }))
+        return response
+
+    def process_template_response(self, request, response):
+        """Time the rendering of DRF responses"""
+        timings = _current.get()
+        if timings is not None:
+            start = time.perf_counter()
+
+            def rendered(response):
+                timings.serialize += time.perf_counter() - start
+            response.add_post_render_callback(rendered)
+        return response
+
+
+class TimedPermissionsMixin():
+    """ViewSet mixin adding permission checks to the request timings"""
+
+    def check_permissions(self, request):
+        with timed("permissions"):
+            super().check_permissions(request)
+
+    def check_object_permissions(self, request, obj):
+        with timed("permissions"):
+            super().check_object_permissions(request, obj)
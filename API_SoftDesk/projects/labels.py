@@ -0,0 +1,178 @@
+# Python Libs
+import threading
+
+# Django Libs
+from django import forms
+from django.apps import apps
+from django.core import validators
+from django.db import IntegrityError, models, transaction
+from django.db.models import Max
+
+
+# Labels of every database, with fixed codes (migration 0015)
+DEFAULT_LABELS = {
+    "status": {"to do": 1, "in progress": 2, "done": 3},
+    "priority": {"low": 1, "medium": 2, "high": 3},
+    "tag": {"bug": 1, "task": 2, "improvement": 3},
+}
+# Code of the names without label : matches no row
+UNKNOWN = 0
+
+
+class LabelCache():
+    """Codes and names of the issue labels (IssueLabel)
+
+    DEFAULT_LABELS are known without query. Other labels are read
+    from the table on first use ; a name never seen before gets the
+    next free code of its kind when an issue is saved with it (by
+    the code : the API refuses unknown names, see known()).
+
+    Labels read or created in a transaction are cached once it is
+    committed (on_commit) : a rolled back label never leaves its code
+    in the cache. Until then they are read from the table. Codes are
+    never reused.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.clear()
+
+    def clear(self):
+        with self._lock:
+            self._codes = {kind: dict(labels)
+                           for kind, labels in DEFAULT_LABELS.items()}
+            self._names = {kind: {code: name
+                                  for name, code in labels.items()}
+                           for kind, labels in DEFAULT_LABELS.items()}
+
+    def store(self, kind, labels):
+        """Cache (name, code) pairs"""
+        with self._lock:
+            for name, code in labels:
+                self._codes[kind][name] = code
+                self._names[kind][code] = name
+
+    def _remember(self, kind, labels):
+        """Cache (name, code) pairs once the transaction is committed"""
+        labels = list(labels)
+        transaction.on_commit(lambda: self.store(kind, labels))
+
+    def code(self, kind, name, create=False):
+        """
+        Code of a label name.
+
+        Missing label : created if create, else UNKNOWN.
+        """
+        code = self._codes[kind].get(name)
+        if code is not None:
+            return code
+        model = apps.get_model("projects", "IssueLabel")
+        code = model.objects.filter(kind=kind, name=name).values_list(
+            "code", flat=True).first()
+        if code is None:
+            if not create:
+                return UNKNOWN
+            code = self._create(model, kind, name)
+        self._remember(kind, [(name, code)])
+        return code
+
+    def _create(self, model, kind, name):
+        """New label, code after the last known one"""
+        while True:
+            last = model.objects.filter(kind=kind).aggregate(
+                last=Max("code"))["last"] or 0
+            with self._lock:
+                last = max([last] + list(self._names[kind]))
+            try:
+                with transaction.atomic():
+                    return model.objects.create(kind=kind, name=name,
+                                                code=last + 1).code
+            except IntegrityError:
+                # Created by another request : its code, or a new try
+                code = model.objects.filter(kind=kind, name=name).values_list(
+                    "code", flat=True).first()
+                if code is not None:
+                    return code
+
+    def known(self, kind, name):
+        """True if the name has a label : names accepted by the API"""
+        return self.code(kind, name) != UNKNOWN
+
+    def name(self, kind, code):
+        """Name of a label code (the labels of the kind are read once)"""
+        name = self._names[kind].get(code)
+        if name is not None:
+            return name
+        model = apps.get_model("projects", "IssueLabel")
+        labels = list(model.objects.filter(kind=kind).values_list(
+            "name", "code"))
+        self._remember(kind, labels)
+        return dict((code, name) for name, code in labels).get(code)
+
+
+labels = LabelCache()
+
+
+class LabelField(models.PositiveSmallIntegerField):
+    """Issue label stored as the small integer code of its name
+
+    Python values are the names (str) : forms, filters, serializers
+    and counters see the same strings as before the encoding. Any
+    other value is taken as a name (str(value)), never as a code.
+    Lookups on unknown names match nothing, saving an unknown name
+    creates its label (the API checks the names first : labels are
+    not created from request data).
+
+    Arguments:
+        - kind       : status | priority | tag
+        - max_length : length of the names
+    """
+    def __init__(self, kind=None, *args, max_length=None, **kwargs):
+        self.kind = kind
+        super().__init__(*args, **kwargs)
+        self.max_length = max_length
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        kwargs["kind"] = self.kind
+        kwargs["max_length"] = self.max_length
+        return name, path, args, kwargs
+
+    def check(self, **kwargs):
+        # max_length bounds the names, not the codes
+        return [error for error in super().check(**kwargs)
+                if error.id != "fields.W122"]
+
+    @property
+    def validators(self):
+        # Of the names : no range of the codes
+        return [*self.default_validators, *self._validators,
+                validators.MaxLengthValidator(self.max_length)]
+
+    def formfield(self, **kwargs):
+        return models.Field.formfield(self, **{
+            "form_class": forms.CharField,
+            "max_length": self.max_length,
+            **kwargs})
+
+    def from_db_value(self, value, expression, connection):
+        if value is None:
+            return value
+        return labels.name(self.kind, value)
+
+    def to_python(self, value):
+        if value is None:
+            return value
+        return str(value)
+
+    def get_prep_value(self, value):
+        # Lookups : the code of the name, UNKNOWN if it has no label
+        value = models.Field.get_prep_value(self, value)
+        if value is None:
+            return value
+        return labels.code(self.kind, str(value))
+
+    def get_db_prep_save(self, value, connection):
+        # Saves : the code of the name, new label if needed
+        if value is None:
+            return value
+        return labels.code(self.kind, str(value), create=True)
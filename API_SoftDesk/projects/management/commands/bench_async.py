@@ -0,0 +1,168 @@
+# Python Libs
+import asyncio
+import secrets
+import statistics
+import time
+from types import ModuleType
+
+# Django Libs
+from django.contrib.auth.models import User
+from django.core.handlers.asgi import ASGIHandler
+from django.core.management.base import BaseCommand
+from django.db.backends.signals import connection_created
+from django.test import override_settings
+from django.urls import include, path
+
+# Django REST Libs
+from rest_framework.routers import SimpleRouter
+
+# Local Libs
+from ...async_views import AsyncRouter
+from ...authentication import ClaimsTokenObtainPairSerializer
+from ...bulk import bulk_insert
+from ...models import Project, Contributor, Issue
+from ...urls import build_router
+
+
+class Command(BaseCommand):
+    """Compare the sync and async viewsets under ASGI
+
+    The ASGI application is driven in-process (no server, no socket)
+    by concurrent clients listing the issues of a generated project,
+    once with SimpleRouter (sync viewsets) and once with AsyncRouter.
+
+    --latency adds a sleep to every SQL query, as the round trip of a
+    networked database : sync views wait one after the other in the
+    thread sensitive thread, async views wait in the thread pool.
+
+    Rows are committed (pool threads use their own connections) and
+    deleted at the end of the run.
+
+    Usage:
+        python manage.py bench_async [--issues 20] [--requests 200]
+                                     [--concurrency 1 4 16] [--latency 5]
+    """
+    help = "Benchmark the sync and async viewsets on an in-process ASGI app."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--issues", type=int, default=20)
+        parser.add_argument("--requests", type=int, default=200)
+        parser.add_argument("--concurrency", type=int, nargs="+",
+                            default=[1, 4, 16])
+        parser.add_argument("--latency", type=float, default=5.0,
+                            help="simulated milliseconds per SQL query")
+
+    def handle(self, *args, **options):
+        user = User.objects.create_user(username="bench_async_"
+                                        + secrets.token_hex(4))
+        try:
+            project = Project.objects.create(title="bench",
+                                             description="bench",
+                                             type="bench",
+                                             author_user_id=user)
+            Contributor.objects.create(user_id=user,
+                                       project_id=project,
+                                       role="author",
+                                       permission="1")
+            bulk_insert(Issue,
+                        (Issue(title=f"issue {index}",
+                               desc="issue desc",
+                               tag="bench",
+                               priority="low",
+                               status="created",
+                               project_id=project,
+                               author_user_id=user,
+                               assignee_user_id=user)
+                         for index in range(options["issues"])),
+                        500)
+            token = str(ClaimsTokenObtainPairSerializer.get_token(
+                user).access_token)
+            latency = options["latency"] / 1000
+
+            def slow_query(execute, sql, params, many, context):
+                time.sleep(latency)
+                return execute(sql, params, many, context)
+
+            def add_latency(sender, connection, **kwargs):
+                if slow_query not in connection.execute_wrappers:
+                    connection.execute_wrappers.append(slow_query)
+
+            if latency:
+                connection_created.connect(add_latency)
+            try:
+                self.run(f"/projects/{project.id}/issues/", token,
+                         options["requests"], options["concurrency"])
+            finally:
+                connection_created.disconnect(add_latency)
+        finally:
+            # Cascade : project, contributor, issues
+            user.delete()
+
+    def run(self, url, token, requests, concurrency):
+        self.stdout.write(f"{'mode':>6} {'clients':>8} {'req/s':>9} "
+                          f"{'p50 ms':>9} {'p99 ms':>9}")
+        for mode, router_class in (("sync", SimpleRouter),
+                                   ("async", AsyncRouter)):
+            urlconf = ModuleType(f"bench_async_{mode}_urls")
+            urlconf.urlpatterns = [
+                path("projects/", include(build_router(router_class).urls))]
+            with override_settings(ROOT_URLCONF=urlconf):
+                app = ASGIHandler()
+                for clients in concurrency:
+                    rate, latencies = asyncio.run(
+                        self.load(app, url, token, requests, clients))
+                    latencies.sort()
+                    p99 = latencies[int(len(latencies) * 0.99) - 1]
+                    self.stdout.write(
+                        f"{mode:>6} {clients:>8} {rate:>9.1f} "
+                        f"{statistics.median(latencies) * 1000:>9.1f} "
+                        f"{p99 * 1000:>9.1f}")
+
+    async def load(self, app, url, token, requests, clients):
+        """(requests per second, latencies) of clients concurrent loops"""
+        remaining = [requests]
+        latencies = []
+
+        async def client():
+            while remaining[0] > 0:
+                remaining[0] -= 1
+                start = time.perf_counter()
+                status = await self.request(app, url, token)
+                latencies.append(time.perf_counter() - start)
+                if status != 200:
+                    raise RuntimeError(f"GET {url} : HTTP {status}")
+
+        start = time.perf_counter()
+        await asyncio.gather(*(client() for _ in range(clients)))
+        return requests / (time.perf_counter() - start), latencies
+
+    @staticmethod
+    async def request(app, url, token):
+        """Status of one GET through the ASGI application"""
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": url,
+            "raw_path": url.encode(),
+            "query_string": b"",
+            "root_path": "",
+            "headers": [(b"host", b"127.0.0.1"),
+                        (b"authorization", f"Bearer {token}".encode())],
+            "client": ("127.0.0.1", 0),
+            "server": ("127.0.0.1", 8000),
+        }
+        status = []
+
+        async def receive():
+            return {"type": "http.request", "body": b"",
+                    "more_body": False}
+
+        async def send(message):
+            if message["type"] == "http.response.start":
+                status.append(message["status"])
+
+        await app(scope, receive, send)
+        return status[0]
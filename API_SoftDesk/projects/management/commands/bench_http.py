@@ -0,0 +1,153 @@
+# Python Libs
+import json
+import secrets
+import subprocess
+from datetime import datetime, timezone
+
+# Django Libs
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+
+# Local Libs
+from ...benchmark import (FLOWS,
+                          compare,
+                          load_collection,
+                          run,)
+from ...seed import Seeder
+
+
+# --dataset : Seeder counts
+DATASETS = {
+    "small": {"users": 50, "projects": 10,
+              "issues": 2000, "comments": 10000},
+    "medium": {"users": 500, "projects": 50,
+               "issues": 50000, "comments": 250000},
+    "large": {"users": 1000, "projects": 100,
+              "issues": 1000000, "comments": 5000000},
+}
+
+
+class Command(BaseCommand):
+    """Replay the Postman collection flows against a running server
+
+    Flows (projects.benchmark) :
+        - story : the "Exemple user story" folder, new users each run
+        - read  : a seeded user browsing its projects
+        - write : a seeded user creating, updating, deleting a project,
+                  an issue and a comment
+
+    Seeded users are the <prefix>_<n> users of seed_softdesk, or of a
+    --dataset generated first in the database of these settings (the
+    one of the server). The run adds users and rows : use a benchmark
+    database.
+
+    Results (throughput, p50/p95/p99 latency by endpoint) are written
+    to --output as JSON, --compare prints the changes from a previous
+    result.
+
+    Usage:
+        python manage.py bench_http [--url http://127.0.0.1:8000]
+                                    [--flows read write story]
+                                    [--concurrency 4] [--iterations 200]
+                                    [--dataset small|medium|large]
+                                    [--output bench_http.json]
+                                    [--compare baseline.json]
+    """
+    help = "Benchmark a running server with the Postman collection flows."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--url", default="http://127.0.0.1:8000")
+        parser.add_argument("--collection",
+                            default=str(settings.BASE_DIR.parent /
+                                        "P10_API.postman_collection.json"))
+        parser.add_argument("--flows", nargs="+", choices=sorted(FLOWS),
+                            default=["read", "write", "story"])
+        parser.add_argument("--concurrency", type=int, default=4)
+        parser.add_argument("--iterations", type=int, default=200,
+                            help="Flow runs, all clients together.")
+        parser.add_argument("--dataset", choices=sorted(DATASETS),
+                            help="Seed a dataset of this size first.")
+        parser.add_argument("--prefix", default="seed",
+                            help="Prefix of the seeded usernames.")
+        parser.add_argument("--password", default="Motdepasse123",
+                            help="Password of the seeded users.")
+        parser.add_argument("--timeout", type=float, default=30)
+        parser.add_argument("--output", default="bench_http.json")
+        parser.add_argument("--compare",
+                            help="Previous result to compare with.")
+
+    def handle(self, *args, **options):
+        endpoints = load_collection(options["collection"])
+        run_id = secrets.token_hex(3)
+        prefix = options["prefix"]
+        if options["dataset"]:
+            prefix = f"bench{run_id}"
+            Seeder(seed=0, prefix=prefix, password=options["password"],
+                   log=self.stdout.write,
+                   **DATASETS[options["dataset"]]).run()
+        users = list(User.objects.filter(
+            username__startswith=f"{prefix}_").order_by("id").values_list(
+                "username", flat=True))
+        if not users and {"read", "write"} & set(options["flows"]):
+            raise CommandError(f"No {prefix}_* users : run seed_softdesk "
+                               "or pass --dataset.")
+        context = {"prefix": f"story{run_id}",
+                   "password": options["password"],
+                   "users": users}
+        started = datetime.now(timezone.utc)
+        summary = run(options["url"], endpoints, options["flows"], context,
+                      options["concurrency"], options["iterations"],
+                      options["timeout"])
+        result = {"meta": {"url": options["url"],
+                           "commit": self.commit(),
+                           "started": started.isoformat(),
+                           "duration": summary.pop("duration"),
+                           "flows": options["flows"],
+                           "concurrency": options["concurrency"],
+                           "iterations": options["iterations"],
+                           "dataset": options["dataset"],
+                           "users": len(users)}}
+        result.update(summary)
+        with open(options["output"], "w", encoding="utf-8") as output:
+            json.dump(result, output, indent=2)
+        self.report(result)
+        if options["compare"]:
+            with open(options["compare"], encoding="utf-8") as baseline:
+                self.report_changes(compare(json.load(baseline), result))
+
+    @staticmethod
+    def commit():
+        """Current git commit, None out of a repository"""
+        try:
+            return subprocess.run(
+                ["git", "rev-parse", "--short", "HEAD"],
+                cwd=settings.BASE_DIR, capture_output=True, text=True,
+                check=True).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
+
+    def report(self, result):
+        self.stdout.write(f"{'endpoint':<64} {'req':>6} {'err':>5} "
+                          f"{'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} "
+                          f"{'p99 ms':>8}")
+        rows = list(result["endpoints"].items())
+        rows.append(("total", result["total"]))
+        for label, stats in rows:
+            self.stdout.write(
+                f"{label:<64} {stats['requests']:>6} {stats['errors']:>5} "
+                f"{stats['throughput']:>8.1f} {stats['p50'] or 0:>8.1f} "
+                f"{stats['p95'] or 0:>8.1f} {stats['p99'] or 0:>8.1f}")
+        for name, flow in result["flows"].items():
+            self.stdout.write(f"flow {name}: {flow['runs']} runs, "
+                              f"{flow['errors']} failed")
+            if "error" in flow:
+                self.stdout.write(f"    last failure: {flow['error']}")
+
+    def report_changes(self, rows):
+        self.stdout.write(f"{'endpoint':<64} {'req/s %':>9} {'p95 %':>9}")
+        for label, throughput, p95 in rows:
+            self.stdout.write(
+                f"{label:<64} "
+                f"{'-' if throughput is None else f'{throughput:+.1f}':>9} "
+                f"{'-' if p95 is None else f'{p95:+.1f}':>9}")
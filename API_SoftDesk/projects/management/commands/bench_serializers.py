@@ -0,0 +1,90 @@
+# Python Libs
+import time
+
+# Django Libs
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+# Django REST Libs
+from rest_framework.renderers import JSONRenderer
+
+# Local Libs
+from ...bulk import bulk_insert
+from ...models import Project, Issue
+from ...serializers import IssueSerializer
+
+
+class Rollback(Exception):
+    """Discard the benchmark rows"""
+
+
+class Command(BaseCommand):
+    """Compare ModelSerializer and values() serialization of issues
+
+    Rows are created in a transaction rolled back at the end,
+    the database is left unchanged.
+
+    Usage:
+        python manage.py bench_serializers [--rows 10000] [--repeat 5]
+    """
+    help = "Benchmark the list serialization paths on generated issues."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=10000)
+        parser.add_argument("--repeat", type=int, default=5)
+
+    def handle(self, *args, **options):
+        try:
+            with transaction.atomic():
+                self.run(options["rows"], options["repeat"])
+                raise Rollback()
+        except Rollback:
+            pass
+
+    def run(self, rows, repeat):
+        user = User.objects.create(username="bench_serializers")
+        project = Project.objects.create(title="bench",
+                                         description="bench",
+                                         type="bench",
+                                         author_user_id=user)
+        bulk_insert(Issue,
+                    (Issue(title=f"issue {index}",
+                           desc="issue desc",
+                           tag="bench",
+                           priority="low",
+                           status="created",
+                           project_id=project,
+                           author_user_id=user,
+                           assignee_user_id=user)
+                     for index in range(rows)),
+                    batch_size=500)
+        queryset = Issue.objects.filter(project_id=project).order_by(
+            "created_time", "id")
+        renderer = JSONRenderer()
+
+        def model_serializer():
+            return IssueSerializer(list(queryset), many=True).data
+
+        def values_serializer():
+            return IssueSerializer.represent(
+                list(IssueSerializer.values(queryset)))
+
+        if (renderer.render(model_serializer()) !=
+                renderer.render(values_serializer())):
+            self.stderr.write("Outputs differ.")
+        timings = dict()
+        for name, path in (("ModelSerializer", model_serializer),
+                           ("values()", values_serializer)):
+            best = None
+            for _ in range(repeat):
+                start = time.perf_counter()
+                path()
+                elapsed = time.perf_counter() - start
+                best = elapsed if best is None else min(best, elapsed)
+            timings[name] = best
+            self.stdout.write(f"{name:<16} {rows} rows : "
+                              f"{best * 1000:.1f} ms (best of {repeat})")
+        self.stdout.write(
+            "Speedup : "
+            f"{timings['ModelSerializer'] / timings['values()']:.1f}x")
@@ -0,0 +1,39 @@
+# Django Libs
+from django.core.management.base import BaseCommand, CommandError
+
+# Local Libs
+from ...conf import softdesk_setting
+from ...export import export_project
+from ...models import Project
+
+
+class Command(BaseCommand):
+    """Export a project as NDJSON
+
+    Usage:
+        python manage.py export_project <project_id> [-o file]
+    """
+    help = "Export a project (contributors, issues, comments) as NDJSON."
+
+    def add_arguments(self, parser):
+        parser.add_argument("project_id", type=int)
+        parser.add_argument("-o", "--output",
+                            help="Output file (default: stdout).")
+        parser.add_argument("--chunk-size",
+                            type=int,
+                            default=softdesk_setting("EXPORT_CHUNK_SIZE"),
+                            help="Rows read per database round trip.")
+
+    def handle(self, *args, **options):
+        try:
+            project = Project.objects.get(id=options["project_id"])
+        except Project.DoesNotExist:
+            raise CommandError(
+                f"Project {options['project_id']} doesn't exist.")
+        lines = export_project(project, chunk_size=options["chunk_size"])
+        if options["output"]:
+            with open(options["output"], "w", encoding="utf-8") as output:
+                output.writelines(lines)
+        else:
+            for line in lines:
+                self.stdout.write(line, ending="")
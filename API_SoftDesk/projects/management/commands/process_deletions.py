@@ -0,0 +1,44 @@
+# Django Libs
+from django.core.management.base import BaseCommand
+
+# Local Libs
+from ...deletion import pending_deletions, process_deletions
+
+
+class Command(BaseCommand):
+    """Run the pending project deletions
+
+    Resume the deletions left by a crash or queued by the background
+    mode (PROJECT_DELETION), reporting each finished stage.
+
+    Usage:
+        python manage.py process_deletions [--batch-size 500] [--list]
+    """
+    help = "Delete the rows of the deleted projects, in batches."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=None,
+                            help="Rows by DELETE (default: "
+                                 "DELETION_BATCH_SIZE).")
+        parser.add_argument("--list", action="store_true",
+                            help="Only list the pending deletions.")
+
+    def handle(self, *args, **options):
+        if options["list"]:
+            for deletion in pending_deletions():
+                self.stdout.write(f"project {deletion.project_id} : "
+                                  f"{deletion.stage}, "
+                                  f"{deletion.deleted_rows} rows deleted")
+            return
+        stages = dict()
+
+        def progress(deletion):
+            # One line by stage reached
+            if stages.get(deletion.id) != deletion.stage:
+                stages[deletion.id] = deletion.stage
+                self.stdout.write(f"project {deletion.project_id} : "
+                                  f"{deletion.stage}, "
+                                  f"{deletion.deleted_rows} rows deleted")
+
+        count = process_deletions(options["batch_size"], progress)
+        self.stdout.write(f"Processed {count} deletion(s).")
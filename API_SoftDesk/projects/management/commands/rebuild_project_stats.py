@@ -0,0 +1,30 @@
+# Django Libs
+from django.core.management.base import BaseCommand
+
+# Local Libs
+from ...models import Project
+from ...stats import rebuild_project_stats
+
+
+class Command(BaseCommand):
+    """Recount the project counters from scratch
+
+    Usage:
+        python manage.py rebuild_project_stats [project_id ...]
+    """
+    help = "Rebuild the denormalized issue/comment counters of projects."
+
+    def add_arguments(self, parser):
+        parser.add_argument("project_ids", nargs="*", type=int,
+                            help="Projects to rebuild (default: all).")
+
+    def handle(self, *args, **options):
+        project_ids = options["project_ids"]
+        if not project_ids:
+            project_ids = Project.objects.order_by("id").values_list(
+                "id", flat=True).iterator()
+        rebuilt = 0
+        for project_id in project_ids:
+            rebuild_project_stats(project_id)
+            rebuilt += 1
+        self.stdout.write(f"Rebuilt counters of {rebuilt} project(s).")
@@ -0,0 +1,64 @@
+# Django Libs
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+
+# Local Libs
+from ...seed import Seeder
+
+
+class Command(BaseCommand):
+    """Generate a large, skewed dataset
+
+    Deterministic from --seed : a few huge projects, long comment
+    threads. Users are named <prefix>_<n> and share one password.
+
+    Usage:
+        python manage.py seed_softdesk [--users 1000] [--projects 100]
+                                       [--issues 100000]
+                                       [--comments 500000] [--seed 0]
+                                       [--prefix seed] [--no-index]
+    """
+    help = "Insert generated users, projects, issues and comments."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=1000)
+        parser.add_argument("--projects", type=int, default=100)
+        parser.add_argument("--issues", type=int, default=100000)
+        parser.add_argument("--comments", type=int, default=500000)
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--prefix", default="seed",
+                            help="Prefix of the usernames.")
+        parser.add_argument("--password", default="Motdepasse123",
+                            help="Password of every generated user.")
+        parser.add_argument("--skew", type=float, default=1.1,
+                            help="Zipf exponent of the project sizes.")
+        parser.add_argument("--batch-size", type=int, default=2000,
+                            help="Rows per INSERT.")
+        parser.add_argument("--chunk-size", type=int, default=20000,
+                            help="Issues per transaction.")
+        parser.add_argument("--no-index", action="store_true",
+                            help="Skip the full-text search index.")
+
+    def handle(self, *args, **options):
+        if User.objects.filter(
+                username__startswith=f"{options['prefix']}_").exists():
+            raise CommandError(f"Users {options['prefix']}_* exist, "
+                               "choose another --prefix.")
+        seeder = Seeder(users=options["users"],
+                        projects=options["projects"],
+                        issues=options["issues"],
+                        comments=options["comments"],
+                        seed=options["seed"],
+                        prefix=options["prefix"],
+                        password=options["password"],
+                        batch_size=options["batch_size"],
+                        chunk_size=options["chunk_size"],
+                        skew=options["skew"],
+                        index=not options["no_index"],
+                        log=self.stdout.write)
+        try:
+            inserted = seeder.run()
+        except ValueError as error:
+            raise CommandError(str(error))
+        for model, count in inserted.items():
+            self.stdout.write(f"{model}: {count}")
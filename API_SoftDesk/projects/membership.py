@@ -0,0 +1,76 @@
+# Python Libs
+import threading
+import time
+from collections import OrderedDict
+
+# Local Libs
+from .conf import softdesk_setting
+from .models import Contributor
+
+
+class MembershipCache():
+    """Projects each user contributes to
+
+    One entry per user : frozenset of project ids.
+
+    Eviction :
+        - least recently used user once MEMBERSHIP_CACHE_SIZE is reached
+        - entry expired after MEMBERSHIP_CACHE_TIMEOUT seconds
+
+    Invalidation :
+        Views changing a membership call invalidate(user_id).
+        The timeout bounds staleness between processes.
+    """
+    def __init__(self):
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        # Bumped on each invalidation, prevent storing a stale load
+        self._generation = 0
+
+    def projects(self, user_id):
+        """Ids of the projects the user contributes to"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(user_id)
+                return entry[1]
+            generation = self._generation
+        # Indexed lookup on contributor.user_id
+        project_ids = frozenset(Contributor.objects.filter(
+            user_id=user_id,
+            project_id__deleted_time__isnull=True).values_list(
+                "project_id", flat=True))
+        max_users = softdesk_setting("MEMBERSHIP_CACHE_SIZE")
+        timeout = softdesk_setting("MEMBERSHIP_CACHE_TIMEOUT")
+        with self._lock:
+            if generation == self._generation and max_users > 0:
+                self._entries[user_id] = (now + timeout, project_ids)
+                self._entries.move_to_end(user_id)
+                while len(self._entries) > max_users:
+                    self._entries.popitem(last=False)
+        return project_ids
+
+    def is_contributor(self, user_id, project_id):
+        """Check if user contributes to the project"""
+        try:
+            project_id = int(project_id)
+        except (TypeError, ValueError):
+            return False
+        return project_id in self.projects(user_id)
+
+    def invalidate(self, *user_ids):
+        """Forget the memberships of the users"""
+        with self._lock:
+            self._generation += 1
+            for user_id in user_ids:
+                self._entries.pop(user_id, None)
+
+    def clear(self):
+        """Forget all memberships"""
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+
+membership_cache = MembershipCache()
@@ -0,0 +1,23 @@
+# Generated by Django 3.2.3 on 2026-10-18 16:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0006_issue_status'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(fields=['issue_id', 'created_time', 'id'],
+                               name='comment_issue_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='issue',
+            index=models.Index(fields=['project_id', 'created_time', 'id'],
+                               name='issue_project_created_idx'),
+        ),
+    ]
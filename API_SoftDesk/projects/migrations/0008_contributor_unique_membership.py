@@ -0,0 +1,41 @@
+# Generated by Django 3.2.3 on 2026-10-18 16:11
+
+from django.db import migrations, models
+from django.db.models import Count, Min
+
+
+def remove_duplicate_memberships(apps, schema_editor):
+    """Keep the first contributor row of each (project, user)"""
+    Contributor = apps.get_model('projects', 'Contributor')
+    duplicates = (Contributor.objects
+                  .values('project_id', 'user_id')
+                  .annotate(first_id=Min('id'), rows=Count('id'))
+                  .filter(rows__gt=1))
+    for duplicate in duplicates:
+        Contributor.objects.filter(
+            project_id=duplicate['project_id'],
+            user_id=duplicate['user_id']).exclude(
+                id=duplicate['first_id']).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0007_issue_comment_keyset_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_duplicate_memberships,
+                             migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='contributor',
+            index=models.Index(fields=['user_id', 'project_id'],
+                               name='contributor_user_project_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='contributor',
+            constraint=models.UniqueConstraint(
+                fields=('project_id', 'user_id'),
+                name='contributor_project_user_uniq'),
+        ),
+    ]
@@ -0,0 +1,69 @@
+# Generated by Django 3.2.3 on 2026-10-18 16:19
+
+from django.db import migrations, models
+from django.db.models import Count
+import django.db.models.deletion
+
+
+def count_existing_projects(apps, schema_editor):
+    """Initial counters of the existing projects"""
+    Project = apps.get_model('projects', 'Project')
+    Issue = apps.get_model('projects', 'Issue')
+    Comment = apps.get_model('projects', 'Comment')
+    ProjectStats = apps.get_model('projects', 'ProjectStats')
+    for project_id in Project.objects.values_list('id', flat=True):
+        issues = Issue.objects.filter(project_id=project_id)
+        counters = [
+            ProjectStats(project_id_id=project_id, dimension='issues',
+                         value='', count=issues.count()),
+            ProjectStats(project_id_id=project_id, dimension='comments',
+                         value='', count=Comment.objects.filter(
+                             issue_id__project_id=project_id).count()),
+        ]
+        for dimension in ('status', 'priority', 'tag'):
+            rows = issues.order_by().values(dimension).annotate(
+                count=Count('id')).values_list(dimension, 'count')
+            counters += [ProjectStats(project_id_id=project_id,
+                                      dimension=dimension,
+                                      value=value, count=count)
+                         for value, count in rows]
+        ProjectStats.objects.bulk_create(counters)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0008_contributor_unique_membership'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProjectStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True,
+                                           primary_key=True,
+                                           serialize=False,
+                                           verbose_name='ID')),
+                ('dimension', models.CharField(
+                    choices=[('issues', 'issues'),
+                             ('status', 'status'),
+                             ('priority', 'priority'),
+                             ('tag', 'tag'),
+                             ('comments', 'comments')],
+                    max_length=15)),
+                ('value', models.CharField(blank=True, max_length=127)),
+                ('count', models.BigIntegerField(default=0)),
+                ('project_id', models.ForeignKey(
+                    on_delete=django.db.models.deletion.CASCADE,
+                    to='projects.project')),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='projectstats',
+            constraint=models.UniqueConstraint(
+                fields=('project_id', 'dimension', 'value'),
+                name='projectstats_counter_uniq'),
+        ),
+        migrations.RunPython(count_existing_projects,
+                             migrations.RunPython.noop),
+    ]
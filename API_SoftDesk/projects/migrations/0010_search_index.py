@@ -0,0 +1,43 @@
+from django.db import migrations
+from django.db.utils import OperationalError
+
+
+def create_search_index(apps, schema_editor):
+    """FTS5 index of issues and comments (SQLite only)"""
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    try:
+        schema_editor.execute(
+            "CREATE VIRTUAL TABLE projects_search USING fts5("
+            "kind UNINDEXED, project_id UNINDEXED, issue_id UNINDEXED, "
+            "title, body, tokenize = 'unicode61 remove_diacritics 2')")
+    except OperationalError:
+        # SQLite built without FTS5 : search falls back to icontains
+        return
+    schema_editor.execute(
+        "INSERT INTO projects_search "
+        "(rowid, kind, project_id, issue_id, title, body) "
+        "SELECT id * 2, 'issue', project_id_id, id, title, "
+        "COALESCE(\"desc\", '') FROM projects_issue")
+    schema_editor.execute(
+        "INSERT INTO projects_search "
+        "(rowid, kind, project_id, issue_id, title, body) "
+        "SELECT c.id * 2 + 1, 'comment', i.project_id_id, i.id, '', "
+        "c.description FROM projects_comment c "
+        "INNER JOIN projects_issue i ON i.id = c.issue_id_id")
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'sqlite':
+        schema_editor.execute("DROP TABLE IF EXISTS projects_search")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0009_projectstats'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 3.2.3 on 2026-10-18 16:35
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0010_search_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='project',
+            name='version',
+            field=models.BigIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='version_time',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+    ]
@@ -0,0 +1,83 @@
+# Generated by Django 3.2.3 on 2026-10-18 16:42
+
+from django.db import migrations, models
+from django.db.models import F
+import django.utils.timezone
+
+
+def updated_at_creation(apps, schema_editor):
+    """Existing issues and comments : unchanged since their creation"""
+    for model in ('Issue', 'Comment'):
+        apps.get_model('projects', model).objects.update(
+            updated_time=F('created_time'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0011_project_version'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Tombstone',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True,
+                                           primary_key=True,
+                                           serialize=False,
+                                           verbose_name='ID')),
+                ('project_id', models.BigIntegerField()),
+                ('kind', models.CharField(
+                    choices=[('project', 'project'),
+                             ('issue', 'issue'),
+                             ('comment', 'comment'),
+                             ('contributor', 'contributor')],
+                    max_length=15)),
+                ('object_id', models.BigIntegerField()),
+                ('deleted_time', models.DateTimeField(
+                    default=django.utils.timezone.now)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='comment',
+            name='updated_time',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name='contributor',
+            name='updated_time',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name='issue',
+            name='updated_time',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='updated_time',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.RunPython(updated_at_creation,
+                             migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(fields=['issue_id', 'updated_time', 'id'],
+                               name='comment_issue_updated_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contributor',
+            index=models.Index(fields=['project_id', 'updated_time', 'id'],
+                               name='contrib_project_updated_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='issue',
+            index=models.Index(fields=['project_id', 'updated_time', 'id'],
+                               name='issue_project_updated_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tombstone',
+            index=models.Index(fields=['project_id', 'deleted_time', 'id'],
+                               name='tombstone_project_deleted_idx'),
+        ),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 3.2.3 on 2026-10-18 16:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0012_delta_sync'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProjectDeletion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True,
+                                           primary_key=True,
+                                           serialize=False,
+                                           verbose_name='ID')),
+                ('project_id', models.BigIntegerField(unique=True)),
+                ('stage', models.CharField(
+                    choices=[('comments', 'comments'),
+                             ('issues', 'issues'),
+                             ('contributors', 'contributors'),
+                             ('stats', 'stats'),
+                             ('project', 'project'),
+                             ('done', 'done')],
+                    default='comments',
+                    max_length=15)),
+                ('deleted_rows', models.BigIntegerField(default=0)),
+                ('created_time', models.DateTimeField(auto_now_add=True)),
+                ('updated_time', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='deleted_time',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 3.2.3 on 2026-10-18 17:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0013_project_deletion'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='issue',
+            index=models.Index(
+                fields=['project_id', 'status', 'created_time', 'id'],
+                name='issue_project_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='issue',
+            index=models.Index(
+                fields=['project_id', 'priority', 'created_time', 'id'],
+                name='issue_project_priority_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='issue',
+            index=models.Index(
+                fields=['project_id', 'assignee_user_id', 'status',
+                        'created_time', 'id'],
+                name='issue_project_assignee_idx'),
+        ),
+    ]
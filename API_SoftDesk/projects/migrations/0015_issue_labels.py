@@ -0,0 +1,93 @@
+# Issue tag, priority and status stored as label codes (projects.labels)
+#
+# The conversion runs in three migrations :
+#     - 0015 : label table, code columns, nullable name columns
+#     - 0016 : codes filled in batches (can be run again)
+#     - 0017 : name columns dropped, code columns renamed (atomic)
+
+from django.db import migrations, models
+
+
+# Fixed codes of the default names (projects.labels.DEFAULT_LABELS)
+DEFAULT_LABELS = {
+    "status": {"to do": 1, "in progress": 2, "done": 3},
+    "priority": {"low": 1, "medium": 2, "high": 3},
+    "tag": {"bug": 1, "task": 2, "improvement": 3},
+}
+
+
+def create_default_labels(apps, schema_editor):
+    IssueLabel = apps.get_model("projects", "IssueLabel")
+    IssueLabel.objects.using(schema_editor.connection.alias).bulk_create(
+        [IssueLabel(kind=kind, code=code, name=name)
+         for kind, labels in DEFAULT_LABELS.items()
+         for name, code in labels.items()])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0014_issue_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IssueLabel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True,
+                                           primary_key=True,
+                                           serialize=False,
+                                           verbose_name='ID')),
+                ('kind', models.CharField(
+                    choices=[('status', 'status'),
+                             ('priority', 'priority'),
+                             ('tag', 'tag')],
+                    max_length=15)),
+                ('code', models.PositiveSmallIntegerField()),
+                ('name', models.CharField(max_length=127)),
+            ],
+            options={
+                'constraints': [
+                    models.UniqueConstraint(
+                        fields=('kind', 'code'),
+                        name='issuelabel_kind_code_uniq'),
+                    models.UniqueConstraint(
+                        fields=('kind', 'name'),
+                        name='issuelabel_kind_name_uniq'),
+                ],
+            },
+        ),
+        migrations.RunPython(create_default_labels,
+                             migrations.RunPython.noop),
+        migrations.AddField(
+            model_name='issue',
+            name='status_code',
+            field=models.PositiveSmallIntegerField(null=True),
+        ),
+        migrations.AddField(
+            model_name='issue',
+            name='priority_code',
+            field=models.PositiveSmallIntegerField(null=True),
+        ),
+        migrations.AddField(
+            model_name='issue',
+            name='tag_code',
+            field=models.PositiveSmallIntegerField(null=True),
+        ),
+        # Nullable names : filled back by 0016 when 0017 is unapplied
+        migrations.AlterField(
+            model_name='issue',
+            name='status',
+            field=models.CharField(max_length=50, null=True),
+        ),
+        migrations.AlterField(
+            model_name='issue',
+            name='priority',
+            field=models.CharField(max_length=63, null=True),
+        ),
+        migrations.AlterField(
+            model_name='issue',
+            name='tag',
+            field=models.CharField(max_length=127, null=True),
+        ),
+    ]
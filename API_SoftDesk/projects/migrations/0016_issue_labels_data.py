@@ -0,0 +1,106 @@
+# Label codes of the issues (projects.labels), data only
+#
+# The codes are filled in batches of issues, one transaction by batch
+# (atomic = False) : the issue table is never locked for the whole
+# conversion. Only the issues without codes are converted and the
+# labels are created once : after a failure, the migration is run
+# again and goes on from the last committed batch.
+
+from django.db import migrations, models, transaction
+from django.db.models import Max
+
+
+KINDS = ("status", "priority", "tag")
+BATCH_SIZE = 1000
+
+
+def _batches(apps, schema_editor, convert, todo):
+    """
+    Run convert(issues) on batches of the issues of todo(issues), by
+    id range, one transaction by batch. Then again on the issues
+    written during the conversion until there is none.
+    """
+    alias = schema_editor.connection.alias
+    Issue = apps.get_model("projects", "Issue")
+    issues = Issue.objects.using(alias).order_by()
+    last_id = 0
+    while True:
+        with transaction.atomic(using=alias):
+            ids = list(todo(issues).filter(id__gt=last_id).order_by(
+                "id").values_list("id", flat=True)[:BATCH_SIZE])
+            if not ids:
+                break
+            convert(issues.filter(id__gte=ids[0], id__lte=ids[-1]))
+        last_id = ids[-1]
+    while True:
+        with transaction.atomic(using=alias):
+            ids = list(todo(issues).values_list(
+                "id", flat=True)[:BATCH_SIZE])
+            if not ids:
+                break
+            convert(issues.filter(id__in=ids))
+
+
+def _missing(suffix):
+    """Issues with a null <kind><suffix> column"""
+    def todo(issues):
+        missing = models.Q()
+        for kind in KINDS:
+            missing |= models.Q(**{f"{kind}{suffix}__isnull": True})
+        return issues.filter(missing)
+    return todo
+
+
+def encode(apps, schema_editor):
+    """Fill the <kind>_code columns, labels of new names created"""
+    alias = schema_editor.connection.alias
+    IssueLabel = apps.get_model("projects", "IssueLabel")
+    labels = IssueLabel.objects.using(alias)
+    codes = {kind: dict(labels.filter(kind=kind).values_list(
+                 "name", "code"))
+             for kind in KINDS}
+
+    def convert(batch):
+        for kind in KINDS:
+            names = batch.values_list(kind, flat=True).distinct()
+            for name in list(names):
+                if name not in codes[kind]:
+                    last = labels.filter(kind=kind).aggregate(
+                        last=Max("code"))["last"] or 0
+                    labels.create(kind=kind, code=last + 1, name=name)
+                    codes[kind][name] = last + 1
+                batch.filter(**{kind: name}).update(
+                    **{f"{kind}_code": codes[kind][name]})
+
+    _batches(apps, schema_editor, convert, _missing("_code"))
+
+
+def decode(apps, schema_editor):
+    """Fill the name columns back from the codes"""
+    IssueLabel = apps.get_model("projects", "IssueLabel")
+    labels = IssueLabel.objects.using(schema_editor.connection.alias)
+    names = {kind: dict(labels.filter(kind=kind).values_list(
+                 "code", "name"))
+             for kind in KINDS}
+
+    def convert(batch):
+        for kind in KINDS:
+            codes = batch.values_list(f"{kind}_code", flat=True).distinct()
+            for code in list(codes):
+                batch.filter(**{f"{kind}_code": code}).update(
+                    **{kind: names[kind].get(code, "")})
+
+    _batches(apps, schema_editor, convert, _missing(""))
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('projects', '0015_issue_labels'),
+    ]
+
+    operations = [
+        migrations.RunPython(encode, decode),
+    ]
@@ -0,0 +1,89 @@
+# Issue labels : the code columns replace the name columns (atomic)
+
+from django.db import migrations, models
+import projects.labels
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0016_issue_labels_data'),
+    ]
+
+    operations = [
+        # Indexes on the name columns, created again on the codes
+        migrations.RemoveIndex(
+            model_name='issue',
+            name='issue_project_status_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='issue',
+            name='issue_project_priority_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='issue',
+            name='issue_project_assignee_idx',
+        ),
+        migrations.RemoveField(
+            model_name='issue',
+            name='status',
+        ),
+        migrations.RemoveField(
+            model_name='issue',
+            name='priority',
+        ),
+        migrations.RemoveField(
+            model_name='issue',
+            name='tag',
+        ),
+        migrations.RenameField(
+            model_name='issue',
+            old_name='status_code',
+            new_name='status',
+        ),
+        migrations.RenameField(
+            model_name='issue',
+            old_name='priority_code',
+            new_name='priority',
+        ),
+        migrations.RenameField(
+            model_name='issue',
+            old_name='tag_code',
+            new_name='tag',
+        ),
+        migrations.AlterField(
+            model_name='issue',
+            name='status',
+            field=projects.labels.LabelField(kind='status', max_length=50),
+        ),
+        migrations.AlterField(
+            model_name='issue',
+            name='priority',
+            field=projects.labels.LabelField(kind='priority',
+                                             max_length=63),
+        ),
+        migrations.AlterField(
+            model_name='issue',
+            name='tag',
+            field=projects.labels.LabelField(kind='tag', max_length=127),
+        ),
+        migrations.AddIndex(
+            model_name='issue',
+            index=models.Index(
+                fields=['project_id', 'status', 'created_time', 'id'],
+                name='issue_project_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='issue',
+            index=models.Index(
+                fields=['project_id', 'priority', 'created_time', 'id'],
+                name='issue_project_priority_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='issue',
+            index=models.Index(
+                fields=['project_id', 'assignee_user_id', 'status',
+                        'created_time', 'id'],
+                name='issue_project_assignee_idx'),
+        ),
+    ]
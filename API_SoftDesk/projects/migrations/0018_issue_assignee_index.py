@@ -0,0 +1,19 @@
+# Generated by Django 3.2.3 on 2026-10-18 17:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0017_issue_labels_schema'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='issue',
+            index=models.Index(
+                fields=['assignee_user_id', 'created_time', 'id'],
+                name='issue_assignee_created_idx'),
+        ),
+    ]
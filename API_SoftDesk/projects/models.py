@@ -2,6 +2,20 @@
 from django.db import models
 from django.contrib.auth.models import User
 from django.db.models.deletion import CASCADE
+from django.utils import timezone
+
+# Local Libs
+from .labels import (LabelField,)
+
+
+class ProjectManager(models.Manager):
+    """Projects not deleted
+
+    Projects being deleted (projects.deletion) are hidden from every
+    endpoint, Project.all_objects includes them.
+    """
+    def get_queryset(self):
+        return super().get_queryset().filter(deleted_time__isnull=True)
 
 
 class Project(models.Model):
@@ -12,6 +26,11 @@ class Project(models.Model):
         - description
         - type
         - author_user_id
+        - version      : bumped on any write to the project, its issues,
+                         comments or contributors (HTTP validators)
+        - version_time : time of the last bump
+        - updated_time : automaticaly generated (delta sync)
+        - deleted_time : deletion requested, rows being deleted
     """
     title = models.CharField(
         max_length=511,
@@ -30,6 +49,24 @@ class Project(models.Model):
         on_delete=CASCADE,
         null=False,
         blank=False)
+    version = models.BigIntegerField(
+        default=0,
+        null=False,
+        blank=False)
+    version_time = models.DateTimeField(
+        default=timezone.now,
+        null=False,
+        blank=False)
+    updated_time = models.DateTimeField(
+        auto_now=True,
+        null=False,
+        blank=False)
+    deleted_time = models.DateTimeField(
+        null=True,
+        blank=True)
+
+    objects = ProjectManager()
+    all_objects = models.Manager()
 
 
 class Issue(models.Model):
@@ -45,6 +82,10 @@ class Issue(models.Model):
         - author_user_id
         - assignee_user_id
         - created_time : automaticaly generated
+        - updated_time : automaticaly generated (delta sync)
+
+    tag, priority and status are stored as the codes of their names
+    (IssueLabel, projects.labels) and read as the names.
     """
     title = models.CharField(
         max_length=511,
@@ -54,11 +95,13 @@ class Issue(models.Model):
         max_length=4095,
         null=True,
         blank=True)
-    tag = models.CharField(
+    tag = LabelField(
+        "tag",
         max_length=127,
         null=False,
         blank=False)
-    priority = models.CharField(
+    priority = LabelField(
+        "priority",
         max_length=63,
         null=False,
         blank=False)
@@ -68,7 +111,8 @@ class Issue(models.Model):
         null=False,
         blank=False
     )
-    status = models.CharField(
+    status = LabelField(
+        "status",
         max_length=50,
         null=False,
         blank=False
@@ -88,6 +132,70 @@ class Issue(models.Model):
         auto_now_add=True,
         null=False,
         blank=False)
+    updated_time = models.DateTimeField(
+        auto_now=True,
+        null=False,
+        blank=False)
+
+    class Meta():
+        indexes = [
+            # Keyset pagination of the project's issues
+            models.Index(fields=["project_id", "created_time", "id"],
+                         name="issue_project_created_idx"),
+            # Changes of the project's issues (delta sync)
+            models.Index(fields=["project_id", "updated_time", "id"],
+                         name="issue_project_updated_idx"),
+            # Filtered issue lists (projects.filters), by created_time
+            models.Index(fields=["project_id", "status",
+                                 "created_time", "id"],
+                         name="issue_project_status_idx"),
+            models.Index(fields=["project_id", "priority",
+                                 "created_time", "id"],
+                         name="issue_project_priority_idx"),
+            models.Index(fields=["project_id", "assignee_user_id",
+                                 "status", "created_time", "id"],
+                         name="issue_project_assignee_idx"),
+            # Issues assigned to a user, across projects
+            models.Index(fields=["assignee_user_id", "created_time", "id"],
+                         name="issue_assignee_created_idx"),
+        ]
+
+
+class IssueLabel(models.Model):
+    """Issue labels model
+
+    Code of each tag, priority and status name (projects.labels).
+    Codes of the default names are fixed, the others are given in
+    order of first use.
+
+    Fields:
+        - kind : status | priority | tag
+        - code
+        - name
+    """
+    KINDS = [("status", "status"),
+             ("priority", "priority"),
+             ("tag", "tag")]
+    kind = models.CharField(
+        max_length=15,
+        choices=KINDS,
+        null=False,
+        blank=False)
+    code = models.PositiveSmallIntegerField(
+        null=False,
+        blank=False)
+    name = models.CharField(
+        max_length=127,
+        null=False,
+        blank=False)
+
+    class Meta():
+        constraints = [
+            models.UniqueConstraint(fields=["kind", "code"],
+                                    name="issuelabel_kind_code_uniq"),
+            models.UniqueConstraint(fields=["kind", "name"],
+                                    name="issuelabel_kind_name_uniq"),
+        ]
 
 
 class Comment(models.Model):
@@ -98,6 +206,7 @@ class Comment(models.Model):
         - author_user_id
         - issue_id
         - created_time : automaticaly generated
+        - updated_time : automaticaly generated (delta sync)
     """
     description = models.CharField(
         max_length=4095,
@@ -117,6 +226,20 @@ class Comment(models.Model):
         auto_now_add=True,
         null=False,
         blank=False)
+    updated_time = models.DateTimeField(
+        auto_now=True,
+        null=False,
+        blank=False)
+
+    class Meta():
+        indexes = [
+            # Keyset pagination of the issue's comments
+            models.Index(fields=["issue_id", "created_time", "id"],
+                         name="comment_issue_created_idx"),
+            # Changes of the issue's comments (delta sync)
+            models.Index(fields=["issue_id", "updated_time", "id"],
+                         name="comment_issue_updated_idx"),
+        ]
 
 
 class Contributor(models.Model):
@@ -127,6 +250,7 @@ class Contributor(models.Model):
         - project_id
         - permission
         - role
+        - updated_time : automaticaly generated (delta sync)
     """
     user_id = models.ForeignKey(
         User,
@@ -149,3 +273,153 @@ class Contributor(models.Model):
         max_length=255,
         null=False,
         blank=False)
+    updated_time = models.DateTimeField(
+        auto_now=True,
+        null=False,
+        blank=False)
+
+    class Meta():
+        constraints = [
+            # One membership per user and project,
+            # also the index of the (project_id, user_id) lookups
+            models.UniqueConstraint(fields=["project_id", "user_id"],
+                                    name="contributor_project_user_uniq"),
+        ]
+        indexes = [
+            # Projects of a user (membership cache, projects list)
+            models.Index(fields=["user_id", "project_id"],
+                         name="contributor_user_project_idx"),
+            # Changes of the project's contributors (delta sync)
+            models.Index(fields=["project_id", "updated_time", "id"],
+                         name="contrib_project_updated_idx"),
+        ]
+
+
+class ProjectStats(models.Model):
+    """Project counters model
+
+    Denormalized counters, maintained by the issue and comment views.
+
+    Fields:
+        - project_id
+        - dimension : issues | status | priority | tag | comments
+        - value     : counted value ("" for issues and comments)
+        - count
+    """
+    DIMENSIONS = [("issues", "issues"),
+                  ("status", "status"),
+                  ("priority", "priority"),
+                  ("tag", "tag"),
+                  ("comments", "comments")]
+    project_id = models.ForeignKey(
+        Project,
+        on_delete=CASCADE,
+        null=False,
+        blank=False)
+    dimension = models.CharField(
+        max_length=15,
+        choices=DIMENSIONS,
+        null=False,
+        blank=False)
+    value = models.CharField(
+        max_length=127,
+        null=False,
+        blank=True)
+    count = models.BigIntegerField(
+        default=0,
+        null=False,
+        blank=False)
+
+    class Meta():
+        constraints = [
+            models.UniqueConstraint(
+                fields=["project_id", "dimension", "value"],
+                name="projectstats_counter_uniq"),
+        ]
+
+
+class Tombstone(models.Model):
+    """Deleted elements model (delta sync)
+
+    Not linked to the project by a foreign key : the tombstone of a
+    project outlives it.
+
+    Fields:
+        - project_id
+        - kind         : project | issue | comment | contributor
+        - object_id    : ID of the deleted element
+                         (user ID for a contributor)
+        - deleted_time : automaticaly generated
+
+    The comments of a deleted issue have no tombstone of their own.
+    """
+    KINDS = [("project", "project"),
+             ("issue", "issue"),
+             ("comment", "comment"),
+             ("contributor", "contributor")]
+    project_id = models.BigIntegerField(
+        null=False,
+        blank=False)
+    kind = models.CharField(
+        max_length=15,
+        choices=KINDS,
+        null=False,
+        blank=False)
+    object_id = models.BigIntegerField(
+        null=False,
+        blank=False)
+    deleted_time = models.DateTimeField(
+        default=timezone.now,
+        null=False,
+        blank=False)
+
+    class Meta():
+        indexes = [
+            # Deletions of a project since a cursor
+            models.Index(fields=["project_id", "deleted_time", "id"],
+                         name="tombstone_project_deleted_idx"),
+        ]
+
+
+class ProjectDeletion(models.Model):
+    """Project deletions model
+
+    Cascade of a deleted project, run in batches (projects.deletion).
+
+    Fields:
+        - project_id   : not a foreign key, the project row is deleted
+                         last
+        - stage        : comments | issues | contributors | stats |
+                         project | done
+        - deleted_rows : rows deleted so far
+        - created_time : automaticaly generated
+        - updated_time : automaticaly generated
+    """
+    STAGES = [("comments", "comments"),
+              ("issues", "issues"),
+              ("contributors", "contributors"),
+              ("stats", "stats"),
+              ("project", "project"),
+              ("done", "done")]
+    project_id = models.BigIntegerField(
+        unique=True,
+        null=False,
+        blank=False)
+    stage = models.CharField(
+        max_length=15,
+        choices=STAGES,
+        default="comments",
+        null=False,
+        blank=False)
+    deleted_rows = models.BigIntegerField(
+        default=0,
+        null=False,
+        blank=False)
+    created_time = models.DateTimeField(
+        auto_now_add=True,
+        null=False,
+        blank=False)
+    updated_time = models.DateTimeField(
+        auto_now=True,
+        null=False,
+        blank=False)
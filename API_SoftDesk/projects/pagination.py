@@ -0,0 +1,200 @@
+# Python Libs
+import base64
+import binascii
+import json
+
+# Django Libs
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+
+# Django REST Libs
+from rest_framework.exceptions import ParseError
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+# Local Libs
+from .conf import softdesk_setting
+
+
+class KeysetPagination(BasePagination):
+    """Cursor (keyset) pagination
+
+    Rows are ordered by a unique ordering, (created_time, id) by default.
+    The cursor holds the ordering values of the last row of the page,
+    so the next page is read with an indexed range predicate instead
+    of an OFFSET : deep pages cost the same as the first one.
+
+    Query parameters:
+        - cursor    : opaque cursor given by "next"
+        - page_size : number of elements (capped by MAX_PAGE_SIZE)
+
+    Response:
+        - next    : url of the next page (None on the last page)
+        - results : elements of the page
+    """
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+
+    def __init__(self, ordering=("created_time", "id")):
+        self.ordering = tuple(ordering)
+        self.next_position = None
+        self.request = None
+
+    def get_page_size(self, request):
+        """Requested page size, capped by MAX_PAGE_SIZE"""
+        page_size = softdesk_setting("PAGE_SIZE")
+        if self.page_size_query_param in request.query_params:
+            try:
+                page_size = int(
+                    request.query_params[self.page_size_query_param])
+            except ValueError:
+                raise ParseError("Invalid page size.")
+            if page_size < 1:
+                raise ParseError("Invalid page size.")
+        return min(page_size, softdesk_setting("MAX_PAGE_SIZE"))
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """Page of the queryset starting after the cursor"""
+        self.request = request
+        page_size = self.get_page_size(request)
+        queryset = queryset.order_by(*self.ordering)
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded:
+            position = self.decode_cursor(encoded, queryset.model)
+            queryset = queryset.filter(self.after(position))
+        page = list(queryset[:page_size + 1])
+        if len(page) > page_size:
+            page = page[:page_size]
+            self.next_position = [self._value(page[-1], field)
+                                  for field in self.ordering]
+        else:
+            self.next_position = None
+        return page
+
+    def after(self, position):
+        """
+        Keyset predicate : rows strictly after position.
+
+        (a, b) > (va, vb) is written
+            a >= va AND (a > va OR (a = va AND b > vb))
+        so the leading column is a range scan of the index.
+        """
+        strict = Q()
+        for index, field in enumerate(self.ordering):
+            condition = Q(**{self._lookup(field, "gt"): position[index]})
+            for previous, value in zip(self.ordering[:index],
+                                       position[:index]):
+                condition &= Q(**{previous.lstrip("-"): value})
+            strict |= condition
+        leading = Q(**{self._lookup(self.ordering[0], "gte"): position[0]})
+        return leading & strict
+
+    def get_next_link(self):
+        """Absolute url of the next page"""
+        if self.next_position is None:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url,
+                                   self.cursor_query_param,
+                                   self.encode_cursor(self.next_position))
+
+    def get_paginated_data(self, data):
+        """Envelope of a page"""
+        return {"next": self.get_next_link(),
+                "results": data}
+
+    def get_paginated_response(self, data):
+        return Response(data=self.get_paginated_data(data))
+
+    def encode_cursor(self, position):
+        """Opaque cursor from ordering values"""
+        # isoformat keeps the microseconds compared by the keyset
+        raw = json.dumps(position, default=lambda value: value.isoformat())
+        return base64.urlsafe_b64encode(raw.encode()).decode()
+
+    def decode_cursor(self, encoded, model):
+        """Ordering values from an opaque cursor"""
+        try:
+            position = json.loads(base64.urlsafe_b64decode(
+                encoded.encode()).decode())
+            if (not isinstance(position, list) or
+                    len(position) != len(self.ordering)):
+                raise ValueError
+            return [
+                model._meta.get_field(field.lstrip("-")).to_python(value)
+                for field, value in zip(self.ordering, position)]
+        except (ValueError, TypeError, binascii.Error,
+                UnicodeDecodeError, ValidationError):
+            raise ParseError("Invalid cursor.")
+
+    @staticmethod
+    def _lookup(field, lookup):
+        """Comparison lookup following the field direction"""
+        if field.startswith("-"):
+            return field[1:] + ("__lt" if lookup == "gt" else "__lte")
+        return f"{field}__{lookup}"
+
+    @staticmethod
+    def _value(row, field):
+        """Ordering value of a row (model instance or values() dict)"""
+        name = field.lstrip("-")
+        if isinstance(row, dict):
+            return row[name]
+        return getattr(row, row._meta.get_field(name).attname)
+
+
+class RankedPagination(KeysetPagination):
+    """Page number pagination of ranked results
+
+    Ranked results (search) have no stable keyset : pages are read
+    with LIMIT / OFFSET, the depth is capped by SEARCH_MAX_PAGE.
+
+    Query parameters:
+        - page      : page number, from 1
+        - page_size : number of elements (capped by MAX_PAGE_SIZE)
+
+    Response:
+        - next    : url of the next page (None on the last page)
+        - results : elements of the page
+    """
+    page_query_param = "page"
+
+    def __init__(self):
+        super().__init__()
+        self.next_page = None
+
+    def get_page_number(self, request):
+        """Requested page number, capped by SEARCH_MAX_PAGE"""
+        try:
+            page = int(request.query_params.get(self.page_query_param, 1))
+        except ValueError:
+            raise ParseError("Invalid page.")
+        if not 1 <= page <= softdesk_setting("SEARCH_MAX_PAGE"):
+            raise ParseError("Invalid page.")
+        return page
+
+    def paginate_results(self, fetch, request):
+        """
+        Page of results given by fetch(offset, limit),
+        one more result is fetched to know if a next page exists.
+        """
+        self.request = request
+        page_size = self.get_page_size(request)
+        page_number = self.get_page_number(request)
+        page = fetch((page_number - 1) * page_size, page_size + 1)
+        if (len(page) > page_size and
+                page_number < softdesk_setting("SEARCH_MAX_PAGE")):
+            self.next_page = page_number + 1
+        else:
+            self.next_page = None
+        return page[:page_size]
+
+    def get_next_link(self):
+        """Absolute url of the next page"""
+        if self.next_page is None:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url,
+                                   self.page_query_param,
+                                   self.next_page)
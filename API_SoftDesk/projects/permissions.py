@@ -1,7 +1,8 @@
 # Django REST Libs
 from rest_framework import permissions
 # Local Libs
-from .models import Contributor, Project
+from .membership import membership_cache
+from .scope import get_project_scope
 
 
 class ProjectPermissions(permissions.BasePermission):
@@ -11,11 +12,21 @@ class ProjectPermissions(permissions.BasePermission):
             - list
             - create
             - retrieve
+            - export
+            - stats
+            - search
+            - changes
+            - events
+            - cache (superuser)
             - update
             - destroy
 
         Object manipulation permissions :
             - retrieve
+            - export
+            - stats
+            - changes
+            - events
             - update
             - destroy
     """
@@ -24,8 +35,14 @@ class ProjectPermissions(permissions.BasePermission):
         User should list, create, retrieve, update and destroy
         there own elements if user_connected.
         """
-        if view.action in ["list", "create", "retrieve", "update", "destroy"]:
+        if view.action in ["list", "create", "retrieve", "export",
+                           "stats", "search", "changes", "events",
+                           "update", "destroy"]:
             return request.user.is_authenticated
+        elif view.action == "cache":
+            # Monitoring of the server
+            return (request.user.is_authenticated and
+                    request.user.is_superuser)
         else:
             return False
 
@@ -33,27 +50,21 @@ class ProjectPermissions(permissions.BasePermission):
         """
         Object manipulation.
 
-        Can retrieve object only if user is contributor
+        Can retrieve/export/stats/changes/events object only if user is
+        contributor
         Can update/destroy object only if user if author
         """
         if not request.user.is_authenticated:
             # No permission if not user_connected
             return False
         # -> user_connected
-        if view.action == 'retrieve':
+        if view.action in ["retrieve", "export", "stats", "changes",
+                           "events"]:
             # User can retrieve element if user_is_contributor
-            contributors = Contributor.objects.values()
-            project = Project.objects.filter(id=obj.id)
-            project_contributors = contributors.filter(
-                project_id_id__in=project.values_list(
-                    "id")).values_list("user_id")
-            for contrib in list(project_contributors):
-                if request.user.id in contrib:
-                    return True
-            return False
+            return membership_cache.is_contributor(request.user.id, obj.id)
         elif view.action in ["update", "destroy"]:
             # User can update and destroy element if user_created_it
-            return obj.author_user_id == request.user
+            return obj.author_user_id_id == request.user.id
         else:
             return False
 
@@ -64,6 +75,7 @@ class ContributorPermissions(permissions.BasePermission):
         User permissions :
             - list
             - create
+            - bulk
             - destroy
 
         Object manipulation permissions :
@@ -79,7 +91,7 @@ class ContributorPermissions(permissions.BasePermission):
         if view.action == 'list':
             # User should see all elements if user_connected
             return request.user.is_authenticated
-        elif view.action in ["create", "destroy"]:
+        elif view.action in ["create", "bulk", "destroy"]:
             # author should create there own contributors
             return request.user.is_authenticated
         else:
@@ -97,9 +109,9 @@ class ContributorPermissions(permissions.BasePermission):
         # user_connected
         elif view.action == "destroy":
             # User can destroy element is user_created_it
-            project = Project.objects.get(id=obj.project_id.id)
-            return project in Project.objects.filter(
-                                            author_user_id=request.user.id)
+            project = get_project_scope(request, obj.project_id_id).project
+            return (project is not None and
+                    project.author_user_id_id == request.user.id)
         else:
             return False
 
@@ -109,7 +121,9 @@ class IssuePermissions(permissions.BasePermission):
 
         User permissions :
             - list
+            - assigned
             - create
+            - bulk
             - update
             - destroy
 
@@ -122,10 +136,10 @@ class IssuePermissions(permissions.BasePermission):
         User should list, create, retrieve, update and destroy
         there own elements if user_connected.
         """
-        if view.action == 'list':
+        if view.action in ['list', 'assigned']:
             # User should see all elements if user_connected
             return request.user.is_authenticated
-        elif view.action in ["create", "update", "destroy"]:
+        elif view.action in ["create", "bulk", "update", "destroy"]:
             # User should retrieve, update and destroy there own elements
             # if user_connected
             return request.user.is_authenticated
@@ -144,8 +158,7 @@ class IssuePermissions(permissions.BasePermission):
             return False
         elif view.action in ["update", "destroy"]:
             # User can update, destroy element if user_created_it
-            project = Project.objects.get(id=obj.project_id.id)
-            return obj.author_user_id == request.user
+            return obj.author_user_id_id == request.user.id
         else:
             return False
 
@@ -193,17 +206,29 @@ class CommentPermissions(permissions.BasePermission):
         # -> user_connected
         if view.action == 'retrieve':
             # User can get element if user_is_contributor
-            contributors = Contributor.objects.values()
-            project = Project.objects.filter(id=obj.id)
-            project_contributors = contributors.filter(
-                project_id_id__in=project.values_list(
-                    "id")).values_list("user_id")
-            for contrib in list(project_contributors):
-                if request.user.id in contrib:
-                    return True
-            return False
+            return get_project_scope(request,
+                                     view.kwargs["id"],
+                                     view.kwargs["issue_id"]).is_contributor
         elif view.action in ["update", "destroy"]:
             # User can update element is user_created_it
-            return obj.author_user_id == request.user
+            return obj.author_user_id_id == request.user.id
+        else:
+            return False
+
+
+class BatchPermissions(permissions.BasePermission):
+    """Batch permissions
+
+        User permissions :
+            - create
+
+    The sub-requests are checked by the permissions of their views.
+    """
+    def has_permission(self, request, view):
+        """
+        User should send a batch if user_connected.
+        """
+        if view.action == 'create':
+            return request.user.is_authenticated
         else:
             return False
@@ -0,0 +1,95 @@
+# Python Libs
+import hashlib
+import threading
+from collections import Counter
+
+# Django Libs
+from django.core.cache import caches
+
+# Django REST Libs
+from rest_framework.response import Response
+
+# Local Libs
+from .conf import softdesk_setting
+
+
+class ResponseCache():
+    """Per-project cache of list responses
+
+    Entries are keyed by (resource, project, project version stamp,
+    query string) : the version bump of the writes (projects.conditional)
+    invalidates them, stale entries are evicted by the backend.
+
+    Backend : the Django cache alias RESPONSE_CACHE_ALIAS (locmem is a
+    size-bounded LRU, MAX_ENTRIES), None disables the cache.
+
+    Permissions are checked by the views before the lookup, entries
+    are shared by the users allowed to read the resource.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._hits = Counter()
+        self._misses = Counter()
+
+    @staticmethod
+    def _key(request, project, resource):
+        # Host and query string : absolute "next" links of the pages
+        query = hashlib.blake2b(
+            (request.get_host() + "?" +
+             request.META.get("QUERY_STRING", "")).encode(),
+            digest_size=12).hexdigest()
+        # version_time : a reused id (recreated database) does not
+        # find the entries of a deleted project
+        return (f"softdesk:response:{resource}:{project.id}:"
+                f"{project.version}:"
+                f"{project.version_time.timestamp():.6f}:{query}")
+
+    def response(self, request, project, resource, build_response):
+        """
+        Response of a resource of a project, from the cache if
+        available, else built with build_response() and stored
+        (200 and 204 only).
+        """
+        alias = softdesk_setting("RESPONSE_CACHE_ALIAS")
+        if alias is None:
+            return build_response()
+        cache = caches[alias]
+        key = self._key(request, project, resource)
+        entry = cache.get(key)
+        if entry is not None:
+            with self._lock:
+                self._hits[resource] += 1
+            return Response(data=entry[1], status=entry[0])
+        with self._lock:
+            self._misses[resource] += 1
+        response = build_response()
+        if response.status_code in (200, 204):
+            cache.set(key,
+                      (response.status_code, response.data),
+                      softdesk_setting("RESPONSE_CACHE_TIMEOUT"))
+        return response
+
+    def counters(self):
+        """Hits and misses (of this process) by resource"""
+        with self._lock:
+            resources = sorted(set(self._hits) | set(self._misses))
+            counters = {resource: {"hits": self._hits[resource],
+                                   "misses": self._misses[resource]}
+                        for resource in resources}
+        hits = sum(counter["hits"] for counter in counters.values())
+        misses = sum(counter["misses"] for counter in counters.values())
+        return {"alias": softdesk_setting("RESPONSE_CACHE_ALIAS"),
+                "hits": hits,
+                "misses": misses,
+                "hit_ratio": (round(hits / (hits + misses), 4)
+                              if hits + misses else None),
+                "resources": counters}
+
+    def clear(self):
+        """Reset the counters"""
+        with self._lock:
+            self._hits.clear()
+            self._misses.clear()
+
+
+response_cache = ResponseCache()
@@ -0,0 +1,109 @@
+# Django Libs
+from django.db.models import FilteredRelation, Q
+
+# Local Libs
+from .models import (Project,
+                     Contributor,
+                     Issue,)
+
+
+class ProjectScope():
+    """Project, membership and parent issue of a nested request
+
+    Attributes:
+        - project     : Project (None if it doesn't exist)
+        - contributor : Contributor row of the user (None if not contributor)
+        - issue       : Issue of the project (None if not requested/found)
+    """
+    def __init__(self, project=None, contributor=None, issue=None):
+        self.project = project
+        self.contributor = contributor
+        self.issue = issue
+
+    @property
+    def is_contributor(self):
+        """User is a contributor of the project"""
+        return self.contributor is not None
+
+
+def get_project_scope(request, project_id, issue_id=None):
+    """
+    Resolve the project, the membership of the authenticated user
+    and the parent issue once per request.
+
+    The result is stored on the underlying HttpRequest, so views and
+    permission classes share it without hitting the database again.
+
+    Arguments:
+        - request    : DRF or Django request
+        - project_id : ID of the project (url kwarg "id")
+        - issue_id   : ID of the issue (url kwarg "issue_id"), optional
+    """
+    scopes = _request_scopes(request)
+    key = (str(project_id),
+           None if issue_id is None else str(issue_id))
+    if key not in scopes:
+        scopes[key] = _load_scope(request.user.id, project_id, issue_id)
+    return scopes[key]
+
+
+def _request_scopes(request):
+    """Scopes cache attached to the underlying HttpRequest"""
+    http_request = getattr(request, "_request", request)
+    try:
+        return http_request.project_scopes
+    except AttributeError:
+        http_request.project_scopes = dict()
+        return http_request.project_scopes
+
+
+def _columns(model, prefix):
+    """Map model attnames to the lookups used in values()"""
+    return {field.attname: prefix + field.name
+            for field in model._meta.concrete_fields}
+
+
+def _build(model, columns, row):
+    """Build a model instance from a joined values() row"""
+    if row[columns["id"]] is None:
+        return None
+    return model.from_db(Project.objects.db,
+                         list(columns.keys()),
+                         [row[lookup] for lookup in columns.values()])
+
+
+def _load_scope(user_id, project_id, issue_id):
+    """
+    Single query : project LEFT JOIN contributor (of user)
+                           LEFT JOIN issue (of project)
+    """
+    relations = {
+        "membership": FilteredRelation(
+            "contributor",
+            condition=Q(contributor__user_id=user_id)),
+    }
+    columns = {
+        Project: _columns(Project, ""),
+        Contributor: _columns(Contributor, "membership__"),
+    }
+    if issue_id is not None:
+        relations["parent_issue"] = FilteredRelation(
+            "issue",
+            condition=Q(issue__id=issue_id))
+        columns[Issue] = _columns(Issue, "parent_issue__")
+    lookups = [lookup
+               for model_columns in columns.values()
+               for lookup in model_columns.values()]
+    try:
+        row = Project.objects.annotate(**relations).filter(
+            id=project_id).values(*lookups).first()
+    except (ValueError, TypeError):
+        # Malformed ids are handled as missing elements
+        row = None
+    if row is None:
+        return ProjectScope()
+    return ProjectScope(
+        project=_build(Project, columns[Project], row),
+        contributor=_build(Contributor, columns[Contributor], row),
+        issue=(_build(Issue, columns[Issue], row)
+               if issue_id is not None else None))
@@ -0,0 +1,190 @@
+# Python Libs
+import re
+
+# Django Libs
+from django.db import connection
+from django.db.models import Q
+
+# Local Libs
+from .models import (Issue,
+                     Comment,)
+
+
+# FTS5 virtual table, created by migration 0010 on SQLite
+SEARCH_TABLE = "projects_search"
+# Tokens kept around the matches in snippets
+SNIPPET_TOKENS = 16
+# bm25 weights of the columns (kind, project_id, issue_id, title, body)
+RANK_WEIGHTS = "0, 0, 0, 2.0, 1.0"
+# Issues and comments share the table : rowid = id * 2 (+ 1 for comments)
+ISSUE, COMMENT = "issue", "comment"
+# Result of fts_available(), checked once per process
+_AVAILABLE = None
+
+
+def _rowid(kind, object_id):
+    return int(object_id) * 2 + (1 if kind == COMMENT else 0)
+
+
+def fts_available():
+    """The FTS5 index exists on the default database"""
+    if connection.vendor != "sqlite":
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM sqlite_master "
+                       "WHERE type = 'table' AND name = %s",
+                       [SEARCH_TABLE])
+        return cursor.fetchone() is not None
+
+
+def _available():
+    """fts_available(), checked once per process"""
+    global _AVAILABLE
+    if _AVAILABLE is None:
+        _AVAILABLE = fts_available()
+    return _AVAILABLE
+
+
+def _unindex(rowids):
+    rowids = list(rowids)
+    with connection.cursor() as cursor:
+        # Bounded IN lists (SQLite variables limit)
+        for start in range(0, len(rowids), 500):
+            batch = rowids[start:start + 500]
+            cursor.execute(
+                f"DELETE FROM {SEARCH_TABLE} WHERE rowid IN "
+                f"({', '.join(['%s'] * len(batch))})",
+                batch)
+
+
+def _index(rows):
+    """Replace rows : (kind, id, project_id, issue_id, title, body)"""
+    rows = list(rows)
+    if not rows:
+        return
+    _unindex(_rowid(kind, object_id) for kind, object_id, *_ in rows)
+    with connection.cursor() as cursor:
+        cursor.executemany(
+            f"INSERT INTO {SEARCH_TABLE} "
+            "(rowid, kind, project_id, issue_id, title, body) "
+            "VALUES (%s, %s, %s, %s, %s, %s)",
+            [(_rowid(kind, object_id), kind, project_id, issue_id,
+              title, body or "")
+             for kind, object_id, project_id, issue_id, title, body
+             in rows])
+
+
+def index_issues(issues):
+    """Add or refresh issues in the search index"""
+    if _available():
+        _index((ISSUE, issue.id, issue.project_id_id, issue.id,
+                issue.title, issue.desc)
+               for issue in issues)
+
+
+def index_comments(project_id, comments):
+    """Add or refresh comments (of a project) in the search index"""
+    if _available():
+        _index((COMMENT, comment.id, project_id, comment.issue_id_id,
+                "", comment.description)
+               for comment in comments)
+
+
+def unindex(issue_ids=(), comment_ids=()):
+    """Remove deleted issues and comments from the search index"""
+    if _available():
+        _unindex([_rowid(ISSUE, issue_id) for issue_id in issue_ids] +
+                 [_rowid(COMMENT, comment_id)
+                  for comment_id in comment_ids])
+
+
+def _match_expression(query):
+    """
+    FTS5 query from user words : every word must match (AND),
+    words are quoted so the FTS5 syntax cannot be injected.
+    """
+    words = re.findall(r"\w+", query)
+    return " ".join('"' + word + '"' for word in words)
+
+
+def search(query, project_ids, offset, limit):
+    """
+    Issues and comments of the projects matching every word of query.
+
+    Ranked by bm25 on SQLite (FTS5 index), by recency elsewhere.
+
+    Return a list of dict:
+        - type       : issue | comment
+        - id
+        - project_id
+        - issue_id
+        - title      : issue title ("" for comments)
+        - snippet
+    """
+    project_ids = sorted(int(project_id) for project_id in project_ids)
+    expression = _match_expression(query)
+    if not expression or not project_ids:
+        return []
+    if _available():
+        return _search_fts(expression, project_ids, offset, limit)
+    return _search_fallback(re.findall(r"\w+", query),
+                            project_ids, offset, limit)
+
+
+def _search_fts(expression, project_ids, offset, limit):
+    placeholders = ", ".join(["%s"] * len(project_ids))
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"SELECT rowid, kind, project_id, issue_id, title, "
+            f"snippet({SEARCH_TABLE}, -1, '[', ']', '...', "
+            f"{SNIPPET_TOKENS}) "
+            f"FROM {SEARCH_TABLE} "
+            f"WHERE {SEARCH_TABLE} MATCH %s "
+            f"AND project_id IN ({placeholders}) "
+            f"ORDER BY bm25({SEARCH_TABLE}, {RANK_WEIGHTS}), rowid "
+            f"LIMIT %s OFFSET %s",
+            [expression] + project_ids + [limit, offset])
+        rows = cursor.fetchall()
+    return [{"type": kind,
+             "id": rowid // 2,
+             "project_id": project_id,
+             "issue_id": issue_id,
+             "title": title,
+             "snippet": snippet}
+            for rowid, kind, project_id, issue_id, title, snippet in rows]
+
+
+def _search_fallback(words, project_ids, offset, limit):
+    """Unranked icontains search, for databases without FTS5"""
+    issue_filter = Q(project_id__in=project_ids)
+    comment_filter = Q(issue_id__project_id__in=project_ids)
+    for word in words:
+        issue_filter &= Q(title__icontains=word) | Q(desc__icontains=word)
+        comment_filter &= Q(description__icontains=word)
+    # Enough rows of each kind to fill the requested page
+    issues = Issue.objects.filter(issue_filter).order_by(
+        "-created_time", "-id").values_list(
+            "id", "project_id", "title", "desc", "created_time")[
+                :offset + limit]
+    comments = Comment.objects.filter(comment_filter).order_by(
+        "-created_time", "-id").values_list(
+            "id", "issue_id__project_id", "issue_id", "description",
+            "created_time")[:offset + limit]
+    results = [(created_time, {"type": ISSUE,
+                               "id": issue_id,
+                               "project_id": project_id,
+                               "issue_id": issue_id,
+                               "title": title,
+                               "snippet": (desc or "")[:200]})
+               for issue_id, project_id, title, desc, created_time
+               in issues]
+    results += [(created_time, {"type": COMMENT,
+                                "id": comment_id,
+                                "project_id": project_id,
+                                "issue_id": issue_id,
+                                "title": "",
+                                "snippet": description[:200]})
+                for comment_id, project_id, issue_id, description,
+                created_time in comments]
+    results.sort(key=lambda result: result[0], reverse=True)
+    return [result for _, result in results[offset:offset + limit]]
@@ -0,0 +1,300 @@
+# Python Libs
+import bisect
+import contextlib
+import itertools
+import math
+import random
+import time
+from collections import defaultdict, namedtuple
+from datetime import timedelta
+
+# Django Libs
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.db import connection, transaction
+from django.db.models import Max
+from django.utils import timezone
+
+# Local Libs
+from . import search
+from .bulk import (bulk_insert,
+                   insert_rows,)
+from .labels import (labels,)
+from .models import (Project,
+                     Contributor,
+                     Issue,
+                     Comment,)
+from .stats import rebuild_project_stats
+
+
+WORDS = ("login", "page", "button", "crash", "slow", "export", "search",
+         "user", "project", "issue", "comment", "api", "token", "error",
+         "timeout", "mobile", "desktop", "sync", "report", "filter",
+         "list", "update", "delete", "create", "settings", "email",
+         "notification", "upload", "download", "layout", "database",
+         "cache", "server", "client", "network", "screen", "menu", "form",
+         "field", "date", "permission", "role", "admin", "dashboard")
+TYPES = (("back-end", 5), ("front-end", 4), ("iOS", 2), ("Android", 2))
+TAGS = (("bug", 6), ("task", 3), ("improvement", 2))
+PRIORITIES = (("low", 3), ("medium", 5), ("high", 2))
+STATUSES = (("to do", 3), ("in progress", 2), ("done", 5))
+ROLES = (("developer", 6), ("tester", 2), ("manager", 1))
+# Issues are created over this period, until now
+HISTORY = timedelta(days=365)
+# Generated texts by length range (picked from, not generated by row)
+TEXT_POOL = 4096
+
+# Rows of insert_rows(), attributes named as the model fields
+IssueRow = namedtuple("IssueRow", (
+    "id", "title", "desc", "tag", "priority", "status", "project_id_id",
+    "author_user_id_id", "assignee_user_id_id", "created_time",
+    "updated_time"))
+CommentRow = namedtuple("CommentRow", (
+    "id", "description", "author_user_id_id", "issue_id_id",
+    "created_time", "updated_time"))
+
+
+class Seeder():
+    """Deterministic generator of a large SoftDesk dataset
+
+    Skew :
+        - project sizes follow a Zipf law (a few huge projects),
+          contributors grow with the project size
+        - comments by issue follow a log-normal law (long threads)
+
+    The same seed gives the same rows (timestamps aside). Users,
+    projects and contributors are inserted with bulk_create, issues
+    and comments with executemany (insert_rows), one transaction by
+    chunk of issues and their comments. The counters (ProjectStats)
+    are rebuilt at the end, the search index is filled chunk by chunk.
+
+    Issues are spread over the last HISTORY, comments get the time of
+    their issue.
+
+    Usage:
+        Seeder(users=1000, projects=100, issues=100000,
+               comments=500000, seed=0).run()
+    """
+    def __init__(self, users, projects, issues, comments, seed=0,
+                 prefix="seed", password="Motdepasse123",
+                 batch_size=2000, chunk_size=20000, skew=1.1,
+                 index=True, log=None):
+        self.counts = {"users": users, "projects": projects,
+                       "issues": issues, "comments": comments}
+        self.random = random.Random(seed)
+        self.prefix = prefix
+        self.password = password
+        self.batch_size = batch_size
+        self.chunk_size = chunk_size
+        self.skew = skew
+        self.index = index
+        self.log = log or (lambda message: None)
+        self.inserted = defaultdict(int)
+        self.texts = dict()
+        self.now = timezone.now()
+
+    def run(self):
+        """Insert the rows, return the number of rows by model"""
+        if self.counts["users"] < 1 or self.counts["projects"] < 1:
+            raise ValueError("At least one user and one project.")
+        start = time.perf_counter()
+        with _fast_writes():
+            users = self._users()
+            projects, members = self._projects(users)
+            self._issues_and_comments(projects, members)
+            for project in projects:
+                rebuild_project_stats(project.id)
+        self.log(f"{sum(self.inserted.values())} rows in "
+                 f"{time.perf_counter() - start:.1f} s")
+        return dict(self.inserted)
+
+    def _choice(self, weighted):
+        """Value of a ((value, weight), ...) table"""
+        values, weights = zip(*weighted)
+        return self.random.choices(values, weights)[0]
+
+    def _text(self, low, high):
+        if (low, high) not in self.texts:
+            self.texts[low, high] = [
+                " ".join(self.random.choices(
+                    WORDS, k=self.random.randint(low, high)))
+                for _ in range(TEXT_POOL)]
+        return self.texts[low, high][self.random.randrange(TEXT_POOL)]
+
+    def _insert(self, model, objects):
+        objects = bulk_insert(model, objects, self.batch_size)
+        self.inserted[model.__name__] += len(objects)
+        return objects
+
+    def _users(self):
+        """Users sharing one password hash (hashing is slow)"""
+        password = make_password(self.password)
+        with transaction.atomic():
+            users = self._insert(User, (
+                User(username=f"{self.prefix}_{index}",
+                     email=f"{self.prefix}_{index}@softdesk.test",
+                     password=password)
+                for index in range(self.counts["users"])))
+        self.log(f"{len(users)} users")
+        return [user.id for user in users]
+
+    def _projects(self, users):
+        """Projects, weights of their sizes and contributors"""
+        count = self.counts["projects"]
+        # Zipf : weight of the project of rank r is 1 / r^skew
+        self.weights = [1 / (rank ** self.skew)
+                        for rank in range(1, count + 1)]
+        self.random.shuffle(self.weights)
+        total = sum(self.weights)
+        authors = [self.random.choice(users) for _ in range(count)]
+        with transaction.atomic():
+            projects = self._insert(Project, (
+                Project(title=self._text(2, 5).capitalize(),
+                        description=self._text(8, 30),
+                        type=self._choice(TYPES),
+                        author_user_id_id=author)
+                for author in authors))
+            members = []
+            contributors = []
+            for project, author, weight in zip(projects, authors,
+                                               self.weights):
+                size = min(len(users),
+                           2 + int(weight / total * len(users) * 10)
+                           + self.random.randint(0, 5))
+                others = [user for user in
+                          self.random.sample(users, min(len(users), size))
+                          if user != author][:size - 1]
+                members.append([author] + others)
+                contributors.append(Contributor(user_id_id=author,
+                                                project_id_id=project.id,
+                                                role="author",
+                                                permission="1"))
+                contributors += [Contributor(user_id_id=user,
+                                             project_id_id=project.id,
+                                             role=self._choice(ROLES),
+                                             permission="0")
+                                 for user in others]
+            self._insert(Contributor, contributors)
+        self.log(f"{len(projects)} projects, "
+                 f"{len(contributors)} contributors")
+        return projects, members
+
+    def _comment_counts(self, issues):
+        """Comments by issue : log-normal, mean comments / issues"""
+        mean = self.counts["comments"] / max(self.counts["issues"], 1)
+        sigma = 1.2
+        scale = mean / math.exp(sigma ** 2 / 2)
+        counts = []
+        for _ in range(issues):
+            value = self.random.lognormvariate(0, sigma) * scale
+            counts.append(int(value) +
+                          (self.random.random() < value % 1))
+        return counts
+
+    def _next_id(self, model):
+        return (model.objects.aggregate(last=Max("id"))["last"] or 0) + 1
+
+    def _times(self, count, span):
+        """count increasing database datetimes over the last span"""
+        adapt = connection.ops.adapt_datetimefield_value
+        step = span / max(count, 1)
+        start = self.now - span
+        return [adapt(start + step * index) for index in range(count)]
+
+    def _issues_and_comments(self, projects, members):
+        """
+        Issues and comments, with explicit ids and database values
+        (insert_rows, label codes) : model instances are too slow for
+        millions of rows.
+        """
+        cumulative = list(itertools.accumulate(self.weights))
+        teams = {project.id: team
+                 for project, team in zip(projects, members)}
+        remaining = self.counts["comments"]
+        issue_times = self._times(self.counts["issues"], HISTORY)
+        done = 0
+        while done < self.counts["issues"]:
+            size = min(self.chunk_size, self.counts["issues"] - done)
+            chunk_start = time.perf_counter()
+            last_chunk = done + size >= self.counts["issues"]
+            with transaction.atomic():
+                # Single writer (see bulk_insert) : the next ids are ours
+                issue_id = self._next_id(Issue)
+                comment_id = self._next_id(Comment)
+                issues = []
+                for index in range(size):
+                    rank = bisect.bisect_left(
+                        cumulative, self.random.random() * cumulative[-1])
+                    rank = min(rank, len(projects) - 1)
+                    team = members[rank]
+                    moment = issue_times[done + index]
+                    issues.append(IssueRow(
+                        issue_id + index,
+                        self._text(3, 8).capitalize(),
+                        self._text(10, 60),
+                        labels.code("tag", self._choice(TAGS)),
+                        labels.code("priority", self._choice(PRIORITIES)),
+                        labels.code("status", self._choice(STATUSES)),
+                        projects[rank].id,
+                        self.random.choice(team),
+                        self.random.choice(team),
+                        moment, moment))
+                self._insert_rows(Issue, IssueRow._fields, issues)
+                counts = self._comment_counts(size)
+                if last_chunk:
+                    # Exact total : the rest on the last issue
+                    counts[-1] = max(0, remaining - sum(counts[:-1]))
+                comments = []
+                for issue, count in zip(issues, counts):
+                    team = teams[issue.project_id_id]
+                    count = min(count, remaining - len(comments))
+                    comments += [CommentRow(comment_id + len(comments) + n,
+                                            self._text(5, 40),
+                                            self.random.choice(team),
+                                            issue.id,
+                                            issue.created_time,
+                                            issue.created_time)
+                                 for n in range(count)]
+                self._insert_rows(Comment, CommentRow._fields, comments)
+                remaining -= len(comments)
+                if self.index:
+                    self._index(issues, comments)
+            done += size
+            rows = size + len(comments)
+            self.log(f"{done} issues, "
+                     f"{self.counts['comments'] - remaining} comments "
+                     f"({rows / (time.perf_counter() - chunk_start):.0f}"
+                     " rows/s)")
+
+    def _insert_rows(self, model, fields, rows):
+        self.inserted[model.__name__] += insert_rows(model, fields, rows,
+                                                     self.batch_size)
+
+    @staticmethod
+    def _index(issues, comments):
+        """Search index of a chunk (rows have the model attributes)"""
+        search.index_issues(issues)
+        projects = {issue.id: issue.project_id_id for issue in issues}
+        by_project = defaultdict(list)
+        for comment in comments:
+            by_project[projects[comment.issue_id_id]].append(comment)
+        for project_id, project_comments in by_project.items():
+            search.index_comments(project_id, project_comments)
+
+
+@contextlib.contextmanager
+def _fast_writes():
+    """SQLite : no fsync while seeding (the data can be seeded again)"""
+    if connection.vendor != "sqlite" or connection.in_atomic_block:
+        # Not changeable inside a transaction
+        yield
+        return
+    with connection.cursor() as cursor:
+        cursor.execute("PRAGMA synchronous")
+        synchronous = cursor.fetchone()[0]
+        cursor.execute("PRAGMA synchronous = OFF")
+    try:
+        yield
+    finally:
+        with connection.cursor() as cursor:
+            cursor.execute(f"PRAGMA synchronous = {int(synchronous)}")
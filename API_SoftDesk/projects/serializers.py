@@ -1,19 +1,132 @@
 # Django Libs
 from django.contrib.auth.models import User
+from django.utils import timezone
 
 # Django REST Libs
-from rest_framework import serializers
+from rest_framework import ISO_8601, serializers
+from rest_framework.settings import api_settings
 
 # Local Libs
+from .conf import softdesk_setting
+from .instrumentation import timed
 from .models import Project, Issue, Contributor, Comment
 
 
-class ProjectSerializer(serializers.ModelSerializer):
+class ValuesSerializerMixin():
+    """Fast read-only path for list responses
+
+    Build the representations from queryset.values() rows instead
+    of model instances. The field mapping is compiled once per
+    serializer class, output is the same as ModelSerializer.data.
+
+    List endpoints use it when FAST_LIST_SERIALIZERS is enabled :
+        rows = IssueSerializer.list_queryset(queryset)
+        data = IssueSerializer.list_data(rows)
+    """
+    # Fields whose representation is the database value itself
+    VALUE_FIELDS = (serializers.CharField,
+                    serializers.IntegerField,
+                    serializers.PrimaryKeyRelatedField,
+                    serializers.ReadOnlyField,)
+
+    @classmethod
+    def compiled_fields(cls):
+        """(name, source, field) of each readable field"""
+        compiled = cls.__dict__.get("_compiled_fields")
+        if compiled is None:
+            # Bound fields of one instance, reused for every row
+            compiled = tuple((name, field.source, field)
+                             for name, field in cls().fields.items()
+                             if not field.write_only)
+            cls._compiled_fields = compiled
+        return compiled
+
+    @classmethod
+    def values(cls, queryset):
+        """Queryset of the rows needed by the representation"""
+        return queryset.values(
+            *[source for _, source, _ in cls.compiled_fields()])
+
+    @classmethod
+    def represent(cls, rows):
+        """Representations of values() rows"""
+        return list(map(cls.representer(), rows))
+
+    @classmethod
+    def representer(cls):
+        """
+        Function giving the representation of a values() row, the
+        converters compiled once for all the rows it is mapped over.
+        """
+        converters = tuple((name, source, cls._converter(field))
+                           for name, source, field in cls.compiled_fields())
+
+        def represent_row(row):
+            return {name: (row[source]
+                           if converter is None or row[source] is None
+                           else converter(row[source]))
+                    for name, source, converter in converters}
+        return represent_row
+
+    @classmethod
+    def _converter(cls, field):
+        """
+        Function giving the representation of a database value,
+        None when the value is its own representation.
+        """
+        if type(field) in cls.VALUE_FIELDS:
+            return None
+        if (type(field) is serializers.DateTimeField and
+                not hasattr(field, "timezone") and
+                getattr(field, "format", api_settings.DATETIME_FORMAT)
+                == ISO_8601):
+            # DateTimeField.to_representation, with the current
+            # timezone resolved once instead of once per row
+            field_timezone = field.default_timezone()
+            if field_timezone is not None:
+                def to_iso_8601(value):
+                    if timezone.is_naive(value):
+                        return field.to_representation(value)
+                    value = value.astimezone(field_timezone).isoformat()
+                    if value.endswith("+00:00"):
+                        value = value[:-6] + "Z"
+                    return value
+                return to_iso_8601
+        return field.to_representation
+
+    @classmethod
+    def list_queryset(cls, queryset):
+        """Queryset of a list response"""
+        if softdesk_setting("FAST_LIST_SERIALIZERS"):
+            return cls.values(queryset)
+        return queryset
+
+    @classmethod
+    def list_data(cls, rows):
+        """Representation of the rows of list_queryset()"""
+        with timed("serialize"):
+            if softdesk_setting("FAST_LIST_SERIALIZERS"):
+                return cls.represent(rows)
+            return cls(rows, many=True).data
+
+    @property
+    def data(self):
+        with timed("serialize"):
+            return super().data
+
+
+class ProjectSerializer(ValuesSerializerMixin,
+                        serializers.ModelSerializer):
     """Serializer based on serializers.ModelSerializer
+
+    Public fields only : version and version_time are given by the
+    ETag and Last-Modified headers, deleted_time is internal.
     """
     class Meta():
         model = Project
-        fields = "__all__"
+        fields = ("id", "title", "description", "type", "author_user_id",
+                  "updated_time")
+        read_only_fields = ("author_user_id", "updated_time")
 
 
 class UserSerializer(serializers.ModelSerializer):
@@ -24,15 +137,32 @@ class UserSerializer(serializers.ModelSerializer):
         fields = ("username", "first_name", "last_name", "email")
 
 
-class IssueSerializer(serializers.ModelSerializer):
+class IssueSerializer(ValuesSerializerMixin,
+                      serializers.ModelSerializer):
     """Serializer based on serializers.ModelSerializer
+
+    Labels (tag, priority, status) are represented by their names.
     """
+    tag = serializers.CharField(max_length=127)
+    priority = serializers.CharField(max_length=63)
+    status = serializers.CharField(max_length=50)
+
     class Meta():
         model = Issue
         fields = "__all__"
 
 
-class ContributorSerializer(serializers.ModelSerializer):
+class AssignedIssueSerializer(IssueSerializer):
+    """IssueSerializer with the title of the project
+
+    The queryset is annotated with project_title (join, no lookup by
+    issue) : see AssignedIssueCRUD.assigned.
+    """
+    project_title = serializers.CharField(read_only=True)
+
+
+class ContributorSerializer(ValuesSerializerMixin,
+                            serializers.ModelSerializer):
     """Serializer based on serializers.ModelSerializer
     """
     class Meta():
@@ -40,7 +170,8 @@ class ContributorSerializer(serializers.ModelSerializer):
         fields = "__all__"
 
 
-class CommentSerializer(serializers.ModelSerializer):
+class CommentSerializer(ValuesSerializerMixin,
+                        serializers.ModelSerializer):
     """Serializer based on serializers.ModelSerializer
     """
     class Meta():
@@ -0,0 +1,131 @@
+# Python Libs
+from collections import Counter
+
+# Django Libs
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F
+
+# Local Libs
+from .models import (Issue,
+                     Comment,
+                     ProjectStats,)
+
+
+# Issue fields counted by value
+ISSUE_DIMENSIONS = ("status", "priority", "tag")
+
+
+def increment(project_id, dimension, value="", delta=1):
+    """Atomic increment of one counter (created if missing)"""
+    if not delta:
+        return
+    counter = ProjectStats.objects.filter(project_id=project_id,
+                                          dimension=dimension,
+                                          value=value)
+    if counter.update(count=F("count") + delta):
+        return
+    try:
+        with transaction.atomic():
+            ProjectStats.objects.create(project_id_id=project_id,
+                                        dimension=dimension,
+                                        value=value,
+                                        count=delta)
+    except IntegrityError:
+        # Created meanwhile by another request
+        counter.update(count=F("count") + delta)
+
+
+def _issue_counters(issues):
+    """Counter of (dimension, value) for issues"""
+    counters = Counter()
+    for issue in issues:
+        counters[("issues", "")] += 1
+        for dimension in ISSUE_DIMENSIONS:
+            counters[(dimension, getattr(issue, dimension))] += 1
+    return counters
+
+
+def _apply(project_id, counters):
+    for (dimension, value), delta in counters.items():
+        increment(project_id, dimension, value, delta)
+
+
+def issues_created(project_id, issues):
+    """Count new issues of a project"""
+    _apply(project_id, _issue_counters(issues))
+
+
+def issue_updated(old_issue, new_issue):
+    """Move the counters of the changed values"""
+    counters = Counter()
+    for dimension in ISSUE_DIMENSIONS:
+        old_value = getattr(old_issue, dimension)
+        new_value = getattr(new_issue, dimension)
+        if old_value != new_value:
+            counters[(dimension, old_value)] -= 1
+            counters[(dimension, new_value)] += 1
+    _apply(new_issue.project_id_id, counters)
+
+
+def issue_deleted(issue, comments):
+    """Uncount an issue and its deleted comments"""
+    counters = Counter()
+    for key, delta in _issue_counters((issue,)).items():
+        counters[key] -= delta
+    counters[("comments", "")] -= comments
+    _apply(issue.project_id_id, counters)
+
+
+def comments_changed(project_id, delta):
+    """Count created (delta > 0) or deleted (delta < 0) comments"""
+    increment(project_id, "comments", "", delta)
+
+
+def project_stats(project_id):
+    """
+    Counters of a project :
+        - issues   : number of issues
+        - status   : issues by status
+        - priority : issues by priority
+        - tag      : issues by tag
+        - comments : number of comments
+    """
+    stats = {"issues": 0,
+             "status": dict(),
+             "priority": dict(),
+             "tag": dict(),
+             "comments": 0}
+    counters = ProjectStats.objects.filter(
+        project_id=project_id, count__gt=0).values_list(
+            "dimension", "value", "count")
+    for dimension, value, count in counters:
+        if dimension in ISSUE_DIMENSIONS:
+            stats[dimension][value] = count
+        else:
+            stats[dimension] = count
+    return stats
+
+
+def rebuild_project_stats(project_id):
+    """Recount the counters of a project from its issues and comments"""
+    issues = Issue.objects.filter(project_id=project_id)
+    comments = Comment.objects.filter(issue_id__project_id=project_id)
+    with transaction.atomic():
+        counters = [ProjectStats(project_id_id=project_id,
+                                 dimension="issues",
+                                 value="",
+                                 count=issues.count()),
+                    ProjectStats(project_id_id=project_id,
+                                 dimension="comments",
+                                 value="",
+                                 count=comments.count())]
+        for dimension in ISSUE_DIMENSIONS:
+            rows = issues.order_by().values(dimension).annotate(
+                count=Count("id")).values_list(dimension, "count")
+            counters += [ProjectStats(project_id_id=project_id,
+                                      dimension=dimension,
+                                      value=value,
+                                      count=count)
+                         for value, count in rows]
+        ProjectStats.objects.filter(project_id=project_id).delete()
+        ProjectStats.objects.bulk_create(counters)
@@ -0,0 +1,137 @@
+# Python Libs
+from datetime import timedelta
+
+# Django Libs
+from django.contrib.auth.models import User
+from django.utils import timezone
+
+# Django REST Libs
+from rest_framework.test import (APITestCase,)
+
+# Locals Libs
+from ..membership import (membership_cache,)
+from ..models import (Project,
+                      Contributor,
+                      Issue,)
+
+
+class AssignedIssueTests(APITestCase):
+    """
+    Tests for the issues assigned to the user, across projects.
+
+    Tests :
+        Authenticated user tests : (AUT)
+            + issues of every project, with its title (ap)
+            + paginated by cursor (pc)
+            - issues of a project left (pl)
+            - issues of a deleted project (dp)
+        Unauthenticated user tests : (UUT)
+            - assigned issues (ai)
+    """
+
+    def setUp(self):
+        """Setup
+        Users
+            - author user
+            - assignee user
+        Projets
+            - 2 projects, assignee contributor of both
+        Issues
+            - 3 issues by project, one day apart, assigned to the
+              assignee except the last one
+        """
+        membership_cache.clear()
+        self.author = User.objects.create_user(username='user1',
+                                               password='Motdepasse123')
+        self.assignee = User.objects.create_user(username='user2',
+                                                 password='Motdepasse123')
+        start = timezone.now() - timedelta(days=10)
+        self.projects = []
+        self.issues = []
+        for index in range(2):
+            project = Project.objects.create(title=f'project {index}',
+                                             description='project test',
+                                             type='test',
+                                             author_user_id=self.author)
+            Contributor.objects.create(user_id=self.author,
+                                       project_id=project,
+                                       role='author',
+                                       permission='1')
+            Contributor.objects.create(user_id=self.assignee,
+                                       project_id=project,
+                                       role='developer',
+                                       permission='0')
+            self.projects.append(project)
+            for rank, assignee in enumerate((self.assignee, self.assignee,
+                                             self.author)):
+                issue = Issue.objects.create(title='issue',
+                                             desc='issue desc',
+                                             tag='bug',
+                                             priority='low',
+                                             status='to do',
+                                             assignee_user_id=assignee,
+                                             author_user_id=self.author,
+                                             project_id=project)
+                Issue.objects.filter(id=issue.id).update(
+                    created_time=start + timedelta(days=2 * rank + index))
+                if assignee == self.assignee:
+                    self.issues.append(issue.id)
+        # Order of created_time
+        self.issues = [self.issues[index] for index in (0, 2, 1, 3)]
+        self.client.force_authenticate(user=self.assignee)
+        self.url = 'http://testserver/issues/assigned/'
+
+    def test_AUT_ap(self):
+        """Test
+        + issues of every project, with its title
+        """
+        response = self.client.get(path=self.url)
+        self.assertEqual(response.status_code, 200)
+        results = response.data['results']
+        self.assertEqual([issue['id'] for issue in results], self.issues)
+        self.assertEqual([issue['project_title'] for issue in results],
+                         ['project 0', 'project 1', 'project 0',
+                          'project 1'])
+        self.assertEqual(results[0]['status'], 'to do')
+        self.assertEqual(results[0]['project_id'], self.projects[0].id)
+
+    def test_AUT_pc(self):
+        """Test
+        + paginated by cursor
+        """
+        ids = []
+        url = f'{self.url}?page_size=3'
+        while url:
+            response = self.client.get(path=url)
+            self.assertEqual(response.status_code, 200)
+            ids += [issue['id'] for issue in response.data['results']]
+            url = response.data['next']
+        self.assertEqual(ids, self.issues)
+
+    def test_AUT_pl(self):
+        """Test
+        - issues of a project left
+        """
+        Contributor.objects.filter(user_id=self.assignee,
+                                   project_id=self.projects[1]).delete()
+        response = self.client.get(path=self.url)
+        self.assertEqual([issue['id'] for issue in response.data['results']],
+                         self.issues[::2])
+
+    def test_AUT_dp(self):
+        """Test
+        - issues of a deleted project
+        """
+        Project.objects.filter(id=self.projects[0].id).update(
+            deleted_time=timezone.now())
+        response = self.client.get(path=self.url)
+        self.assertEqual([issue['id'] for issue in response.data['results']],
+                         self.issues[1::2])
+
+    def test_UUT_ai(self):
+        """Test
+        - assigned issues
+        """
+        self.client.force_authenticate(user=None)
+        response = self.client.get(path=self.url)
+        self.assertEqual(response.status_code, 401)
@@ -0,0 +1,195 @@
+# Python Libs
+import asyncio
+
+# Django Libs
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TransactionTestCase, override_settings
+from django.urls import include, path
+
+# Locals Libs
+from ..async_views import (AsyncRouter,)
+from ..authentication import (ClaimsTokenObtainPairSerializer,
+                              user_status_cache,)
+from ..membership import (membership_cache,)
+from ..models import (Project,
+                      Contributor,
+                      Issue,)
+from ..search import (SEARCH_TABLE,
+                      fts_available,)
+from ..urls import (build_router,)
+
+
+# URLs of the tests : async variants of the viewsets
+urlpatterns = [
+    path("projects/", include(build_router(AsyncRouter).urls)),
+]
+
+
+@override_settings(ROOT_URLCONF=__name__)
+class AsyncViewTests(TransactionTestCase):
+    """
+    Tests for the async variants of the viewsets.
+
+    Views run in thread pool connections : rows are committed,
+    hence TransactionTestCase.
+
+    Tests :
+        Contributors tests: (CT)
+            + list projects (lp)
+            + retrieve project (rp)
+            + add issue (ai)
+            + add issues concurrently, one writer (ac)
+            + update issue, sync action (ui)
+            - streaming actions, kept sync (sa)
+        Unauthenticated user tests : (UUT)
+            - list projects (lp)
+    """
+
+    def setUp(self):
+        """Setup
+        Users
+            - author user
+        Projet
+            - example project
+        """
+        membership_cache.clear()
+        user_status_cache.clear()
+        user_form = {
+            'username': 'user1',
+            'password': 'Motdepasse123',
+        }
+        self.author = User.objects.create_user(**user_form)
+        self.project = Project.objects.create(title='project',
+                                              description='project test',
+                                              type='test',
+                                              author_user_id=self.author)
+        Contributor.objects.create(user_id=self.author,
+                                   project_id=self.project,
+                                   role='author',
+                                   permission='1')
+        token = ClaimsTokenObtainPairSerializer.get_token(
+            self.author).access_token
+        self.headers = {'HTTP_AUTHORIZATION': f'Bearer {token}'}
+        # AsyncClient takes the header names
+        self.async_headers = {'authorization': f'Bearer {token}'}
+
+    def tearDown(self):
+        # The search index is not flushed with the models tables
+        if fts_available():
+            with connection.cursor() as cursor:
+                cursor.execute(f"DELETE FROM {SEARCH_TABLE}")
+
+    async def test_CT_lp(self):
+        """Test
+        Contributor user /
+            + list projects
+        """
+        response = await self.async_client.get('/projects/',
+                                               **self.async_headers)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([project['id'] for project in response.json()],
+                         [self.project.id])
+
+    async def test_CT_rp(self):
+        """Test
+        Contributor user /
+            + retrieve project
+        """
+        response = await self.async_client.get(
+            f'/projects/{self.project.id}/', **self.async_headers)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['title'], 'project')
+
+    async def test_CT_ai(self):
+        """Test
+        Contributor user /
+            + add issue
+        """
+        issue = {
+            'title': 'issue',
+            'desc': 'issue desc',
+            'tag': 'task',
+            'priority': 'low',
+            'status': 'to do',
+        }
+        response = await self.async_client.post(
+            f'/projects/{self.project.id}/issues/',
+            data=issue,
+            content_type='application/json',
+            **self.async_headers)
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json()['author_user_id'], self.author.id)
+        response = await self.async_client.get(
+            f'/projects/{self.project.id}/issues/', **self.async_headers)
+        self.assertEqual([issue['title']
+                          for issue in response.json()['results']],
+                         ['issue'])
+
+    async def test_CT_ac(self):
+        """Test
+        Contributor user /
+            + add issues concurrently : writes in the thread sensitive
+              thread, no "database is locked"
+        """
+        responses = await asyncio.gather(*[
+            self.async_client.post(
+                f'/projects/{self.project.id}/issues/',
+                data={'title': f'issue {index}',
+                      'desc': 'issue desc',
+                      'tag': 'task',
+                      'priority': 'low',
+                      'status': 'to do'},
+                content_type='application/json',
+                **self.async_headers)
+            for index in range(5)])
+        self.assertEqual([response.status_code for response in responses],
+                         [201] * 5)
+        response = await self.async_client.get(
+            f'/projects/{self.project.id}/issues/', **self.async_headers)
+        self.assertEqual(len(response.json()['results']), 5)
+
+    def test_CT_ui(self):
+        """Test
+        Contributor user /
+            + update issue, sync action
+        """
+        issue = Issue.objects.create(title='issue',
+                                     desc='issue desc',
+                                     tag='test',
+                                     priority='low',
+                                     status='created',
+                                     project_id=self.project,
+                                     author_user_id=self.author,
+                                     assignee_user_id=self.author)
+        response = self.client.put(
+            f'/projects/{self.project.id}/issues/{issue.id}/',
+            data={'title': 'updated'},
+            content_type='application/json',
+            **self.headers)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(Issue.objects.get(id=issue.id).title, 'updated')
+
+    async def test_CT_sa(self):
+        """Test
+        Contributor user /
+            - streaming actions, kept sync : refused under ASGI
+        """
+        for action in ('export', 'events'):
+            response = await self.async_client.get(
+                f'/projects/{self.project.id}/{action}/',
+                **self.async_headers)
+            self.assertEqual(response.status_code, 501)
+        callbacks = {url.callback.actions['get']: url.callback
+                     for url in build_router(AsyncRouter).urls
+                     if 'get' in url.callback.actions}
+        self.assertFalse(asyncio.iscoroutinefunction(callbacks['export']))
+        self.assertTrue(asyncio.iscoroutinefunction(callbacks['list']))
+
+    async def test_UUT_lp(self):
+        """Test
+        Unauthenticated user /
+            - list projects
+        """
+        response = await self.async_client.get('/projects/')
+        self.assertEqual(response.status_code, 401)
@@ -0,0 +1,144 @@
+# Django Libs
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+# Django REST Libs
+from rest_framework.test import (APITestCase,)
+
+# Locals Libs
+from ..authentication import (user_status_cache,)
+from ..membership import (membership_cache,)
+from ..models import (Project,
+                      Contributor,)
+
+
+class StatelessAuthenticationTests(APITestCase):
+    """
+    Tests for the stateless JWT authentication.
+
+    Tests :
+        Authenticated user tests: (AUT)
+            + no user lookup (nl)
+            + write with request.user (wu)
+            + superuser claim (sc)
+            - superuser revoked (sr)
+            - user deactivated (ud)
+            - user deleted (ux)
+    """
+
+    def setUp(self):
+        """Setup
+        Users
+            - author user
+        Projet
+            - example project
+        """
+        membership_cache.clear()
+        user_status_cache.clear()
+        user_form = {
+            'username': 'user1',
+            'password': 'Motdepasse123',
+        }
+        self.author = User.objects.create_user(**user_form)
+        self.project = Project.objects.create(title='project',
+                                              description='project test',
+                                              type='test',
+                                              author_user_id=self.author)
+        Contributor.objects.create(user_id=self.author,
+                                   project_id=self.project,
+                                   role='author',
+                                   permission='1')
+
+    def _login(self, username='user1'):
+        response = self.client.post(path='http://127.0.0.1:8000/login/',
+                                    data={'username': username,
+                                          'password': 'Motdepasse123'})
+        self.client.credentials(
+            HTTP_AUTHORIZATION=f"Bearer {response.data['access']}")
+
+    def _user_queries(self, queries):
+        return [query['sql'] for query in queries
+                if 'auth_user' in query['sql']]
+
+    def test_AUT_nl(self):
+        """Test
+        Authenticated user /
+            + no user lookup
+        """
+        self._login()
+        url = f'http://127.0.0.1:8000/projects/{self.project.id}/'
+        self.client.get(path=url)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(path=url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self._user_queries(queries), [])
+
+    def test_AUT_wu(self):
+        """Test
+        Authenticated user /
+            + write with request.user
+        """
+        self._login()
+        self.client.get(path='http://127.0.0.1:8000/projects/')
+        issue = {
+            'title': 'issue',
+            'desc': 'issue desc',
+            'tag': 'task',
+            'priority': 'low',
+            'status': 'to do',
+        }
+        url = f'http://127.0.0.1:8000/projects/{self.project.id}/issues/'
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(path=url, data=issue)
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(self._user_queries(queries), [])
+        self.assertEqual(response.data['author_user_id'], self.author.id)
+        self.assertEqual(response.data['assignee_user_id'], self.author.id)
+
+    def test_AUT_sc(self):
+        """Test
+        Authenticated user /
+            + superuser claim
+        """
+        User.objects.create_superuser(username='admin',
+                                      password='Motdepasse123')
+        self._login('admin')
+        response = self.client.get(path='http://127.0.0.1:8000/projects/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data), 1)
+
+    def test_AUT_sr(self):
+        """Test
+        Authenticated user /
+            - superuser revoked
+        """
+        admin = User.objects.create_superuser(username='admin',
+                                              password='Motdepasse123')
+        self._login('admin')
+        admin.is_superuser = False
+        admin.save()
+        response = self.client.get(path='http://127.0.0.1:8000/projects/')
+        self.assertEqual(response.status_code, 204)
+
+    def test_AUT_ud(self):
+        """Test
+        Authenticated user /
+            - user deactivated
+        """
+        self._login()
+        self.client.get(path='http://127.0.0.1:8000/projects/')
+        self.author.is_active = False
+        self.author.save()
+        response = self.client.get(path='http://127.0.0.1:8000/projects/')
+        self.assertEqual(response.status_code, 401)
+
+    def test_AUT_ux(self):
+        """Test
+        Authenticated user /
+            - user deleted
+        """
+        self._login()
+        User.objects.filter(id=self.author.id).delete()
+        response = self.client.get(path='http://127.0.0.1:8000/projects/')
+        self.assertEqual(response.status_code, 401)
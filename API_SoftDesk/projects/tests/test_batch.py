@@ -0,0 +1,184 @@
+# Django Libs
+from django.contrib.auth.models import User
+from django.test import override_settings
+
+# Django REST Libs
+from rest_framework.test import (APITestCase,)
+
+# Locals Libs
+from ..membership import (membership_cache,)
+from ..models import (Project,
+                      Contributor,
+                      Issue,
+                      Comment,)
+
+
+class BatchTests(APITestCase):
+    """
+    Tests for the batch of API requests.
+
+    Tests :
+        Authenticated user tests : (AUT)
+            + reads of a project screen (rs)
+            + writes seen by the next sub-requests (ws)
+            + conditional sub-request (cs)
+            - permissions of the sub-requests (ps)
+            - invalid sub-requests (is)
+            - invalid batch (ib)
+        Unauthenticated user tests : (UUT)
+            - batch (ba)
+    """
+
+    def setUp(self):
+        """Setup
+        Users
+            - author user
+            - no contributor user
+        Projet
+            - example project
+        Issue
+            - example issue, with a comment
+        """
+        membership_cache.clear()
+        self.author = User.objects.create_user(username='user1',
+                                               password='Motdepasse123')
+        self.no_contrib = User.objects.create_user(username='user2',
+                                                   password='Motdepasse123')
+        self.project = Project.objects.create(title='project',
+                                              description='project test',
+                                              type='test',
+                                              author_user_id=self.author)
+        Contributor.objects.create(user_id=self.author,
+                                   project_id=self.project,
+                                   role='author',
+                                   permission='1')
+        self.issue = Issue.objects.create(title='issue',
+                                          desc='issue desc',
+                                          tag='bug',
+                                          priority='low',
+                                          status='to do',
+                                          assignee_user_id=self.author,
+                                          author_user_id=self.author,
+                                          project_id=self.project)
+        Comment.objects.create(description='comment',
+                               author_user_id=self.author,
+                               issue_id=self.issue)
+        self.client.force_authenticate(user=self.author)
+        self.url = 'http://testserver/batch/'
+        self.project_path = f'/projects/{self.project.id}/'
+
+    def _batch(self, items, status_code=200):
+        response = self.client.post(path=self.url, data=items)
+        self.assertEqual(response.status_code, status_code)
+        if status_code != 200:
+            return response.data['detail']
+        return response.data['results']
+
+    def test_AUT_rs(self):
+        """Test
+        + reads of a project screen : same responses as sent alone
+        """
+        paths = [self.project_path,
+                 f'{self.project_path}users/',
+                 f'{self.project_path}issues/?page_size=10',
+                 f'{self.project_path}issues/{self.issue.id}/comments/']
+        results = self._batch([{'method': 'GET', 'path': path}
+                               for path in paths])
+        for path, result in zip(paths, results):
+            response = self.client.get(path=f'http://testserver{path}')
+            self.assertEqual(result['status'], response.status_code)
+            self.assertEqual(result['body'], response.data)
+            self.assertEqual(result['headers'].get('ETag'),
+                             response.get('ETag'))
+        self.assertEqual(results[2]['body']['results'][0]['id'],
+                         self.issue.id)
+
+    def test_AUT_ws(self):
+        """Test
+        + writes seen by the next sub-requests
+        """
+        results = self._batch([
+            {'method': 'POST',
+             'path': f'{self.project_path}issues/',
+             'body': {'title': 'new issue',
+                      'desc': 'issue desc',
+                      'tag': 'task',
+                      'priority': 'high',
+                      'status': 'done'}},
+            {'method': 'PUT',
+             'path': self.project_path,
+             'body': {'title': 'project updated',
+                      'description': 'project test',
+                      'type': 'test'}},
+            {'method': 'GET', 'path': self.project_path},
+            {'method': 'GET', 'path': f'{self.project_path}issues/'}])
+        self.assertEqual([result['status'] for result in results],
+                         [201, 200, 200, 200])
+        self.assertEqual(results[2]['body']['title'], 'project updated')
+        self.assertEqual([issue['title']
+                          for issue in results[3]['body']['results']],
+                         ['issue', 'new issue'])
+
+    def test_AUT_cs(self):
+        """Test
+        + conditional sub-request
+        """
+        path = f'{self.project_path}issues/'
+        etag = self._batch([{'method': 'GET',
+                             'path': path}])[0]['headers']['ETag']
+        results = self._batch([{'method': 'GET',
+                                'path': path,
+                                'headers': {'If-None-Match': etag}}])
+        self.assertEqual(results[0]['status'], 304)
+        self.assertIsNone(results[0]['body'])
+
+    def test_AUT_ps(self):
+        """Test
+        - permissions of the sub-requests
+        """
+        self.client.force_authenticate(user=self.no_contrib)
+        results = self._batch([
+            {'method': 'GET', 'path': f'{self.project_path}issues/'},
+            {'method': 'DELETE', 'path': self.project_path},
+            {'method': 'GET', 'path': '/issues/assigned/'}])
+        self.assertEqual([result['status'] for result in results],
+                         [403, 403, 200])
+        self.assertTrue(Project.objects.filter(id=self.project.id).exists())
+
+    def test_AUT_is(self):
+        """Test
+        - invalid sub-requests : the others are run
+        """
+        results = self._batch([
+            {'method': 'PATCH', 'path': self.project_path},
+            {'method': 'GET', 'path': 'projects/'},
+            {'method': 'GET', 'path': '/unknown/'},
+            {'method': 'GET', 'path': '/admin/'},
+            {'method': 'POST', 'path': '/batch/', 'body': []},
+            {'method': 'GET', 'path': f'{self.project_path}export/'},
+            {'method': 'GET', 'path': self.project_path}])
+        self.assertEqual([result['status'] for result in results],
+                         [400, 400, 404, 404, 404, 400, 200])
+        self.assertEqual(results[5]['body']['detail'], 'Streaming response.')
+
+    def test_AUT_ib(self):
+        """Test
+        - invalid batch
+        """
+        self.assertEqual(self._batch({'method': 'GET'}, 400),
+                         'Invalid form.')
+        self.assertEqual(self._batch([], 400), 'Empty form.')
+        with override_settings(SOFTDESK={'BATCH_MAX_REQUESTS': 2}):
+            detail = self._batch([{'method': 'GET',
+                                   'path': self.project_path}] * 3, 400)
+        self.assertEqual(detail, 'Too many requests.')
+
+    def test_UUT_ba(self):
+        """Test
+        - batch
+        """
+        self.client.force_authenticate(user=None)
+        response = self.client.post(path=self.url,
+                                    data=[{'method': 'GET',
+                                           'path': self.project_path}])
+        self.assertEqual(response.status_code, 401)
@@ -0,0 +1,89 @@
+# Python Libs
+import json
+import os
+import tempfile
+from io import StringIO
+
+# Django Libs
+from django.conf import settings
+from django.core.management import call_command
+from django.test import LiveServerTestCase
+
+# Locals Libs
+from ..benchmark import (compare,
+                         load_collection,
+                         percentile,)
+from ..membership import (membership_cache,)
+from ..seed import (Seeder,)
+
+
+class BenchmarkTests(LiveServerTestCase):
+    """
+    Tests for the HTTP benchmark harness.
+
+    Tests :
+        Collection tests: (CT)
+            + endpoints of the Postman collection (ep)
+        Statistics tests: (ST)
+            + percentiles (pc)
+            + comparison with a baseline (cb)
+        Run tests: (RT)
+            + flows against a live server (fl)
+    """
+    def setUp(self):
+        membership_cache.clear()
+        self.collection = str(settings.BASE_DIR.parent /
+                              "P10_API.postman_collection.json")
+
+    def test_CT_ep(self):
+        """Test endpoints of the Postman collection"""
+        endpoints = load_collection(self.collection)
+        self.assertEqual(endpoints["delete project"].path,
+                         "/projects/{project_id}/")
+        self.assertEqual(endpoints["list issues from project"].path,
+                         "/projects/{project_id}/issues/")
+        self.assertEqual(
+            endpoints["update comment from issue"].path,
+            "/projects/{project_id}/issues/{issue_id}/comments/"
+            "{comment_id}/")
+        self.assertEqual(endpoints["signup a User"].path, "/signup/")
+        self.assertEqual(endpoints["authentification"].method, "POST")
+
+    def test_ST_pc(self):
+        """Test percentiles : nearest rank"""
+        values = list(range(1, 101))
+        self.assertEqual(percentile(values, 0.50), 50)
+        self.assertEqual(percentile(values, 0.99), 99)
+        self.assertEqual(percentile([7], 0.95), 7)
+        self.assertIsNone(percentile([], 0.5))
+
+    def test_ST_cb(self):
+        """Test comparison with a baseline"""
+        def result(throughput, p95):
+            stats = {"throughput": throughput, "p95": p95}
+            return {"total": stats, "endpoints": {"GET /projects/": stats}}
+
+        rows = compare(result(100, 10), result(50, 15))
+        self.assertEqual(rows, [("total", -50.0, 50.0),
+                                ("GET /projects/", -50.0, 50.0)])
+
+    def test_RT_fl(self):
+        """Test flows against a live server"""
+        Seeder(users=5, projects=2, issues=20, comments=40,
+               prefix="bench").run()
+        handle, output = tempfile.mkstemp(suffix=".json")
+        os.close(handle)
+        self.addCleanup(os.remove, output)
+        call_command("bench_http", url=self.live_server_url,
+                     prefix="bench", concurrency=1, iterations=3,
+                     output=output, stdout=StringIO())
+        with open(output, encoding="utf-8") as result:
+            result = json.load(result)
+        self.assertEqual(result["meta"]["iterations"], 3)
+        self.assertEqual(result["total"]["errors"], 0)
+        self.assertEqual({name: flow["errors"]
+                          for name, flow in result["flows"].items()},
+                         {"read": 0, "write": 0, "story": 0})
+        self.assertIn("POST /projects/{project_id}/issues/",
+                      result["endpoints"])
+        self.assertGreater(result["endpoints"]["GET /projects/"]["p95"], 0)
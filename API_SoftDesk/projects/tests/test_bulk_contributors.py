@@ -0,0 +1,159 @@
+# Django Libs
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+# Django REST Libs
+from rest_framework.test import (APITestCase,)
+
+# Locals Libs
+from ..membership import (membership_cache,)
+from ..models import (Project,
+                      Contributor,
+                      Tombstone,)
+
+
+class BulkContributorTests(APITestCase):
+    """
+    Tests for the bulk management of contributors.
+
+    Tests :
+        Owner tests: (OT)
+            + add and remove contributors (ar)
+            + add a team, constant queries (at)
+            + some changes rejected (sr)
+            - invalid form (if)
+        Contributors tests: (CT)
+            - add contributors (ac)
+    """
+
+    def setUp(self):
+        """Setup
+        Users
+            - author user
+            - contributor user
+            - 3 other users
+        Projet
+            - example project
+        """
+        membership_cache.clear()
+        user_form = {
+            'username': 'user1',
+            'password': 'Motdepasse123',
+        }
+        self.author = User.objects.create_user(**user_form)
+        user_form = {
+            'username': 'user2',
+            'password': 'Motdepasse123',
+        }
+        self.contrib = User.objects.create_user(**user_form)
+        self.others = [User.objects.create_user(username=f'other{index}',
+                                                password='Motdepasse123')
+                       for index in range(3)]
+        self.project = Project.objects.create(title='project',
+                                              description='project test',
+                                              type='test',
+                                              author_user_id=self.author)
+        Contributor.objects.create(user_id=self.author,
+                                   project_id=self.project,
+                                   role='author',
+                                   permission='1')
+        Contributor.objects.create(user_id=self.contrib,
+                                   project_id=self.project,
+                                   role='test',
+                                   permission='0')
+        self.url = (f'http://127.0.0.1:8000/projects/{self.project.id}'
+                    '/users/bulk/')
+        self.client.force_authenticate(user=self.author)
+
+    def _members(self):
+        return set(Contributor.objects.filter(
+            project_id=self.project).values_list('user_id', flat=True))
+
+    def test_OT_ar(self):
+        """Test
+        Owner /
+            + add and remove contributors
+        """
+        form = {'add': [{'user_id': user.id, 'role': 'dev'}
+                        for user in self.others],
+                'remove': [self.contrib.id]}
+        response = self.client.post(path=self.url, data=form, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['added'], 3)
+        self.assertEqual(response.data['removed'], 1)
+        self.assertEqual(self._members(),
+                         {self.author.id} | {user.id for user in self.others})
+        self.assertTrue(Tombstone.objects.filter(
+            project_id=self.project.id, kind='contributor',
+            object_id=self.contrib.id).exists())
+        # Membership cache invalidated
+        self.client.force_authenticate(user=self.others[0])
+        response = self.client.get(
+            path=f'http://127.0.0.1:8000/projects/{self.project.id}/')
+        self.assertEqual(response.status_code, 200)
+
+    def test_OT_at(self):
+        """Test
+        Owner /
+            + add a team, constant queries
+        """
+        User.objects.bulk_create(
+            [User(username=f'team{index}') for index in range(30)])
+        team = list(User.objects.filter(username__startswith='team'))
+        queries = []
+        for users in (team[:3], team[3:]):
+            form = {'add': [{'user_id': user.id, 'role': 'dev'}
+                            for user in users]}
+            with CaptureQueriesContext(connection) as context:
+                response = self.client.post(path=self.url, data=form,
+                                            format='json')
+            self.assertEqual(response.data['added'], len(users))
+            queries.append(len(context.captured_queries))
+        # Scope, users, memberships, insert, version (+ savepoints)
+        self.assertEqual(queries[0], queries[1])
+        self.assertEqual(len(self._members()), 32)
+
+    def test_OT_sr(self):
+        """Test
+        Owner /
+            + some changes rejected
+        """
+        form = {'add': [{'user_id': self.contrib.id, 'role': 'dev'},
+                        {'user_id': self.others[0].id, 'role': ''},
+                        {'user_id': 0, 'role': 'dev'},
+                        {'user_id': 'x', 'role': 'dev'},
+                        {'user_id': self.others[1].id, 'role': 'dev'}],
+                'remove': [self.author.id,
+                           self.others[2].id,
+                           self.others[1].id]}
+        response = self.client.post(path=self.url, data=form, format='json')
+        self.assertEqual(response.status_code, 207)
+        self.assertEqual([result['status']
+                          for result in response.data['results']],
+                         [208, 400, 404, 400, 201, 403, 404, 400])
+        self.assertEqual(response.data['added'], 1)
+        self.assertEqual(self._members(),
+                         {self.author.id, self.contrib.id,
+                          self.others[1].id})
+
+    def test_OT_if(self):
+        """Test
+        Owner /
+            - invalid form
+        """
+        for form in ({}, [], {'add': 'user'}):
+            response = self.client.post(path=self.url, data=form,
+                                        format='json')
+            self.assertEqual(response.status_code, 400)
+
+    def test_CT_ac(self):
+        """Test
+        Contributor user /
+            - add contributors
+        """
+        self.client.force_authenticate(user=self.contrib)
+        form = {'add': [{'user_id': self.others[0].id, 'role': 'dev'}]}
+        response = self.client.post(path=self.url, data=form, format='json')
+        self.assertEqual(response.status_code, 403)
+        self.assertNotIn(self.others[0].id, self._members())
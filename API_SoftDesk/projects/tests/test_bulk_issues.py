@@ -0,0 +1,167 @@
+# Django Libs
+from django.contrib.auth.models import User
+from django.test import override_settings
+
+# Django REST Libs
+from rest_framework.test import (APITestCase,)
+
+# Locals Libs
+from ..models import (Project,
+                      Contributor,
+                      Issue,)
+
+
+class BulkIssueTests(APITestCase):
+    """
+    Tests for the bulk creation of issues.
+
+    Tests :
+        Contributors tests: (CT)
+            + add issues (ai)
+            + add issues, some invalid (ap)
+            - add invalid issues only (av)
+            - add too many issues (am)
+            - invalid form (if)
+        No contributors test: (NCT)
+            - add issues (ai)
+        Unauthenticated user tests : (UUT)
+            - add issues (ai)
+    """
+
+    def setUp(self):
+        """Setup
+        Users
+            - author user
+            - contributor user
+            - no contributor user
+        Projet
+            - example project
+        """
+        user_form = {
+            'username': 'user1',
+            'password': 'Motdepasse123',
+        }
+        self.author = User.objects.create_user(**user_form)
+        user_form = {
+            'username': 'user2',
+            'password': 'Motdepasse123',
+        }
+        self.contrib = User.objects.create_user(**user_form)
+        user_form = {
+            'username': 'user3',
+            'password': 'Motdepasse123',
+        }
+        self.no_contrib = User.objects.create_user(**user_form)
+        self.project = Project.objects.create(title='project',
+                                              description='project test',
+                                              type='test',
+                                              author_user_id=self.author)
+        Contributor.objects.create(user_id=self.author,
+                                   project_id=self.project,
+                                   role='author',
+                                   permission='1')
+        Contributor.objects.create(user_id=self.contrib,
+                                   project_id=self.project,
+                                   role='test',
+                                   permission='0')
+        self.url = (f'http://127.0.0.1:8000/projects/'
+                    f'{self.project.id}/issues/bulk/')
+
+    def _issue(self, index, **fields):
+        issue = {
+            'title': f'issue {index}',
+            'desc': 'issue desc',
+            'tag': 'task',
+            'priority': 'low',
+            'status': 'to do',
+        }
+        issue.update(fields)
+        return issue
+
+    @override_settings(SOFTDESK={'BULK_BATCH_SIZE': 2})
+    def test_CT_ai(self):
+        """Test
+        Contributor user /
+            + add issues
+        """
+        self.client.force_authenticate(user=self.contrib)
+        issues = [self._issue(index) for index in range(5)]
+        issues[1]['assignee_user_id'] = self.author.id
+        response = self.client.post(path=self.url, data=issues)
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data['created'], 5)
+        ids = [result['id'] for result in response.data['results']]
+        created = Issue.objects.filter(project_id=self.project)
+        self.assertEqual(sorted(ids),
+                         sorted(created.values_list('id', flat=True)))
+        issue = Issue.objects.get(id=ids[1])
+        self.assertEqual(issue.title, 'issue 1')
+        self.assertEqual(issue.assignee_user_id, self.author)
+        self.assertEqual(issue.author_user_id, self.contrib)
+
+    def test_CT_ap(self):
+        """Test
+        Contributor user /
+            + add issues, some invalid
+        """
+        self.client.force_authenticate(user=self.contrib)
+        issues = [
+            self._issue(0),
+            self._issue(1, assignee_user_id=999),
+            {'title': 'missing fields'},
+            self._issue(3, title='t' * 600),
+        ]
+        response = self.client.post(path=self.url, data=issues)
+        self.assertEqual(response.status_code, 207)
+        self.assertEqual(response.data['created'], 1)
+        statuses = [result['status'] for result in response.data['results']]
+        self.assertEqual(statuses, [201, 400, 400, 400])
+        self.assertEqual(Issue.objects.count(), 1)
+
+    def test_CT_av(self):
+        """Test
+        Contributor user /
+            - add invalid issues only
+        """
+        self.client.force_authenticate(user=self.contrib)
+        response = self.client.post(path=self.url,
+                                    data=[{'title': 'missing fields'}])
+        self.assertEqual(response.status_code, 400)
+
+    @override_settings(SOFTDESK={'BULK_MAX_ITEMS': 2})
+    def test_CT_am(self):
+        """Test
+        Contributor user /
+            - add too many issues
+        """
+        self.client.force_authenticate(user=self.contrib)
+        issues = [self._issue(index) for index in range(3)]
+        response = self.client.post(path=self.url, data=issues)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(Issue.objects.count(), 0)
+
+    def test_CT_if(self):
+        """Test
+        Contributor user /
+            - invalid form
+        """
+        self.client.force_authenticate(user=self.contrib)
+        response = self.client.post(path=self.url, data=self._issue(0))
+        self.assertEqual(response.status_code, 400)
+
+    def test_NCT_ai(self):
+        """Test
+        No contributor user /
+            - add issues
+        """
+        self.client.force_authenticate(user=self.no_contrib)
+        response = self.client.post(path=self.url, data=[self._issue(0)])
+        self.assertEqual(response.status_code, 403)
+
+    def test_UUT_ai(self):
+        """Test
+        Unauthenticated user /
+            - add issues
+        """
+        response = self.client.post(path=self.url, data=[self._issue(0)])
+        self.assertEqual(response.status_code, 401)
@@ -0,0 +1,270 @@
+# Python Libs
+from datetime import timedelta
+
+# Django Libs
+from django.contrib.auth.models import User
+from django.test import override_settings
+from django.utils import timezone
+
+# Django REST Libs
+from rest_framework.test import (APITestCase,)
+
+# Locals Libs
+from ..changes import (changes,)
+from ..membership import (membership_cache,)
+from ..models import (Project,
+                      Contributor,
+                      Issue,
+                      Comment,)
+
+
+@override_settings(SOFTDESK={'CHANGES_SETTLE_TIME': 0})
+class ChangesTests(APITestCase):
+    """
+    Tests for the delta sync endpoint.
+
+    Tests :
+        Contributors tests: (CT)
+            + full sync (fs)
+            + issue updated since the cursor (iu)
+            + issue deleted since the cursor (id)
+            + comment and contributor deleted since the cursor (cd)
+            + contributor removed and added again (ra)
+            + pages of changes (pg)
+            + more changes at the same time than a page (st)
+            + changes of the settle time sent again (sa)
+            - invalid cursor (ic)
+            - deleted project (dp)
+        No contributors test: (NCT)
+            - changes (ch)
+    """
+
+    def setUp(self):
+        """Setup
+        Users
+            - author user
+            - contributor user
+            - no contributor user
+        Projet
+            - example project
+            - example issue
+            - example comment
+        """
+        membership_cache.clear()
+        user_form = {
+            'username': 'user1',
+            'password': 'Motdepasse123',
+        }
+        self.author = User.objects.create_user(**user_form)
+        user_form = {
+            'username': 'user2',
+            'password': 'Motdepasse123',
+        }
+        self.contrib = User.objects.create_user(**user_form)
+        user_form = {
+            'username': 'user3',
+            'password': 'Motdepasse123',
+        }
+        self.no_contrib = User.objects.create_user(**user_form)
+        self.project = Project.objects.create(title='project',
+                                              description='project test',
+                                              type='test',
+                                              author_user_id=self.author)
+        Contributor.objects.create(user_id=self.author,
+                                   project_id=self.project,
+                                   role='author',
+                                   permission='1')
+        Contributor.objects.create(user_id=self.contrib,
+                                   project_id=self.project,
+                                   role='test',
+                                   permission='0')
+        self.issue = self._issue('issue')
+        self.comment = Comment.objects.create(description='comment',
+                                              author_user_id=self.author,
+                                              issue_id=self.issue)
+        self.url = f'http://127.0.0.1:8000/projects/{self.project.id}/'
+        self.changes_url = f'{self.url}changes/'
+        self.client.force_authenticate(user=self.author)
+
+    def _issue(self, title):
+        return Issue.objects.create(title=title,
+                                    desc='issue desc',
+                                    tag='test',
+                                    priority='low',
+                                    status='created',
+                                    project_id=self.project,
+                                    author_user_id=self.author,
+                                    assignee_user_id=self.author)
+
+    def _changes(self, cursor=None):
+        data = {} if cursor is None else {'since': cursor}
+        response = self.client.get(path=self.changes_url, data=data)
+        self.assertEqual(response.status_code, 200)
+        return response.data
+
+    def test_CT_fs(self):
+        """Test
+        Contributor user /
+            + full sync
+        """
+        content = self._changes()
+        self.assertFalse(content['more'])
+        self.assertEqual(content['project']['title'], 'project')
+        self.assertEqual([issue['id'] for issue in content['issues']],
+                         [self.issue.id])
+        self.assertEqual([comment['id'] for comment in content['comments']],
+                         [self.comment.id])
+        self.assertEqual(len(content['contributors']), 2)
+        # Nothing changed since
+        content = self._changes(content['cursor'])
+        self.assertIsNone(content['project'])
+        self.assertEqual(content['issues'], [])
+        self.assertEqual(content['comments'], [])
+        self.assertEqual(content['contributors'], [])
+
+    def test_CT_iu(self):
+        """Test
+        Contributor user /
+            + issue updated since the cursor
+        """
+        cursor = self._changes()['cursor']
+        other = self._issue('other')
+        self.client.put(path=f'{self.url}issues/{self.issue.id}/',
+                        data={'title': 'updated'})
+        content = self._changes(cursor)
+        self.assertEqual([issue['title'] for issue in content['issues']],
+                         ['other', 'updated'])
+        self.assertEqual(content['issues'][0]['id'], other.id)
+        self.assertEqual(content['comments'], [])
+        self.assertIsNone(content['project'])
+
+    def test_CT_id(self):
+        """Test
+        Contributor user /
+            + issue deleted since the cursor
+        """
+        cursor = self._changes()['cursor']
+        self.client.delete(path=f'{self.url}issues/{self.issue.id}/')
+        content = self._changes(cursor)
+        self.assertEqual(content['issues'], [])
+        self.assertEqual(content['deleted'],
+                         {'issues': [self.issue.id],
+                          'comments': [],
+                          'contributors': []})
+
+    def test_CT_cd(self):
+        """Test
+        Contributor user /
+            + comment and contributor deleted since the cursor
+        """
+        cursor = self._changes()['cursor']
+        self.client.delete(path=f'{self.url}issues/{self.issue.id}/'
+                                f'comments/{self.comment.id}/')
+        self.client.delete(path=f'{self.url}users/{self.contrib.id}/')
+        content = self._changes(cursor)
+        self.assertEqual(content['deleted'],
+                         {'issues': [],
+                          'comments': [self.comment.id],
+                          'contributors': [self.contrib.id]})
+
+    def test_CT_ra(self):
+        """Test
+        Contributor user /
+            + contributor removed and added again : changed, not deleted
+        """
+        cursor = self._changes()['cursor']
+        self.client.delete(path=f'{self.url}users/{self.contrib.id}/')
+        response = self.client.post(path=f'{self.url}users/',
+                                    data={'user_id': self.contrib.id,
+                                          'role': 'developer'})
+        self.assertEqual(response.status_code, 201)
+        content = self._changes(cursor)
+        self.assertEqual([contributor['user_id']
+                          for contributor in content['contributors']],
+                         [self.contrib.id])
+        self.assertEqual(content['deleted']['contributors'], [])
+        # Removed again
+        self.client.delete(path=f'{self.url}users/{self.contrib.id}/')
+        content = self._changes(cursor)
+        self.assertEqual(content['contributors'], [])
+        self.assertEqual(content['deleted']['contributors'],
+                         [self.contrib.id])
+
+    def test_CT_pg(self):
+        """Test
+        Contributor user /
+            + pages of changes
+        """
+        ids = [self.issue.id] + [self._issue(f'issue {index}').id
+                                 for index in range(4)]
+        seen, cursor, calls = [], None, 0
+        while True:
+            content = changes(self.project, cursor, limit=2)
+            seen += [issue['id'] for issue in content['issues']]
+            cursor = content['cursor']
+            calls += 1
+            if not content['more']:
+                break
+        self.assertEqual(seen, ids)
+        self.assertEqual(calls, 3)
+
+    def test_CT_st(self):
+        """Test
+        Contributor user /
+            + more changes at the same time than a page
+        """
+        for index in range(3):
+            self._issue(f'issue {index}')
+        Issue.objects.update(updated_time=timezone.now()
+                             + timedelta(seconds=1))
+        content = changes(self.project, limit=2)
+        # Comment and contributors first, then every issue of that time
+        self.assertEqual(len(content['issues']), 0)
+        content = changes(self.project, content['cursor'], limit=2)
+        self.assertTrue(content['more'])
+        self.assertEqual(len(content['issues']), 4)
+        content = changes(self.project, content['cursor'], limit=2)
+        self.assertFalse(content['more'])
+        self.assertEqual(content['issues'], [])
+
+    @override_settings(SOFTDESK={'CHANGES_SETTLE_TIME': 60})
+    def test_CT_sa(self):
+        """Test
+        Contributor user /
+            + changes of the settle time sent again
+        """
+        cursor = self._changes()['cursor']
+        content = self._changes(cursor)
+        self.assertEqual([issue['id'] for issue in content['issues']],
+                         [self.issue.id])
+        self.assertEqual(len(content['contributors']), 2)
+
+    def test_CT_ic(self):
+        """Test
+        Contributor user /
+            - invalid cursor
+        """
+        response = self.client.get(path=self.changes_url,
+                                   data={'since': 'yesterday'})
+        self.assertEqual(response.status_code, 400)
+
+    def test_CT_dp(self):
+        """Test
+        Contributor user /
+            - deleted project
+        """
+        self.client.delete(path=self.url)
+        response = self.client.get(path=self.changes_url)
+        self.assertEqual(response.status_code, 410)
+        response = self.client.get(
+            path='http://127.0.0.1:8000/projects/0/changes/')
+        self.assertEqual(response.status_code, 404)
+
+    def test_NCT_ch(self):
+        """Test
+        No contributor user /
+            - changes
+        """
+        self.client.force_authenticate(user=self.no_contrib)
+        response = self.client.get(path=self.changes_url)
+        self.assertEqual(response.status_code, 403)
@@ -109,9 +109,9 @@ class CommentTests(APITestCase):
         issue_form = {
             'title': 'issue',
             'desc': 'issue desc',
-            'tag': 'test',
+            'tag': 'task',
             'priority': 'low',
-            'status': 'created',
+            'status': 'to do',
             'assignee_user_id': contrib_user,
             'author_user_id': author_user,
             'project_id': project
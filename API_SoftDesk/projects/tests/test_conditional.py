@@ -0,0 +1,263 @@
+# Python Libs
+from datetime import timedelta
+from unittest import mock
+
+# Django Libs
+from django.contrib.auth.models import User
+from django.utils import timezone
+from django.utils.http import http_date
+
+# Django REST Libs
+from rest_framework.test import (APITestCase,)
+
+# Locals Libs
+from ..membership import (membership_cache,)
+from ..models import (Project,
+                      Contributor,
+                      Issue,
+                      Comment,)
+
+
+class ConditionalGetTests(APITestCase):
+    """
+    Tests for the ETag / Last-Modified validators.
+
+    Tests :
+        Contributors tests: (CT)
+            + issues not modified (in)
+            + issues modified by a write (im)
+            + issues not modified since (is)
+            - writes in the same second, no Last-Modified (ws)
+            + comments modified by a write (cm)
+            + comment not modified (cn)
+            + projects not modified (pn)
+            + projects modified by a membership (pm)
+            + project modified by an update (pu)
+            - version written by an update (vu)
+        No contributors test: (NCT)
+            - issues with a known ETag (ie)
+    """
+
+    def setUp(self):
+        """Setup
+        Users
+            - author user
+            - no contributor user
+        Projet
+            - example project
+            - example issue
+            - example comment
+        """
+        membership_cache.clear()
+        user_form = {
+            'username': 'user1',
+            'password': 'Motdepasse123',
+        }
+        self.author = User.objects.create_user(**user_form)
+        user_form = {
+            'username': 'user2',
+            'password': 'Motdepasse123',
+        }
+        self.no_contrib = User.objects.create_user(**user_form)
+        self.project = Project.objects.create(title='project',
+                                              description='project test',
+                                              type='test',
+                                              author_user_id=self.author)
+        Contributor.objects.create(user_id=self.author,
+                                   project_id=self.project,
+                                   role='author',
+                                   permission='1')
+        self.issue = Issue.objects.create(title='issue',
+                                          desc='issue desc',
+                                          tag='test',
+                                          priority='low',
+                                          status='created',
+                                          project_id=self.project,
+                                          author_user_id=self.author,
+                                          assignee_user_id=self.author)
+        self.comment = Comment.objects.create(description='comment',
+                                              author_user_id=self.author,
+                                              issue_id=self.issue)
+        self.url = f'http://127.0.0.1:8000/projects/{self.project.id}/'
+        self.issues_url = f'{self.url}issues/'
+        self.comments_url = f'{self.issues_url}{self.issue.id}/comments/'
+        self.client.force_authenticate(user=self.author)
+
+    def _etag(self, url):
+        response = self.client.get(path=url)
+        self.assertEqual(response.status_code, 200)
+        return response['ETag']
+
+    def test_CT_in(self):
+        """Test
+        Contributor user /
+            + issues not modified
+        """
+        etag = self._etag(self.issues_url)
+        # Project scope only : no issue read, no serialization
+        with self.assertNumQueries(1):
+            response = self.client.get(path=self.issues_url,
+                                       HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['ETag'], etag)
+        # Pages have their own ETag
+        response = self.client.get(path=self.issues_url,
+                                   data={'page_size': 1},
+                                   HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+    def test_CT_im(self):
+        """Test
+        Contributor user /
+            + issues modified by a write
+        """
+        etag = self._etag(self.issues_url)
+        self.client.put(path=f'{self.issues_url}{self.issue.id}/',
+                        data={'title': 'updated'})
+        response = self.client.get(path=self.issues_url,
+                                   HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertEqual(response.data['results'][0]['title'], 'updated')
+
+    def test_CT_is(self):
+        """Test
+        Contributor user /
+            + issues not modified since
+        """
+        # Last write in a second that is over
+        Project.objects.filter(id=self.project.id).update(
+            version_time=timezone.now() - timedelta(seconds=10))
+        response = self.client.get(path=self.issues_url)
+        last_modified = response['Last-Modified']
+        response = self.client.get(path=self.issues_url,
+                                   HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, 304)
+
+    def test_CT_ws(self):
+        """Test
+        Contributor user /
+            - writes in the same second, no Last-Modified
+        """
+        now = timezone.now()
+        Project.objects.filter(id=self.project.id).update(version_time=now)
+        with mock.patch('django.utils.timezone.now', return_value=now):
+            response = self.client.get(path=self.issues_url)
+            self.assertFalse(response.has_header('Last-Modified'))
+            # Another write may follow in this second
+            response = self.client.get(
+                path=self.issues_url,
+                HTTP_IF_MODIFIED_SINCE=http_date(now.timestamp()))
+            self.assertEqual(response.status_code, 200)
+        later = now + timedelta(seconds=1)
+        with mock.patch('django.utils.timezone.now', return_value=later):
+            response = self.client.get(path=self.issues_url)
+        self.assertEqual(response['Last-Modified'],
+                         http_date(int(now.timestamp())))
+
+    def test_CT_cm(self):
+        """Test
+        Contributor user /
+            + comments modified by a write
+        """
+        etag = self._etag(self.comments_url)
+        response = self.client.get(path=self.comments_url,
+                                   HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.client.post(path=self.comments_url,
+                         data={'description': 'new comment'})
+        response = self.client.get(path=self.comments_url,
+                                   HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data['results']), 2)
+
+    def test_CT_cn(self):
+        """Test
+        Contributor user /
+            + comment not modified
+        """
+        url = f'{self.comments_url}{self.comment.id}/'
+        etag = self._etag(url)
+        response = self.client.get(path=url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.client.put(path=url, data={'description': 'updated'})
+        response = self.client.get(path=url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['description'], 'updated')
+
+    def test_CT_pn(self):
+        """Test
+        Contributor user /
+            + projects not modified
+        """
+        url = 'http://127.0.0.1:8000/projects/'
+        etag = self._etag(url)
+        response = self.client.get(path=url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+    def test_CT_pm(self):
+        """Test
+        Contributor user /
+            + projects modified by a membership
+        """
+        url = 'http://127.0.0.1:8000/projects/'
+        etag = self._etag(url)
+        project = Project.objects.create(title='other',
+                                         description='project test',
+                                         type='test',
+                                         author_user_id=self.no_contrib)
+        Contributor.objects.create(user_id=self.author,
+                                   project_id=project,
+                                   role='test',
+                                   permission='0')
+        response = self.client.get(path=url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data), 2)
+
+    def test_CT_pu(self):
+        """Test
+        Contributor user /
+            + project modified by an update
+        """
+        etag = self._etag(self.url)
+        response = self.client.get(path=self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.client.put(path=self.url, data={'title': 'updated'})
+        response = self.client.get(path=self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['title'], 'updated')
+
+    def test_CT_vu(self):
+        """Test
+        Contributor user /
+            - version written by an update : refused, ETag kept fresh
+        """
+        etag = self._etag(self.url)
+        self.assertNotIn('version', self.client.get(path=self.url).data)
+        version = Project.objects.get(id=self.project.id).version
+        for field, value in (('version', -1),
+                             ('version_time', '2000-01-01T00:00:00Z'),
+                             ('updated_time', '2000-01-01T00:00:00Z')):
+            response = self.client.put(path=self.url,
+                                       data={'title': 'updated',
+                                             field: value})
+            self.assertEqual(response.status_code, 400)
+        self.assertEqual(Project.objects.get(id=self.project.id).version,
+                         version)
+        self.client.post(path=self.issues_url,
+                         data={'title': 'issue', 'desc': 'issue desc',
+                               'tag': 'bug', 'priority': 'low',
+                               'status': 'to do'})
+        response = self.client.get(path=self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+    def test_NCT_ie(self):
+        """Test
+        No contributor user /
+            - issues with a known ETag
+        """
+        etag = self._etag(self.issues_url)
+        self.client.force_authenticate(user=self.no_contrib)
+        response = self.client.get(path=self.issues_url,
+                                   HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 403)
@@ -0,0 +1,171 @@
+# Python Libs
+from io import StringIO
+
+# Django Libs
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import override_settings
+
+# Django REST Libs
+from rest_framework.test import (APITestCase,)
+
+# Locals Libs
+from ..deletion import (process_deletions,
+                        request_deletion,
+                        run_deletion,)
+from ..membership import (membership_cache,)
+from ..models import (Project,
+                      Contributor,
+                      Issue,
+                      Comment,
+                      ProjectStats,
+                      ProjectDeletion,)
+
+
+class Crash(Exception):
+    """Worker stopped in the middle of a deletion"""
+
+
+class DeletionTests(APITestCase):
+    """
+    Tests for the batched project deletion.
+
+    Tests :
+        Owner tests: (OT)
+            + delete project in the request (di)
+            + delete project in background (db)
+            - delete project by an update (du)
+        Deletion job tests: (DT)
+            + resume after a crash (rc)
+    """
+
+    def setUp(self):
+        """Setup
+        Users
+            - author user
+        Projet
+            - example project
+            - 3 issues, 2 comments by issue
+        """
+        membership_cache.clear()
+        user_form = {
+            'username': 'user1',
+            'password': 'Motdepasse123',
+        }
+        self.author = User.objects.create_user(**user_form)
+        self.client.force_authenticate(user=self.author)
+        response = self.client.post(
+            path='http://127.0.0.1:8000/projects/',
+            data={'title': 'project',
+                  'description': 'project test',
+                  'type': 'test'})
+        self.project = Project.objects.get(id=response.data['id'])
+        self.url = f'http://127.0.0.1:8000/projects/{self.project.id}/'
+        for index in range(3):
+            response = self.client.post(
+                path=f'{self.url}issues/',
+                data={'title': f'issue {index}',
+                      'desc': 'issue desc',
+                      'tag': 'task',
+                      'priority': 'low',
+                      'status': 'to do'})
+            for comment in range(2):
+                self.client.post(
+                    path=f'{self.url}issues/{response.data["id"]}'
+                         '/comments/',
+                    data={'description': f'comment {comment}'})
+        # 6 comments, 3 issues, 1 contributor, stats, 1 project
+        self.rows = 11 + ProjectStats.objects.filter(
+            project_id=self.project).count()
+
+    def assertProjectRows(self, exist):
+        self.assertEqual(
+            Project.all_objects.filter(id=self.project.id).exists(), exist)
+        self.assertEqual(
+            Issue.objects.filter(project_id=self.project.id).exists(), exist)
+        self.assertEqual(
+            Comment.objects.filter(
+                issue_id__project_id=self.project.id).exists(), exist)
+        self.assertEqual(
+            Contributor.objects.filter(
+                project_id=self.project.id).exists(), exist)
+
+    def test_OT_di(self):
+        """Test
+        Owner /
+            + delete project in the request
+        """
+        response = self.client.delete(path=self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertProjectRows(False)
+        deletion = ProjectDeletion.objects.get(project_id=self.project.id)
+        self.assertEqual(deletion.stage, 'done')
+        self.assertEqual(deletion.deleted_rows, self.rows)
+
+    @override_settings(SOFTDESK={'PROJECT_DELETION': 'background'})
+    def test_OT_db(self):
+        """Test
+        Owner /
+            + delete project in background
+        """
+        # The worker thread is started on commit : not run here
+        with self.captureOnCommitCallbacks() as callbacks:
+            response = self.client.delete(path=self.url)
+        self.assertEqual(response.status_code, 202)
+        self.assertTrue(callbacks)
+        # Hidden while the rows still exist
+        self.assertProjectRows(True)
+        self.assertEqual(self.client.get(path=self.url).status_code, 404)
+        response = self.client.get(path='http://127.0.0.1:8000/projects/')
+        self.assertEqual(response.status_code, 204)
+        response = self.client.get(path=f'{self.url}issues/')
+        self.assertEqual(response.status_code, 404)
+        response = self.client.get(path=f'{self.url}changes/')
+        self.assertEqual(response.status_code, 410)
+        # Worker
+        out = StringIO()
+        call_command('process_deletions', stdout=out)
+        self.assertIn('Processed 1 deletion(s).', out.getvalue())
+        self.assertProjectRows(False)
+
+    def test_OT_du(self):
+        """Test
+        Owner /
+            - delete project by an update : refused, project kept
+        """
+        response = self.client.put(
+            path=self.url,
+            data={'title': 'updated',
+                  'deleted_time': '2000-01-01T00:00:00Z'})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self.client.get(path=self.url).status_code, 200)
+        self.assertFalse(ProjectDeletion.objects.exists())
+        response = self.client.put(path=self.url, data={'title': 'updated'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data[0]['title'], 'updated')
+        request_deletion(self.project)
+        response = self.client.put(path=self.url, data={'title': 'again'})
+        self.assertEqual(response.status_code, 404)
+
+    def test_DT_rc(self):
+        """Test
+        Deletion job /
+            + resume after a crash
+        """
+        deletion = request_deletion(self.project)
+
+        def crash(deletion):
+            if deletion.deleted_rows >= 4:
+                raise Crash()
+
+        with self.assertRaises(Crash):
+            run_deletion(deletion, batch_size=2, progress=crash)
+        deletion.refresh_from_db()
+        self.assertEqual(deletion.stage, 'comments')
+        self.assertEqual(deletion.deleted_rows, 4)
+        self.assertEqual(process_deletions(batch_size=2), 1)
+        self.assertProjectRows(False)
+        deletion.refresh_from_db()
+        self.assertEqual(deletion.stage, 'done')
+        self.assertEqual(deletion.deleted_rows, self.rows)
+        self.assertEqual(process_deletions(), 0)
@@ -0,0 +1,245 @@
+# Django Libs
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.test import override_settings
+
+# Django REST Libs
+from rest_framework.test import (APITestCase,)
+
+# Locals Libs
+from ..authentication import (ClaimsTokenObtainPairSerializer,)
+from ..events import (RESYNC,
+                      Subscription,
+                      event_bus,)
+from ..membership import (membership_cache,)
+from ..models import (Project,
+                      Contributor,)
+
+
+class RecordingBackend():
+    """Pub/sub backend of the tests : keep the published events"""
+    published = []
+
+    def subscribe(self, subscription):
+        pass
+
+    def unsubscribe(self, subscription):
+        pass
+
+    def publish(self, project_id, event):
+        self.published.append((project_id, event))
+
+
+@override_settings(SOFTDESK={'EVENTS_HEARTBEAT': 0.01,
+                             'EVENTS_STREAM_TIMEOUT': 0.2})
+class EventsTests(APITestCase):
+    """
+    Tests for the activity events stream.
+
+    Tests :
+        Contributors tests: (CT)
+            + issue events (ie)
+            + heartbeat (hb)
+            + no event of a rolled back write (rb)
+            + pluggable backend (pb)
+            + subscription by the first read of the stream (sf)
+            - too many streams (ms)
+            - events under ASGI (as)
+        Subscription tests: (ST)
+            + drop and resync marker (dr)
+        No contributors test: (NCT)
+            - events (ev)
+    """
+
+    def setUp(self):
+        """Setup
+        Users
+            - author user
+            - no contributor user
+        Projet
+            - example project
+        """
+        membership_cache.clear()
+        event_bus.reset()
+        self.addCleanup(event_bus.reset)
+        user_form = {
+            'username': 'user1',
+            'password': 'Motdepasse123',
+        }
+        self.author = User.objects.create_user(**user_form)
+        user_form = {
+            'username': 'user2',
+            'password': 'Motdepasse123',
+        }
+        self.no_contrib = User.objects.create_user(**user_form)
+        self.project = Project.objects.create(title='project',
+                                              description='project test',
+                                              type='test',
+                                              author_user_id=self.author)
+        Contributor.objects.create(user_id=self.author,
+                                   project_id=self.project,
+                                   role='author',
+                                   permission='1')
+        self.url = f'http://127.0.0.1:8000/projects/{self.project.id}/'
+        self.events_url = f'{self.url}events/'
+        self.client.force_authenticate(user=self.author)
+
+    def _subscribe(self):
+        response = self.client.get(path=self.events_url,
+                                   HTTP_ACCEPT='text/event-stream')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        stream = iter(response.streaming_content)
+        # Until the end of the stream (EVENTS_STREAM_TIMEOUT)
+        self.addCleanup(list, stream)
+        self.assertEqual(next(stream), b': connected\n\n')
+        return stream
+
+    def _next_event(self, stream):
+        """Next message of the stream, heartbeats skipped"""
+        for message in stream:
+            if not message.startswith(b':'):
+                return message.decode()
+
+    def test_CT_ie(self):
+        """Test
+        Contributor user /
+            + issue events
+        """
+        stream = self._subscribe()
+        issue = {
+            'title': 'issue',
+            'desc': 'issue desc',
+            'tag': 'task',
+            'priority': 'low',
+            'status': 'to do',
+        }
+        with self.captureOnCommitCallbacks(execute=True):
+            created = self.client.post(path=f'{self.url}issues/',
+                                       data=issue)
+        message = self._next_event(stream)
+        self.assertIn('event: issue.created\n', message)
+        self.assertIn(f'"id": {created.data["id"]}', message)
+        self.assertIn('"title": "issue"', message)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.delete(
+                path=f'{self.url}issues/{created.data["id"]}/')
+        self.assertIn('event: issue.deleted\n', self._next_event(stream))
+        # Closed stream : no more subscriber
+        list(stream)
+        self.assertEqual(event_bus.backend.subscribers(self.project.id), 0)
+
+    def test_CT_hb(self):
+        """Test
+        Contributor user /
+            + heartbeat
+        """
+        stream = self._subscribe()
+        self.assertEqual(next(stream), b': heartbeat\n\n')
+
+    def test_CT_rb(self):
+        """Test
+        Contributor user /
+            + no event of a rolled back write
+        """
+        subscription = event_bus.subscribe(self.project.id)
+        self.addCleanup(event_bus.unsubscribe, subscription)
+        with self.captureOnCommitCallbacks(execute=True):
+            try:
+                with transaction.atomic():
+                    event_bus.publish(self.project.id, "issue", "created", 1)
+                    raise ValueError
+            except ValueError:
+                pass
+            event_bus.publish(self.project.id, "issue", "created", 2)
+        self.assertEqual(subscription.get(0)['id'], 2)
+        self.assertIsNone(subscription.get(0))
+
+    @override_settings(SOFTDESK={
+        'EVENTS_BACKEND': 'projects.tests.test_events.RecordingBackend'})
+    def test_CT_pb(self):
+        """Test
+        Contributor user /
+            + pluggable backend
+        """
+        RecordingBackend.published = []
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.put(path=self.url, data={'title': 'updated'})
+        [(project_id, event)] = RecordingBackend.published
+        self.assertEqual(event['kind'], 'project')
+        self.assertEqual(event['action'], 'updated')
+        self.assertEqual(event['data']['title'], 'updated')
+
+    def test_CT_sf(self):
+        """Test
+        Contributor user /
+            + subscription by the first read of the stream
+        """
+        response = self.client.get(path=self.events_url,
+                                   HTTP_ACCEPT='text/event-stream')
+        self.assertEqual(response.status_code, 200)
+        # Response not sent : no subscription
+        self.assertEqual(event_bus.backend.subscribers(self.project.id), 0)
+        stream = iter(response.streaming_content)
+        next(stream)
+        self.assertEqual(event_bus.backend.subscribers(self.project.id), 1)
+        self.assertEqual(event_bus.streams(), 1)
+        # Until the end of the stream
+        list(stream)
+        self.assertEqual(event_bus.backend.subscribers(self.project.id), 0)
+        self.assertEqual(event_bus.streams(), 0)
+
+    @override_settings(SOFTDESK={'EVENTS_HEARTBEAT': 0.01,
+                                 'EVENTS_STREAM_TIMEOUT': 0.2,
+                                 'EVENTS_MAX_STREAMS': 1})
+    def test_CT_ms(self):
+        """Test
+        Contributor user /
+            - too many streams
+        """
+        stream = self._subscribe()
+        response = self.client.get(path=self.events_url,
+                                   HTTP_ACCEPT='text/event-stream')
+        self.assertEqual(response.status_code, 503)
+        self.assertIn(b'Too many streams.', response.content)
+        list(stream)
+        self._subscribe()
+
+    async def test_CT_as(self):
+        """Test
+        Contributor user /
+            - events under ASGI : blocking stream refused
+        """
+        token = ClaimsTokenObtainPairSerializer.get_token(
+            self.author).access_token
+        response = await self.async_client.get(
+            self.events_url, authorization=f'Bearer {token}')
+        self.assertEqual(response.status_code, 501)
+        self.assertEqual(event_bus.streams(), 0)
+
+    def test_ST_dr(self):
+        """Test
+        Subscription /
+            + drop and resync marker
+        """
+        subscription = Subscription(self.project.id, 2)
+        for index in range(3):
+            subscription.put({'id': index})
+        # Dropped until the marker is read
+        subscription.put({'id': 3})
+        self.assertIs(subscription.get(0), RESYNC)
+        self.assertIsNone(subscription.get(0))
+        subscription.put({'id': 4})
+        self.assertEqual(subscription.get(0), {'id': 4})
+
+    def test_NCT_ev(self):
+        """Test
+        No contributor user /
+            - events
+        """
+        self.client.force_authenticate(user=self.no_contrib)
+        response = self.client.get(path=self.events_url,
+                                   HTTP_ACCEPT='text/event-stream')
+        self.assertEqual(response.status_code, 403)
+        self.assertIn(b'event: stream.error\n', response.content)
+        self.assertEqual(event_bus.backend.subscribers(self.project.id), 0)
@@ -0,0 +1,166 @@
+# Python Libs
+import json
+from io import StringIO
+from unittest import mock
+
+# Django Libs
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+# Django REST Libs
+from rest_framework.test import (APITestCase,)
+
+# Locals Libs
+from ..authentication import (ClaimsTokenObtainPairSerializer,)
+from ..export import (export_project,)
+from ..membership import (membership_cache,)
+from ..models import (Project,
+                      Contributor,
+                      Issue,
+                      Comment,)
+from ..serializers import (CommentSerializer,)
+
+
+class ExportTests(APITestCase):
+    """
+    Tests for the NDJSON export of a project.
+
+    Tests :
+        Contributors tests: (CT)
+            + export project (ep)
+            + converters compiled once by kind (cc)
+            - export project under ASGI (as)
+        No contributors test: (NCT)
+            - export project (ep)
+        Unauthenticated user tests : (UUT)
+            - export project (ep)
+        Command tests: (CMD)
+            + export project (ep)
+            - unknown project (up)
+    """
+
+    def setUp(self):
+        """Setup
+        Users
+            - author user
+            - no contributor user
+        Projet
+            - example project
+        Issues
+            - 2 issues, 3 comments on each
+        """
+        membership_cache.clear()
+        user_form = {
+            'username': 'user1',
+            'password': 'Motdepasse123',
+        }
+        self.author = User.objects.create_user(**user_form)
+        user_form = {
+            'username': 'user2',
+            'password': 'Motdepasse123',
+        }
+        self.no_contrib = User.objects.create_user(**user_form)
+        self.project = Project.objects.create(title='project',
+                                              description='project test',
+                                              type='test',
+                                              author_user_id=self.author)
+        Contributor.objects.create(user_id=self.author,
+                                   project_id=self.project,
+                                   role='author',
+                                   permission='1')
+        for index in range(2):
+            issue = Issue.objects.create(title=f'issue {index}',
+                                         desc='issue desc',
+                                         tag='test',
+                                         priority='low',
+                                         status='created',
+                                         assignee_user_id=self.author,
+                                         author_user_id=self.author,
+                                         project_id=self.project)
+            for comment in range(3):
+                Comment.objects.create(description=f'comment {comment}',
+                                       author_user_id=self.author,
+                                       issue_id=issue)
+        self.url = (f'http://127.0.0.1:8000/projects/'
+                    f'{self.project.id}/export/')
+
+    def assertExport(self, lines):
+        """Records of the example project"""
+        records = [json.loads(line) for line in lines if line]
+        kinds = [record['type'] for record in records]
+        self.assertEqual(kinds, ['project', 'contributor'] +
+                                ['issue'] * 2 + ['comment'] * 6)
+        self.assertEqual(records[0]['data']['title'], 'project')
+        self.assertEqual(records[2]['data']['title'], 'issue 0')
+
+    def test_CT_ep(self):
+        """Test
+        Contributor user /
+            + export project
+        """
+        self.client.force_authenticate(user=self.author)
+        response = self.client.get(path=self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        content = b''.join(response.streaming_content).decode()
+        self.assertExport(content.split('\n'))
+
+    def test_CT_cc(self):
+        """Test
+        Contributor user /
+            + converters compiled once by kind
+        """
+        fields = len(CommentSerializer.compiled_fields())
+        with mock.patch.object(CommentSerializer, '_converter',
+                               wraps=CommentSerializer._converter) as spy:
+            self.assertExport(list(export_project(self.project,
+                                                  chunk_size=2)))
+        # Not once by row (6 comments)
+        self.assertEqual(spy.call_count, fields)
+
+    async def test_CT_as(self):
+        """Test
+        Contributor user /
+            - export project under ASGI : sync-only queries of the stream
+        """
+        token = ClaimsTokenObtainPairSerializer.get_token(
+            self.author).access_token
+        response = await self.async_client.get(
+            self.url, authorization=f'Bearer {token}')
+        self.assertEqual(response.status_code, 501)
+
+    def test_NCT_ep(self):
+        """Test
+        No contributor user /
+            - export project
+        """
+        self.client.force_authenticate(user=self.no_contrib)
+        response = self.client.get(path=self.url)
+        self.assertEqual(response.status_code, 403)
+
+    def test_UUT_ep(self):
+        """Test
+        Unauthenticated user /
+            - export project
+        """
+        response = self.client.get(path=self.url)
+        self.assertEqual(response.status_code, 401)
+
+    def test_CMD_ep(self):
+        """Test
+        Command /
+            + export project
+        """
+        output = StringIO()
+        call_command('export_project', self.project.id,
+                     '--chunk-size', '2', stdout=output)
+        self.assertExport(output.getvalue().split('\n'))
+
+    def test_CMD_up(self):
+        """Test
+        Command /
+            - unknown project
+        """
+        with self.assertRaises(CommandError):
+            call_command('export_project', 999, stdout=StringIO())
@@ -0,0 +1,173 @@
+# Python Libs
+from datetime import timedelta
+
+# Django Libs
+from django.contrib.auth.models import User
+from django.utils import timezone
+
+# Django REST Libs
+from rest_framework.test import (APITestCase,)
+
+# Locals Libs
+from ..membership import (membership_cache,)
+from ..models import (Project,
+                      Contributor,
+                      Issue,)
+
+
+class IssueFilterTests(APITestCase):
+    """
+    Tests for the filters and ordering of the issue list.
+
+    Tests :
+        + filter by status (fs)
+        + filter by several values (fv)
+        + combined filters (cf)
+        + created_time range (cr)
+        + descending ordering with pagination (do)
+        + format parameter (fp)
+        - unknown filter (uf)
+        - invalid filter value (iv)
+        - invalid ordering (io)
+        - invalid filter with a matching If-None-Match (in)
+    """
+
+    def setUp(self):
+        """Setup
+        Users
+            - author user
+            - contributor user
+        Projet
+            - example project
+        Issues
+            - 6 issues, one day apart, alternating status, priority
+              and assignee
+        """
+        membership_cache.clear()
+        self.author = User.objects.create_user(username='user1',
+                                               password='Motdepasse123')
+        self.contrib = User.objects.create_user(username='user2',
+                                                password='Motdepasse123')
+        self.project = Project.objects.create(title='project',
+                                              description='project test',
+                                              type='test',
+                                              author_user_id=self.author)
+        Contributor.objects.create(user_id=self.author,
+                                   project_id=self.project,
+                                   role='author',
+                                   permission='1')
+        Contributor.objects.create(user_id=self.contrib,
+                                   project_id=self.project,
+                                   role='developer',
+                                   permission='0')
+        self.start = timezone.now() - timedelta(days=10)
+        self.issues = []
+        for index in range(6):
+            issue = Issue.objects.create(
+                title=f'issue {index}',
+                desc='issue desc',
+                tag='bug' if index < 3 else 'task',
+                priority=('low', 'high')[index % 2],
+                status=('to do', 'in progress', 'done')[index % 3],
+                assignee_user_id=(self.author, self.contrib)[index % 2],
+                author_user_id=self.author,
+                project_id=self.project)
+            Issue.objects.filter(id=issue.id).update(
+                created_time=self.start + timedelta(days=index))
+            self.issues.append(issue.id)
+        self.client.force_authenticate(user=self.author)
+        self.url = (f'http://testserver/projects/'
+                    f'{self.project.id}/issues/')
+
+    def _ids(self, query, status_code=200):
+        response = self.client.get(path=self.url, data=query)
+        self.assertEqual(response.status_code, status_code)
+        if status_code != 200:
+            return response.data['detail']
+        return [issue['id'] for issue in response.data['results']]
+
+    def test_fs(self):
+        """Test
+        + filter by status
+        """
+        self.assertEqual(self._ids({'status': 'done'}),
+                         [self.issues[2], self.issues[5]])
+
+    def test_fv(self):
+        """Test
+        + filter by several values
+        """
+        self.assertEqual(self._ids({'status': 'to do,done'}),
+                         [self.issues[index] for index in (0, 2, 3, 5)])
+
+    def test_cf(self):
+        """Test
+        + combined filters : my open high-priority bugs
+        """
+        ids = self._ids({'assignee_user_id': self.contrib.id,
+                         'priority': 'high',
+                         'tag': 'bug',
+                         'status': 'in progress,to do'})
+        self.assertEqual(ids, [self.issues[1]])
+        self.assertEqual(self._ids({'author_user_id': self.contrib.id}), [])
+
+    def test_cr(self):
+        """Test
+        + created_time range : after inclusive, before exclusive
+        """
+        ids = self._ids({
+            'created_after': (self.start + timedelta(days=1)).isoformat(),
+            'created_before': (self.start + timedelta(days=3)).isoformat()})
+        self.assertEqual(ids, self.issues[1:3])
+
+    def test_do(self):
+        """Test
+        + descending ordering with pagination
+        """
+        ids = []
+        url = f'{self.url}?ordering=-created_time&tag=bug&page_size=2'
+        while url:
+            response = self.client.get(path=url)
+            self.assertEqual(response.status_code, 200)
+            ids += [issue['id'] for issue in response.data['results']]
+            url = response.data['next']
+        self.assertEqual(ids, self.issues[2::-1])
+
+    def test_fp(self):
+        """Test
+        + format parameter
+        """
+        self.assertEqual(self._ids({'format': 'json', 'status': 'done'}),
+                         [self.issues[2], self.issues[5]])
+
+    def test_uf(self):
+        """Test
+        - unknown filter
+        """
+        detail = self._ids({'title': 'issue 1'}, status_code=400)
+        self.assertEqual(detail, 'Unknown filter title.')
+
+    def test_iv(self):
+        """Test
+        - invalid filter value
+        """
+        self._ids({'assignee_user_id': 'me'}, status_code=400)
+        self._ids({'created_after': 'yesterday'}, status_code=400)
+        self._ids({'status': 'done,'}, status_code=400)
+
+    def test_io(self):
+        """Test
+        - invalid ordering
+        """
+        self._ids({'ordering': 'title'}, status_code=400)
+
+    def test_in(self):
+        """Test
+        - invalid filter with a matching If-None-Match : 400, not 304
+        """
+        response = self.client.get(path=self.url, data={'status': 'done,'},
+                                   HTTP_IF_NONE_MATCH='*')
+        self.assertEqual(response.status_code, 400)
+        response = self.client.get(path=self.url, data={'title': 'issue'},
+                                   HTTP_IF_NONE_MATCH='*')
+        self.assertEqual(response.status_code, 400)
@@ -0,0 +1,177 @@
+# Python Libs
+from unittest import skipUnless
+
+# Django Libs
+from django.contrib.auth.models import User
+from django.db import connection, IntegrityError
+from django.utils import timezone
+
+# Django REST Libs
+from rest_framework.test import (APITestCase,)
+
+# Locals Libs
+from ..crud_issue import (AssignedIssueCRUD,)
+from ..models import (Project,
+                      Contributor,
+                      Issue,
+                      Comment,)
+from ..pagination import (KeysetPagination,)
+
+
+@skipUnless(connection.vendor == 'sqlite', 'SQLite query plans')
+class QueryPlanTests(APITestCase):
+    """
+    Tests for the indexes of the hot lookups (EXPLAIN QUERY PLAN).
+
+    Tests :
+        + contributor by (project_id, user_id) (cpu)
+        + projects of a user (pu)
+        + issues of a project by created_time (ip)
+        + next page of issues (np)
+        + comments of an issue by created_time (ci)
+        + issues filtered by status (fs)
+        + issues filtered by priority, descending (fp)
+        + issues filtered by assignee and status (fa)
+        + issues assigned to a user, across projects (ia)
+    """
+
+    def assertPlanUses(self, queryset, index):
+        """Query plan searches the index, without sorting"""
+        plan = queryset.explain()
+        self.assertIn('SEARCH', plan)
+        self.assertIn(index, plan)
+        self.assertNotIn('TEMP B-TREE', plan)
+
+    def test_cpu(self):
+        """Test
+        + contributor by (project_id, user_id)
+        """
+        plan = Contributor.objects.filter(project_id=1,
+                                          user_id=2).explain()
+        self.assertIn('INDEX', plan)
+        self.assertIn('project_id_id=? AND user_id_id=?', plan)
+
+    def test_pu(self):
+        """Test
+        + projects of a user
+        """
+        queryset = Contributor.objects.filter(
+            user_id=2).values_list('project_id')
+        self.assertPlanUses(queryset, 'COVERING INDEX '
+                                      'contributor_user_project_idx')
+
+    def test_ip(self):
+        """Test
+        + issues of a project by created_time
+        """
+        queryset = Issue.objects.filter(project_id=1).order_by(
+            'created_time', 'id')
+        self.assertPlanUses(queryset, 'issue_project_created_idx')
+
+    def test_np(self):
+        """Test
+        + next page of issues
+        """
+        after = KeysetPagination().after([timezone.now(), 3])
+        queryset = Issue.objects.filter(project_id=1).filter(
+            after).order_by('created_time', 'id')
+        self.assertPlanUses(queryset, 'issue_project_created_idx')
+
+    def test_ci(self):
+        """Test
+        + comments of an issue by created_time
+        """
+        queryset = Comment.objects.filter(issue_id=1).order_by(
+            'created_time', 'id')
+        self.assertPlanUses(queryset, 'comment_issue_created_idx')
+
+    def test_fs(self):
+        """Test
+        + issues filtered by status
+        """
+        queryset = Issue.objects.filter(project_id=1,
+                                        status='done').order_by(
+            'created_time', 'id')
+        self.assertPlanUses(queryset, 'issue_project_status_idx')
+
+    def test_fp(self):
+        """Test
+        + issues filtered by priority, descending
+        """
+        queryset = Issue.objects.filter(project_id=1,
+                                        priority='high').order_by(
+            '-created_time', '-id')
+        self.assertPlanUses(queryset, 'issue_project_priority_idx')
+
+    def test_fa(self):
+        """Test
+        + issues filtered by assignee and status
+        """
+        queryset = Issue.objects.filter(project_id=1,
+                                        assignee_user_id=2,
+                                        status='to do').order_by(
+            'created_time', 'id')
+        self.assertPlanUses(queryset, 'issue_project_assignee_idx')
+
+    def test_ia(self):
+        """Test
+        + issues assigned to a user, across projects
+        """
+        queryset = AssignedIssueCRUD.assigned_queryset(2).order_by(
+            'created_time', 'id')
+        self.assertPlanUses(queryset, 'issue_assignee_created_idx')
+
+
+class ContributorConstraintTests(APITestCase):
+    """
+    Tests for the unique (project_id, user_id) membership.
+
+    Tests :
+        - duplicated membership (dm)
+        + add existing contributor (ae)
+    """
+
+    def setUp(self):
+        """Setup
+        Users
+            - author user
+        Projet
+            - example project
+        """
+        user_form = {
+            'username': 'user1',
+            'password': 'Motdepasse123',
+        }
+        self.author = User.objects.create_user(**user_form)
+        self.project = Project.objects.create(title='project',
+                                              description='project test',
+                                              type='test',
+                                              author_user_id=self.author)
+        Contributor.objects.create(user_id=self.author,
+                                   project_id=self.project,
+                                   role='author',
+                                   permission='1')
+
+    def test_dm(self):
+        """Test
+        - duplicated membership
+        """
+        with self.assertRaises(IntegrityError):
+            Contributor.objects.create(user_id=self.author,
+                                       project_id=self.project,
+                                       role='test',
+                                       permission='0')
+
+    def test_ae(self):
+        """Test
+        + add existing contributor
+        """
+        url = f'http://127.0.0.1:8000/projects/{self.project.id}/users/'
+        self.client.force_authenticate(user=self.author)
+        contrib_form = {
+            'user_id': self.author.id,
+            'role': 'test',
+        }
+        response = self.client.post(path=url, data=contrib_form)
+        self.assertEqual(response.status_code, 208)
+        self.assertEqual(Contributor.objects.count(), 1)
@@ -0,0 +1,121 @@
+# Python Libs
+import json
+
+# Django Libs
+from django.contrib.auth.models import User
+from django.test import override_settings
+
+# Django REST Libs
+from rest_framework.test import (APITestCase,)
+
+# Locals Libs
+from ..membership import (membership_cache,)
+from ..models import (Project,
+                      Contributor,)
+
+
+@override_settings(SOFTDESK={'INSTRUMENTATION_SAMPLE_RATE': 1,
+                             'SERVER_TIMING': True})
+class InstrumentationTests(APITestCase):
+    """
+    Tests for the query count and timing middleware.
+
+    Tests :
+        Contributors tests: (CT)
+            + Server-Timing header (st)
+            + log line keyed by action (ll)
+            + log line of an inherited action (li)
+            - request not sampled (ns)
+            - Server-Timing header not enabled (nh)
+    """
+
+    def setUp(self):
+        """Setup
+        Users
+            - author user
+        Projet
+            - example project
+        """
+        membership_cache.clear()
+        user_form = {
+            'username': 'user1',
+            'password': 'Motdepasse123',
+        }
+        self.author = User.objects.create_user(**user_form)
+        self.project = Project.objects.create(title='project',
+                                              description='project test',
+                                              type='test',
+                                              author_user_id=self.author)
+        Contributor.objects.create(user_id=self.author,
+                                   project_id=self.project,
+                                   role='author',
+                                   permission='1')
+        self.client.force_authenticate(user=self.author)
+
+    def _log(self, url):
+        with self.assertLogs('projects.instrumentation', 'INFO') as logs:
+            response = self.client.get(path=url)
+        self.assertEqual(len(logs.records), 1)
+        return response, json.loads(logs.records[0].getMessage())
+
+    def test_CT_st(self):
+        """Test
+        Contributor user /
+            + Server-Timing header
+        """
+        url = f'http://127.0.0.1:8000/projects/{self.project.id}/'
+        with self.assertNumQueries(2):
+            response = self.client.get(path=url)
+        self.assertEqual(response.status_code, 200)
+        metrics = [metric.split(';')[0]
+                   for metric in response['Server-Timing'].split(', ')]
+        self.assertEqual(metrics,
+                         ['db', 'serialize', 'permissions', 'total'])
+        self.assertIn('desc="2 queries"', response['Server-Timing'])
+
+    def test_CT_ll(self):
+        """Test
+        Contributor user /
+            + log line keyed by action
+        """
+        url = (f'http://127.0.0.1:8000/projects/{self.project.id}/'
+               f'issues/')
+        response, line = self._log(url)
+        self.assertEqual(line['view'], 'IssueCRUD.list')
+        self.assertEqual(line['status'], response.status_code)
+        self.assertEqual(line['method'], 'GET')
+        for measure in ('queries', 'db_ms', 'serialize_ms',
+                        'permissions_ms', 'total_ms'):
+            self.assertIn(measure, line)
+        self.assertGreater(line['queries'], 0)
+
+    def test_CT_li(self):
+        """Test
+        Contributor user /
+            + log line of an inherited action
+        """
+        _, line = self._log('http://127.0.0.1:8000/projects/')
+        self.assertEqual(line['view'], 'ProjectCRUD.list')
+        _, line = self._log(
+            f'http://127.0.0.1:8000/projects/{self.project.id}/stats/')
+        self.assertEqual(line['view'], 'ProjectCRUD.stats')
+
+    @override_settings(SOFTDESK={'INSTRUMENTATION_SAMPLE_RATE': 0})
+    def test_CT_ns(self):
+        """Test
+        Contributor user /
+            - request not sampled
+        """
+        response = self.client.get(path='http://127.0.0.1:8000/projects/')
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn('Server-Timing', response)
+
+    @override_settings(SOFTDESK={'INSTRUMENTATION_SAMPLE_RATE': 1})
+    def test_CT_nh(self):
+        """Test
+        Contributor user /
+            - Server-Timing header not enabled : log line only
+        """
+        response, line = self._log('http://127.0.0.1:8000/projects/')
+        self.assertEqual(line['view'], 'ProjectCRUD.list')
+        self.assertNotIn('Server-Timing', response)
@@ -138,9 +138,9 @@ class IssueTests(APITestCase):
         issue_form = {
             'title': 'issue',
             'desc': 'issue desc',
-            'tag': 'test',
+            'tag': 'task',
             'priority': 'low',
-            'status': 'created',
+            'status': 'to do',
             'assignee_user_id': 2,
         }
         response = self.client.post(path=url, data=issue_form)
@@ -159,9 +159,9 @@ class IssueTests(APITestCase):
         issue_form = {
             'title': 'issue',
             'desc': 'issue desc',
-            'tag': 'test',
+            'tag': 'task',
             'priority': 'low',
-            'status': 'created',
+            'status': 'to do',
         }
         response = self.client.post(path=url, data=issue_form)
         self.assertEqual(response.status_code, 201)
@@ -177,9 +177,9 @@ class IssueTests(APITestCase):
         issue_form = {
             'title': 'issue',
             'desc': 'issue desc',
-            'tag': 'test',
+            'tag': 'task',
             'priority': 'low',
-            'status': 'created',
+            'status': 'to do',
         }
         self.client.force_authenticate(user=user)
         self.client.post(path=url, data=issue_form)
@@ -199,9 +199,9 @@ class IssueTests(APITestCase):
         issue_form = {
             'title': 'issue',
             'desc': 'issue desc',
-            'tag': 'test',
+            'tag': 'task',
             'priority': 'low',
-            'status': 'created',
+            'status': 'to do',
         }
         self.client.force_authenticate(user=user)
         self.client.post(path=url, data=issue_form)
@@ -227,9 +227,9 @@ class IssueTests(APITestCase):
         issue_form = {
             'title': 'issue',
             'desc': 'issue desc',
-            'tag': 'test',
+            'tag': 'task',
             'priority': 'low',
-            'status': 'created',
+            'status': 'to do',
         }
         self.client.force_authenticate(user=user)
         self.client.post(path=url, data=issue_form)
@@ -262,9 +262,9 @@ class IssueTests(APITestCase):
         issue_form = {
             'title': 'issue',
             'desc': 'issue desc',
-            'tag': 'test',
+            'tag': 'task',
             'priority': 'low',
-            'status': 'created',
+            'status': 'to do',
             'assignee_user_id': 1,
         }
         response = self.client.post(path=url, data=issue_form)
@@ -281,9 +281,9 @@ class IssueTests(APITestCase):
         issue_form = {
             'title': 'issue',
             'desc': 'issue desc',
-            'tag': 'test',
+            'tag': 'task',
             'priority': 'low',
-            'status': 'created',
+            'status': 'to do',
         }
         self.client.force_authenticate(user=user)
         self.client.post(path=url, data=issue_form)
@@ -304,9 +304,9 @@ class IssueTests(APITestCase):
         issue_form = {
             'title': 'issue',
             'desc': 'issue desc',
-            'tag': 'test',
+            'tag': 'task',
             'priority': 'low',
-            'status': 'created',
+            'status': 'to do',
         }
         self.client.force_authenticate(user=user)
         self.client.post(path=url, data=issue_form)
@@ -334,9 +334,9 @@ class IssueTests(APITestCase):
         issue_form = {
             'title': 'issue',
             'desc': 'issue desc',
-            'tag': 'test',
+            'tag': 'task',
             'priority': 'low',
-            'status': 'created',
+            'status': 'to do',
         }
         self.client.force_authenticate(user=user)
         self.client.post(path=url, data=issue_form)
@@ -371,9 +371,9 @@ class IssueTests(APITestCase):
         issue_form = {
             'title': 'issue',
             'desc': 'issue desc',
-            'tag': 'test',
+            'tag': 'task',
             'priority': 'low',
-            'status': 'created',
+            'status': 'to do',
         }
         response = self.client.post(path=url, data=issue_form)
         self.assertEqual(response.status_code, 403)
@@ -389,9 +389,9 @@ class IssueTests(APITestCase):
         issue_form = {
             'title': 'issue',
             'desc': 'issue desc',
-            'tag': 'test',
+            'tag': 'task',
             'priority': 'low',
-            'status': 'created',
+            'status': 'to do',
         }
         self.client.force_authenticate(user=user)
         self.client.post(path=url, data=issue_form)
@@ -412,9 +412,9 @@ class IssueTests(APITestCase):
         issue_form = {
             'title': 'issue',
             'desc': 'issue desc',
-            'tag': 'test',
+            'tag': 'task',
             'priority': 'low',
-            'status': 'created',
+            'status': 'to do',
         }
         self.client.force_authenticate(user=user)
         self.client.post(path=url, data=issue_form)
@@ -439,9 +439,9 @@ class IssueTests(APITestCase):
         issue_form = {
             'title': 'issue',
             'desc': 'issue desc',
-            'tag': 'test',
+            'tag': 'task',
             'priority': 'low',
-            'status': 'created',
+            'status': 'to do',
         }
         self.client.force_authenticate(user=user)
         self.client.post(path=url, data=issue_form)
@@ -470,9 +470,9 @@ class IssueTests(APITestCase):
         issue_form = {
             'title': 'issue',
             'desc': 'issue desc',
-            'tag': 'test',
+            'tag': 'task',
             'priority': 'low',
-            'status': 'created',
+            'status': 'to do',
         }
         response = self.client.post(path=url, data=issue_form)
         self.assertEqual(response.status_code, 401)
@@ -487,9 +487,9 @@ class IssueTests(APITestCase):
         issue_form = {
             'title': 'issue',
             'desc': 'issue desc',
-            'tag': 'test',
+            'tag': 'task',
             'priority': 'low',
-            'status': 'created',
+            'status': 'to do',
         }
         self.client.force_authenticate(user=user)
         self.client.post(path=url, data=issue_form)
@@ -509,9 +509,9 @@ class IssueTests(APITestCase):
         issue_form = {
             'title': 'issue',
             'desc': 'issue desc',
-            'tag': 'test',
+            'tag': 'task',
             'priority': 'low',
-            'status': 'created',
+            'status': 'to do',
         }
         self.client.force_authenticate(user=user)
         self.client.post(path=url, data=issue_form)
@@ -534,9 +534,9 @@ class IssueTests(APITestCase):
         issue_form = {
             'title': 'issue',
             'desc': 'issue desc',
-            'tag': 'test',
+            'tag': 'task',
             'priority': 'low',
-            'status': 'created',
+            'status': 'to do',
         }
         self.client.force_authenticate(user=user)
         self.client.post(path=url, data=issue_form)
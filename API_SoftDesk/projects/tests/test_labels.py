@@ -0,0 +1,287 @@
+# Python Libs
+from importlib import import_module
+
+# Django Libs
+from django.contrib.auth.models import User
+from django.db import connection, transaction
+from django.db.migrations.executor import MigrationExecutor
+from django.test import TransactionTestCase
+
+# Django REST Libs
+from rest_framework.test import (APITestCase,)
+
+# Locals Libs
+from ..labels import (labels,
+                      UNKNOWN,)
+from ..membership import (membership_cache,)
+from ..models import (Project,
+                      Contributor,
+                      IssueLabel,)
+from ..stats import (project_stats,
+                     rebuild_project_stats,)
+
+
+class LabelTests(APITestCase):
+    """
+    Tests for the issue labels stored as codes.
+
+    Tests :
+        + names in the JSON, codes in the database (jc)
+        + custom names get new codes (cn)
+        + labels of a transaction cached once committed (tq)
+        + labels of a rolled back transaction forgotten (rb)
+        + counters by label (cl)
+        - filter by unknown name (fu)
+        - write of unknown names, no label created (un)
+    """
+
+    def setUp(self):
+        """Setup
+        Users
+            - author user
+        Projet
+            - example project
+        """
+        membership_cache.clear()
+        labels.clear()
+        self.author = User.objects.create_user(username='user1',
+                                               password='Motdepasse123')
+        self.project = Project.objects.create(title='project',
+                                              description='project test',
+                                              type='test',
+                                              author_user_id=self.author)
+        Contributor.objects.create(user_id=self.author,
+                                   project_id=self.project,
+                                   role='author',
+                                   permission='1')
+        self.client.force_authenticate(user=self.author)
+        self.url = (f'http://testserver/projects/'
+                    f'{self.project.id}/issues/')
+
+    def tearDown(self):
+        labels.clear()
+
+    def _create(self, **form):
+        data = {'title': 'issue',
+                'desc': 'issue desc',
+                'tag': 'bug',
+                'priority': 'low',
+                'status': 'to do',
+                **form}
+        response = self.client.post(path=self.url, data=data)
+        self.assertEqual(response.status_code, 201)
+        return response.data
+
+    def _codes(self, issue_id):
+        """(status, priority, tag) columns of an issue"""
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT status, priority, tag FROM projects_issue '
+                           'WHERE id = %s', [issue_id])
+            return cursor.fetchone()
+
+    def test_jc(self):
+        """Test
+        + names in the JSON, codes in the database
+        """
+        issue = self._create(status='done', priority='high', tag='task')
+        self.assertEqual((issue['status'], issue['priority'], issue['tag']),
+                         ('done', 'high', 'task'))
+        self.assertEqual(self._codes(issue['id']), (3, 3, 2))
+        response = self.client.get(path=self.url)
+        self.assertEqual(response.data['results'][0]['status'], 'done')
+        response = self.client.put(path=f"{self.url}{issue['id']}/",
+                                   data={'status': 'in progress'})
+        self.assertEqual(response.data['status'], 'in progress')
+        self.assertEqual(self._codes(issue['id'])[0], 2)
+
+    def test_cn(self):
+        """Test
+        + custom names get new codes
+        """
+        # Labels added by the code, never by the requests
+        labels.code('status', 'blocked', create=True)
+        labels.code('status', 'review', create=True)
+        labels.code('tag', 'blocked', create=True)
+        blocked = self._create(status='blocked')
+        review = self._create(status='review', tag='blocked')
+        self.assertEqual(self._codes(blocked['id'])[0], 4)
+        self.assertEqual(self._codes(review['id']), (5, 1, 4))
+        self.assertEqual(
+            set(IssueLabel.objects.filter(code__gt=3).values_list(
+                'kind', 'name', 'code')),
+            {('status', 'blocked', 4), ('status', 'review', 5),
+             ('tag', 'blocked', 4)})
+        response = self.client.get(path=self.url)
+        self.assertEqual([issue['status']
+                          for issue in response.data['results']],
+                         ['blocked', 'review'])
+
+    def test_tq(self):
+        """Test
+        + labels of a transaction cached once committed
+        """
+        with self.captureOnCommitCallbacks(execute=True):
+            code = labels.code('status', 'blocked', create=True)
+            # Read from the table until the commit
+            with self.assertNumQueries(1):
+                self.assertEqual(labels.code('status', 'blocked'), code)
+        with self.assertNumQueries(0):
+            self.assertEqual(labels.code('status', 'blocked'), code)
+            self.assertEqual(labels.name('status', code), 'blocked')
+            self.assertEqual(labels.code('status', 'done'), 3)
+
+    def test_rb(self):
+        """Test
+        + labels of a rolled back transaction forgotten
+        """
+        try:
+            with transaction.atomic():
+                labels.code('status', 'blocked', create=True)
+                raise RuntimeError
+        except RuntimeError:
+            pass
+        self.assertEqual(labels.code('status', 'blocked'), UNKNOWN)
+        self.assertFalse(IssueLabel.objects.filter(name='blocked').exists())
+
+    def test_cl(self):
+        """Test
+        + counters by label
+        """
+        labels.code('status', 'blocked', create=True)
+        self._create(status='blocked')
+        self._create(status='done')
+        self._create(status='blocked')
+        expected = {'blocked': 2, 'done': 1}
+        self.assertEqual(project_stats(self.project.id)['status'], expected)
+        rebuild_project_stats(self.project.id)
+        self.assertEqual(project_stats(self.project.id)['status'], expected)
+
+    def test_fu(self):
+        """Test
+        - filter by unknown name : no issue, no label created
+        """
+        self._create()
+        response = self.client.get(path=self.url,
+                                   data={'status': 'to do,unknown'})
+        self.assertEqual(len(response.data['results']), 1)
+        response = self.client.get(path=self.url, data={'status': 'unknown'})
+        self.assertEqual(response.data['results'], [])
+        self.assertFalse(IssueLabel.objects.filter(name='unknown').exists())
+
+    def test_un(self):
+        """Test
+        - write of unknown names : 400, no label created
+        """
+        data = {'title': 'issue',
+                'desc': 'issue desc',
+                'tag': 'bug',
+                'priority': 'low',
+                'status': 'blocked'}
+        response = self.client.post(path=self.url, data=data)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data['detail'], 'Unknown status.')
+        response = self.client.post(path=f'{self.url}bulk/',
+                                    data=[dict(data, status='done'),
+                                          dict(data, priority='urgent')])
+        self.assertEqual(response.status_code, 207)
+        self.assertEqual(response.data['results'][1]['detail'],
+                         'Unknown priority.')
+        issue = self._create()
+        response = self.client.put(path=f"{self.url}{issue['id']}/",
+                                   data={'tag': 'feature'})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self._codes(issue['id'])[2], 1)
+        self.assertFalse(IssueLabel.objects.filter(code__gt=3).exists())
+
+
+class LabelMigrationTests(TransactionTestCase):
+    """
+    Tests for the conversion of the issue labels (migrations 0015 to
+    0017).
+
+    Tests :
+        + names converted to codes and back (nc)
+        + data migration run again after a failure (ra)
+    """
+    before = [('projects', '0014_issue_filter_indexes')]
+    columns = [('projects', '0015_issue_labels')]
+    after = [('projects', '0017_issue_labels_schema')]
+
+    def setUp(self):
+        # Labels cached by the tests before the flush
+        labels.clear()
+
+    def tearDown(self):
+        executor = MigrationExecutor(connection)
+        executor.loader.build_graph()
+        executor.migrate(executor.loader.graph.leaf_nodes())
+        labels.clear()
+
+    def _migrate(self, targets):
+        executor = MigrationExecutor(connection)
+        executor.loader.build_graph()
+        executor.migrate(targets)
+        return executor.loader.project_state(targets).apps
+
+    def test_nc(self):
+        """Test
+        + names converted to codes and back
+        """
+        apps = self._migrate(self.before)
+        user = apps.get_model('auth', 'User').objects.create(username='u')
+        project = apps.get_model('projects', 'Project').objects.create(
+            title='project', description='project test', type='test',
+            author_user_id_id=user.id)
+        OldIssue = apps.get_model('projects', 'Issue')
+        names = [('done', 'high', 'bug'), ('blocked', 'low', 'feature'),
+                 ('to do', 'urgent', 'bug')]
+        for status, priority, tag in names:
+            OldIssue.objects.create(title='issue', status=status,
+                                    priority=priority, tag=tag,
+                                    project_id_id=project.id,
+                                    author_user_id_id=user.id,
+                                    assignee_user_id_id=user.id)
+        apps = self._migrate(self.after)
+        NewIssue = apps.get_model('projects', 'Issue')
+        self.assertEqual(list(NewIssue.objects.order_by('id').values_list(
+            'status', 'priority', 'tag')), names)
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT status, priority, tag FROM projects_issue '
+                           'ORDER BY id')
+            self.assertEqual(cursor.fetchall(),
+                             [(3, 3, 1), (4, 1, 4), (1, 4, 1)])
+        apps = self._migrate(self.before)
+        OldIssue = apps.get_model('projects', 'Issue')
+        self.assertEqual(list(OldIssue.objects.order_by('id').values_list(
+            'status', 'priority', 'tag')), names)
+
+    def test_ra(self):
+        """Test
+        + data migration run again after a failure : converted issues
+          kept, the others converted, no label created twice
+        """
+        # Default labels created again (flushed by the previous tests)
+        self._migrate(self.before)
+        apps = self._migrate(self.columns)
+        user = apps.get_model('auth', 'User').objects.create(username='u')
+        project = apps.get_model('projects', 'Project').objects.create(
+            title='project', description='project test', type='test',
+            author_user_id_id=user.id)
+        Issue = apps.get_model('projects', 'Issue')
+        for status in ('done', 'blocked', 'review'):
+            Issue.objects.create(title='issue', status=status,
+                                 priority='low', tag='bug',
+                                 project_id_id=project.id,
+                                 author_user_id_id=user.id,
+                                 assignee_user_id_id=user.id)
+        data = import_module('projects.migrations.0016_issue_labels_data')
+        with connection.schema_editor() as schema_editor:
+            data.encode(apps, schema_editor)
+            # Written by the old code during the conversion
+            Issue.objects.filter(status='review').update(status_code=None)
+            data.encode(apps, schema_editor)
+        self.assertEqual(list(Issue.objects.order_by('id').values_list(
+            'status_code', flat=True)), [3, 4, 5])
+        IssueLabel = apps.get_model('projects', 'IssueLabel')
+        self.assertEqual(IssueLabel.objects.filter(kind='status').count(), 5)
+        self._migrate(self.after)
@@ -0,0 +1,114 @@
+# Django Libs
+from django.contrib.auth.models import User
+from django.test import override_settings
+
+# Django REST Libs
+from rest_framework.test import (APITestCase,)
+
+# Locals Libs
+from ..membership import (membership_cache,)
+from ..models import (Project,
+                      Contributor,)
+
+
+class MembershipCacheTests(APITestCase):
+    """
+    Tests for the membership cache.
+
+    Tests :
+        + cached membership (cm)
+        + invalidated when a contributor is added (ia)
+        + invalidated when a contributor is deleted (id)
+        + least recently used eviction (lru)
+    """
+
+    def setUp(self):
+        """Setup
+        Users
+            - author user
+            - other user
+        Projet
+            - example project
+        """
+        membership_cache.clear()
+        user_form = {
+            'username': 'user1',
+            'password': 'Motdepasse123',
+        }
+        self.author = User.objects.create_user(**user_form)
+        user_form = {
+            'username': 'user2',
+            'password': 'Motdepasse123',
+        }
+        self.other = User.objects.create_user(**user_form)
+
+        self.project = Project.objects.create(title='project',
+                                              description='project test',
+                                              type='test',
+                                              author_user_id=self.author)
+        Contributor.objects.create(user_id=self.author,
+                                   project_id=self.project,
+                                   role='author',
+                                   permission='1')
+
+    def test_cm(self):
+        """Test
+        + cached membership
+        """
+        self.assertTrue(membership_cache.is_contributor(self.author.id,
+                                                        self.project.id))
+        with self.assertNumQueries(0):
+            self.assertTrue(membership_cache.is_contributor(
+                self.author.id, str(self.project.id)))
+            self.assertFalse(membership_cache.is_contributor(
+                self.author.id, 'abc'))
+
+    def test_ia(self):
+        """Test
+        + invalidated when a contributor is added
+        """
+        url = f'http://127.0.0.1:8000/projects/{self.project.id}/'
+        self.client.force_authenticate(user=self.other)
+        response = self.client.get(path=url)
+        self.assertEqual(response.status_code, 403)
+
+        self.client.force_authenticate(user=self.author)
+        users_url = url + 'users/'
+        self.client.post(path=users_url,
+                         data={'user_id': self.other.id, 'role': 'test'})
+
+        self.client.force_authenticate(user=self.other)
+        response = self.client.get(path=url)
+        self.assertEqual(response.status_code, 200)
+
+    def test_id(self):
+        """Test
+        + invalidated when a contributor is deleted
+        """
+        Contributor.objects.create(user_id=self.other,
+                                   project_id=self.project,
+                                   role='test',
+                                   permission='0')
+        url = f'http://127.0.0.1:8000/projects/{self.project.id}/'
+        self.client.force_authenticate(user=self.other)
+        response = self.client.get(path=url)
+        self.assertEqual(response.status_code, 200)
+
+        self.client.force_authenticate(user=self.author)
+        self.client.delete(path=url + f'users/{self.other.id}/')
+
+        self.client.force_authenticate(user=self.other)
+        response = self.client.get(path=url)
+        self.assertEqual(response.status_code, 403)
+
+    @override_settings(SOFTDESK={'MEMBERSHIP_CACHE_SIZE': 1})
+    def test_lru(self):
+        """Test
+        + least recently used eviction
+        """
+        membership_cache.projects(self.author.id)
+        membership_cache.projects(self.other.id)
+        with self.assertNumQueries(0):
+            membership_cache.projects(self.other.id)
+        with self.assertNumQueries(1):
+            membership_cache.projects(self.author.id)
@@ -0,0 +1,129 @@
+# Django Libs
+from django.contrib.auth.models import User
+from django.test import override_settings
+from django.utils import timezone
+
+# Django REST Libs
+from rest_framework.test import (APITestCase,)
+
+# Locals Libs
+from ..models import (Project,
+                      Contributor,
+                      Issue,
+                      Comment,)
+
+
+class PaginationTests(APITestCase):
+    """
+    Tests for the cursor pagination of issues and comments.
+
+    Tests :
+        + walk all issue pages (wi)
+        + walk pages with equal created_time (wt)
+        + walk all comment pages (wc)
+        + page size capped (ps)
+        - invalid cursor (ic)
+        - invalid page size (ip)
+    """
+
+    def setUp(self):
+        """Setup
+        User
+            - author user
+        Projet
+            - example project
+        Issues
+            - 5 issues
+        Comments
+            - 3 comments on the first issue
+        """
+        user_form = {
+            'username': 'user1',
+            'password': 'Motdepasse123',
+        }
+        self.author = User.objects.create_user(**user_form)
+        self.project = Project.objects.create(title='project',
+                                              description='project test',
+                                              type='test',
+                                              author_user_id=self.author)
+        Contributor.objects.create(user_id=self.author,
+                                   project_id=self.project,
+                                   role='author',
+                                   permission='1')
+        self.issues = [
+            Issue.objects.create(title=f'issue {index}',
+                                 desc='issue desc',
+                                 tag='test',
+                                 priority='low',
+                                 status='created',
+                                 assignee_user_id=self.author,
+                                 author_user_id=self.author,
+                                 project_id=self.project)
+            for index in range(5)]
+        for index in range(3):
+            Comment.objects.create(description=f'comment {index}',
+                                   author_user_id=self.author,
+                                   issue_id=self.issues[0])
+        self.client.force_authenticate(user=self.author)
+        self.issues_url = (f'http://testserver/projects/'
+                           f'{self.project.id}/issues/')
+
+    def _walk(self, url):
+        """Follow the next links, return ids in order"""
+        ids = []
+        pages = 0
+        while url:
+            response = self.client.get(path=url)
+            self.assertEqual(response.status_code, 200)
+            ids += [element['id'] for element in response.data['results']]
+            url = response.data['next']
+            pages += 1
+        return ids, pages
+
+    def test_wi(self):
+        """Test
+        + walk all issue pages
+        """
+        ids, pages = self._walk(self.issues_url + '?page_size=2')
+        self.assertEqual(ids, [issue.id for issue in self.issues])
+        self.assertEqual(pages, 3)
+
+    def test_wt(self):
+        """Test
+        + walk pages with equal created_time
+        """
+        Issue.objects.update(created_time=timezone.now())
+        ids, pages = self._walk(self.issues_url + '?page_size=2')
+        self.assertEqual(ids, [issue.id for issue in self.issues])
+
+    def test_wc(self):
+        """Test
+        + walk all comment pages
+        """
+        url = f'{self.issues_url}{self.issues[0].id}/comments/?page_size=1'
+        ids, pages = self._walk(url)
+        self.assertEqual(len(ids), 3)
+        self.assertEqual(pages, 3)
+
+    @override_settings(SOFTDESK={'MAX_PAGE_SIZE': 3})
+    def test_ps(self):
+        """Test
+        + page size capped
+        """
+        response = self.client.get(path=self.issues_url + '?page_size=50')
+        self.assertEqual(len(response.data['results']), 3)
+        self.assertIsNotNone(response.data['next'])
+
+    def test_ic(self):
+        """Test
+        - invalid cursor
+        """
+        response = self.client.get(path=self.issues_url + '?cursor=abc')
+        self.assertEqual(response.status_code, 400)
+
+    def test_ip(self):
+        """Test
+        - invalid page size
+        """
+        response = self.client.get(path=self.issues_url + '?page_size=0')
+        self.assertEqual(response.status_code, 400)
@@ -0,0 +1,252 @@
+# Django Libs
+from django.contrib.auth.models import User
+
+# Django REST Libs
+from rest_framework.test import (APITestCase,)
+
+# Locals Libs
+from .utils import (QueryBudgetMixin,)
+
+
+class ProjectQueryBudgetTests(QueryBudgetMixin, APITestCase):
+    """
+    Query budgets of the projects endpoints, author user.
+
+    Tests :
+        Author tests: (AT)
+            + list projects (lp)
+            + retrieve project (rp)
+            + create project (cp)
+            + update project (up)
+            + delete project (dp)
+            + search (se)
+            + changes (ch)
+            + export (ex)
+            + stats (st)
+            + batch of the project screen (ba)
+        Superuser tests: (ST)
+            + cache counters (cc)
+    """
+    def test_AT_lp(self):
+        """Test list projects"""
+        self.assertQueryBudget(
+            2, lambda data: self.client.get(
+                'http://127.0.0.1:8000/projects/'))
+
+    def test_AT_rp(self):
+        """Test retrieve project"""
+        self.assertQueryBudget(2, lambda data: self.client.get(data.url))
+
+    def test_AT_cp(self):
+        """Test create project"""
+        self.assertQueryBudget(
+            2, lambda data: self.client.post(
+                'http://127.0.0.1:8000/projects/',
+                data={'title': 'project',
+                      'description': 'project test',
+                      'type': 'test'}))
+
+    def test_AT_up(self):
+        """Test update project"""
+        self.assertQueryBudget(
+            6, lambda data: self.client.put(
+                data.url,
+                data={'title': 'project updated',
+                      'description': 'project test',
+                      'type': 'test'}))
+
+    def test_AT_dp(self):
+        """Test delete project"""
+        self.assertQueryBudget(55, lambda data: self.client.delete(data.url))
+
+    def test_AT_se(self):
+        """Test search"""
+        self.assertQueryBudget(
+            2, lambda data: self.client.get(
+                'http://127.0.0.1:8000/projects/search/?q=issue'))
+
+    def test_AT_ch(self):
+        """Test changes"""
+        self.assertQueryBudget(
+            6, lambda data: self.client.get(data.url + 'changes/'))
+
+    def test_AT_ex(self):
+        """Test export"""
+        self.assertQueryBudget(
+            5, lambda data: self.client.get(data.url + 'export/'))
+
+    def test_AT_st(self):
+        """Test stats"""
+        self.assertQueryBudget(
+            3, lambda data: self.client.get(data.url + 'stats/'))
+
+    def test_AT_ba(self):
+        """Test batch of the project screen : one project scope"""
+        def request(data):
+            path = f'/projects/{data.project.id}/'
+            return self.client.post(
+                'http://127.0.0.1:8000/batch/',
+                data=[{'method': 'GET', 'path': path + resource}
+                      for resource in ('', 'users/', 'issues/')])
+        self.assertQueryBudget(4, request)
+
+    def test_ST_cc(self):
+        """Test cache counters"""
+        admin = User.objects.create_superuser(username='admin',
+                                              password='Motdepasse123')
+        self.client.force_authenticate(user=admin)
+        self.assertQueryBudget(
+            0, lambda data: self.client.get(
+                'http://127.0.0.1:8000/projects/cache/'))
+
+
+class IssueQueryBudgetTests(QueryBudgetMixin, APITestCase):
+    """
+    Query budgets of the issues endpoints, author user.
+
+    Tests :
+        Author tests: (AT)
+            + list issues (li)
+            + create issue (ci)
+            + add issues in bulk (bi)
+            + update issue (ui)
+            + delete issue (di)
+        Contributors tests: (CT)
+            + assigned issues, across projects (ai)
+    """
+    def test_AT_li(self):
+        """Test list issues"""
+        self.assertQueryBudget(
+            2, lambda data: self.client.get(data.url + 'issues/'))
+
+    def test_AT_ci(self):
+        """Test create issue"""
+        self.assertQueryBudget(
+            12, lambda data: self.client.post(
+                data.url + 'issues/',
+                data={'title': 'issue',
+                      'desc': 'issue desc',
+                      'tag': 'bug',
+                      'priority': 'low',
+                      'status': 'to do',
+                      'assignee_user_id': data.users[-1].id}))
+
+    def test_AT_bi(self):
+        """Test add issues in bulk : one issue by contributor"""
+        self.assertQueryBudget(
+            15, lambda data: self.client.post(
+                data.url + 'issues/bulk/',
+                data=[{'title': f'issue {user.id}',
+                       'desc': 'issue desc',
+                       'tag': 'bug',
+                       'priority': 'low',
+                       'status': 'to do',
+                       'assignee_user_id': user.id}
+                      for user in data.users]))
+
+    def test_AT_ui(self):
+        """Test update issue"""
+        self.assertQueryBudget(
+            8, lambda data: self.client.put(
+                f'{data.url}issues/{data.issues[0].id}/',
+                data={'title': 'issue updated'}))
+
+    def test_AT_di(self):
+        """Test delete issue (and its comments)"""
+        self.assertQueryBudget(
+            14, lambda data: self.client.delete(
+                f'{data.url}issues/{data.issues[0].id}/'))
+
+    def test_CT_ai(self):
+        """Test assigned issues, across projects"""
+        def request(data):
+            self.client.force_authenticate(user=data.users[0])
+            return self.client.get('http://127.0.0.1:8000/issues/assigned/')
+        self.assertQueryBudget(1, request)
+
+
+class CommentQueryBudgetTests(QueryBudgetMixin, APITestCase):
+    """
+    Query budgets of the comments endpoints, author user.
+
+    Tests :
+        Author tests: (AT)
+            + list comments (lc)
+            + retrieve comment (rc)
+            + create comment (cc)
+            + update comment (uc)
+            + delete comment (dc)
+    """
+    def comments_url(self, data):
+        return f'{data.url}issues/{data.issues[0].id}/comments/'
+
+    def test_AT_lc(self):
+        """Test list comments"""
+        self.assertQueryBudget(
+            2, lambda data: self.client.get(self.comments_url(data)))
+
+    def test_AT_rc(self):
+        """Test retrieve comment"""
+        self.assertQueryBudget(
+            2, lambda data: self.client.get(
+                f'{self.comments_url(data)}{data.comments[0].id}/'))
+
+    def test_AT_cc(self):
+        """Test create comment"""
+        self.assertQueryBudget(
+            8, lambda data: self.client.post(
+                self.comments_url(data),
+                data={'description': 'comment'}))
+
+    def test_AT_uc(self):
+        """Test update comment"""
+        self.assertQueryBudget(
+            9, lambda data: self.client.put(
+                f'{self.comments_url(data)}{data.comments[0].id}/',
+                data={'description': 'comment updated'}))
+
+    def test_AT_dc(self):
+        """Test delete comment"""
+        self.assertQueryBudget(
+            9, lambda data: self.client.delete(
+                f'{self.comments_url(data)}{data.comments[0].id}/'))
+
+
+class ContributorQueryBudgetTests(QueryBudgetMixin, APITestCase):
+    """
+    Query budgets of the contributors endpoints, author user.
+
+    Tests :
+        Author tests: (AT)
+            + list contributors (lu)
+            + add contributor (au)
+            + add and remove contributors in bulk (bu)
+            + remove contributor (ru)
+    """
+    def test_AT_lu(self):
+        """Test list contributors"""
+        self.assertQueryBudget(
+            2, lambda data: self.client.get(data.url + 'users/'))
+
+    def test_AT_au(self):
+        """Test add contributor"""
+        self.assertQueryBudget(
+            6, lambda data: self.client.post(
+                data.url + 'users/',
+                data={'user_id': data.outsiders[0].id,
+                      'role': 'developer'}))
+
+    def test_AT_bu(self):
+        """Test add and remove contributors in bulk"""
+        self.assertQueryBudget(
+            11, lambda data: self.client.post(
+                data.url + 'users/bulk/',
+                data={'add': [{'user_id': user.id, 'role': 'developer'}
+                              for user in data.outsiders],
+                      'remove': [user.id for user in data.users]}))
+
+    def test_AT_ru(self):
+        """Test remove contributor"""
+        self.assertQueryBudget(
+            7, lambda data: self.client.delete(
+                f'{data.url}users/{data.users[0].id}/'))
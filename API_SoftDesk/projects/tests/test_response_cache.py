@@ -0,0 +1,185 @@
+# Django Libs
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import override_settings
+
+# Django REST Libs
+from rest_framework.test import (APITestCase,)
+
+# Locals Libs
+from ..membership import (membership_cache,)
+from ..models import (Project,
+                      Contributor,
+                      Issue,
+                      Comment,)
+from ..response_cache import (response_cache,)
+
+
+class ResponseCacheTests(APITestCase):
+    """
+    Tests for the list responses cache.
+
+    Tests :
+        Contributors tests: (CT)
+            + issues from the cache (ic)
+            + issues invalidated by a write (iw)
+            + comments invalidated by a write (cw)
+            + contributors invalidated by a membership (uw)
+            + cache disabled (cd)
+            - cache counters (cc)
+        No contributors test: (NCT)
+            - cached issues (ci)
+        Superuser tests: (ST)
+            + cache counters (cc)
+    """
+
+    def setUp(self):
+        """Setup
+        Users
+            - author user
+            - no contributor user
+            - superuser
+        Projet
+            - example project
+            - example issue
+            - example comment
+        """
+        membership_cache.clear()
+        response_cache.clear()
+        cache.clear()
+        user_form = {
+            'username': 'user1',
+            'password': 'Motdepasse123',
+        }
+        self.author = User.objects.create_user(**user_form)
+        user_form = {
+            'username': 'user2',
+            'password': 'Motdepasse123',
+        }
+        self.no_contrib = User.objects.create_user(**user_form)
+        user_form = {
+            'username': 'admin',
+            'password': 'Motdepasse123',
+        }
+        self.admin = User.objects.create_superuser(**user_form)
+        self.project = Project.objects.create(title='project',
+                                              description='project test',
+                                              type='test',
+                                              author_user_id=self.author)
+        Contributor.objects.create(user_id=self.author,
+                                   project_id=self.project,
+                                   role='author',
+                                   permission='1')
+        self.issue = Issue.objects.create(title='issue',
+                                          desc='issue desc',
+                                          tag='test',
+                                          priority='low',
+                                          status='created',
+                                          project_id=self.project,
+                                          author_user_id=self.author,
+                                          assignee_user_id=self.author)
+        Comment.objects.create(description='comment',
+                               author_user_id=self.author,
+                               issue_id=self.issue)
+        self.url = f'http://127.0.0.1:8000/projects/{self.project.id}/'
+        self.issues_url = f'{self.url}issues/'
+        self.comments_url = f'{self.issues_url}{self.issue.id}/comments/'
+        self.cache_url = 'http://127.0.0.1:8000/projects/cache/'
+        self.client.force_authenticate(user=self.author)
+
+    def test_CT_ic(self):
+        """Test
+        Contributor user /
+            + issues from the cache
+        """
+        first = self.client.get(path=self.issues_url)
+        # Project scope only : no issue read, no serialization
+        with self.assertNumQueries(1):
+            second = self.client.get(path=self.issues_url)
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(second.json(), first.json())
+        # Pages have their own entry
+        response = self.client.get(path=self.issues_url,
+                                   data={'page_size': 1})
+        self.assertEqual(len(response.data['results']), 1)
+        self.assertEqual(response_cache.counters()['resources']['issues'],
+                         {'hits': 1, 'misses': 2})
+
+    def test_CT_iw(self):
+        """Test
+        Contributor user /
+            + issues invalidated by a write
+        """
+        self.client.get(path=self.issues_url)
+        self.client.put(path=f'{self.issues_url}{self.issue.id}/',
+                        data={'title': 'updated'})
+        response = self.client.get(path=self.issues_url)
+        self.assertEqual(response.data['results'][0]['title'], 'updated')
+
+    def test_CT_cw(self):
+        """Test
+        Contributor user /
+            + comments invalidated by a write
+        """
+        self.client.get(path=self.comments_url)
+        self.client.post(path=self.comments_url,
+                         data={'description': 'new comment'})
+        response = self.client.get(path=self.comments_url)
+        self.assertEqual(len(response.data['results']), 2)
+
+    def test_CT_uw(self):
+        """Test
+        Contributor user /
+            + contributors invalidated by a membership
+        """
+        users_url = f'{self.url}users/'
+        response = self.client.get(path=users_url)
+        self.assertEqual(len(response.data), 1)
+        self.client.post(path=users_url,
+                         data={'user_id': self.no_contrib.id})
+        response = self.client.get(path=users_url)
+        self.assertEqual(len(response.data), 2)
+
+    @override_settings(SOFTDESK={'RESPONSE_CACHE_ALIAS': None})
+    def test_CT_cd(self):
+        """Test
+        Contributor user /
+            + cache disabled
+        """
+        self.client.get(path=self.issues_url)
+        response = self.client.get(path=self.issues_url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response_cache.counters()['hits'], 0)
+        self.assertEqual(response_cache.counters()['misses'], 0)
+
+    def test_CT_cc(self):
+        """Test
+        Contributor user /
+            - cache counters
+        """
+        response = self.client.get(path=self.cache_url)
+        self.assertEqual(response.status_code, 403)
+
+    def test_NCT_ci(self):
+        """Test
+        No contributor user /
+            - cached issues
+        """
+        self.client.get(path=self.issues_url)
+        self.client.force_authenticate(user=self.no_contrib)
+        response = self.client.get(path=self.issues_url)
+        self.assertEqual(response.status_code, 403)
+
+    def test_ST_cc(self):
+        """Test
+        Superuser /
+            + cache counters
+        """
+        self.client.get(path=self.issues_url)
+        self.client.get(path=self.issues_url)
+        self.client.force_authenticate(user=self.admin)
+        response = self.client.get(path=self.cache_url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['hits'], 1)
+        self.assertEqual(response.data['misses'], 1)
+        self.assertEqual(response.data['hit_ratio'], 0.5)
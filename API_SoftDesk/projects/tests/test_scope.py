@@ -0,0 +1,132 @@
+# Django Libs
+from django.contrib.auth.models import User
+from django.test import RequestFactory
+
+# Django REST Libs
+from rest_framework.test import (APITestCase,)
+
+# Locals Libs
+from ..models import (Project,
+                      Contributor,
+                      Issue,)
+from ..scope import (get_project_scope,)
+
+
+class ScopeTests(APITestCase):
+    """
+    Tests for the request-scoped project resolver.
+
+    Tests :
+        + project, membership and issue in one query (oq)
+        + reused within the same request (rr)
+        + no contributor (nc)
+        + issue from another project (ip)
+        + unknown project (up)
+    """
+
+    def setUp(self):
+        """Setup
+        Users
+            - author user
+            - no contributor user
+        Projects
+            - example project
+            - other project
+        Issue
+            - example issue for other project
+        """
+        user_form = {
+            'username': 'user1',
+            'password': 'Motdepasse123',
+        }
+        self.author = User.objects.create_user(**user_form)
+        user_form = {
+            'username': 'user2',
+            'password': 'Motdepasse123',
+        }
+        self.no_contrib = User.objects.create_user(**user_form)
+
+        self.project = Project.objects.create(title='project',
+                                              description='project test',
+                                              type='test',
+                                              author_user_id=self.author)
+        Contributor.objects.create(user_id=self.author,
+                                   project_id=self.project,
+                                   role='author',
+                                   permission='1')
+        self.issue = Issue.objects.create(title='issue',
+                                          desc='issue desc',
+                                          tag='task',
+                                          priority='low',
+                                          status='to do',
+                                          assignee_user_id=self.author,
+                                          author_user_id=self.author,
+                                          project_id=self.project)
+        self.other = Project.objects.create(title='other',
+                                            description='other test',
+                                            type='test',
+                                            author_user_id=self.author)
+        self.other_issue = Issue.objects.create(title='issue',
+                                                desc='issue desc',
+                                                tag='task',
+                                                priority='low',
+                                                status='to do',
+                                                assignee_user_id=self.author,
+                                                author_user_id=self.author,
+                                                project_id=self.other)
+
+    def _request(self, user):
+        request = RequestFactory().get('/')
+        request.user = user
+        return request
+
+    def test_oq(self):
+        """Test
+        + project, membership and issue in one query
+        """
+        request = self._request(self.author)
+        with self.assertNumQueries(1):
+            scope = get_project_scope(request, self.project.id,
+                                      self.issue.id)
+        self.assertEqual(scope.project, self.project)
+        self.assertEqual(scope.project.title, 'project')
+        self.assertTrue(scope.is_contributor)
+        self.assertEqual(scope.contributor.permission, '1')
+        self.assertEqual(scope.issue, self.issue)
+
+    def test_rr(self):
+        """Test
+        + reused within the same request
+        """
+        request = self._request(self.author)
+        get_project_scope(request, self.project.id, self.issue.id)
+        with self.assertNumQueries(0):
+            get_project_scope(request, str(self.project.id),
+                              str(self.issue.id))
+
+    def test_nc(self):
+        """Test
+        + no contributor
+        """
+        request = self._request(self.no_contrib)
+        scope = get_project_scope(request, self.project.id)
+        self.assertEqual(scope.project, self.project)
+        self.assertFalse(scope.is_contributor)
+
+    def test_ip(self):
+        """Test
+        + issue from another project
+        """
+        request = self._request(self.author)
+        scope = get_project_scope(request, self.project.id,
+                                  self.other_issue.id)
+        self.assertEqual(scope.project, self.project)
+        self.assertIsNone(scope.issue)
+
+    def test_up(self):
+        """Test
+        + unknown project
+        """
+        request = self._request(self.author)
+        self.assertIsNone(get_project_scope(request, 999).project)
+        self.assertIsNone(get_project_scope(request, 'abc').project)
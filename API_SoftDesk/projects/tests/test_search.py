@@ -0,0 +1,232 @@
+# Django Libs
+from django.contrib.auth.models import User
+from django.test import override_settings
+
+# Django REST Libs
+from rest_framework.test import (APITestCase,)
+
+# Locals Libs
+from ..membership import (membership_cache,)
+from ..models import (Project,
+                      Contributor,)
+from .. import search
+
+
+class SearchTests(APITestCase):
+    """
+    Tests for the full-text search of issues and comments.
+
+    Tests :
+        Contributors tests: (CT)
+            + search issues and comments (sr)
+            + search after update (su)
+            + search after delete (sd)
+            + search in one project (sp)
+            + search pages (pg)
+            - empty query (eq)
+            - search in another project (op)
+        Unit tests: (UT)
+            + fallback search (fb)
+        Unauthenticated user tests : (UUT)
+            - search (sr)
+    """
+
+    def setUp(self):
+        """Setup
+        Users
+            - contributor user
+            - other user
+        Projet
+            - example project (contributor)
+            - other project (other user)
+        """
+        membership_cache.clear()
+        user_form = {
+            'username': 'user1',
+            'password': 'Motdepasse123',
+        }
+        self.contrib = User.objects.create_user(**user_form)
+        user_form = {
+            'username': 'user2',
+            'password': 'Motdepasse123',
+        }
+        self.other = User.objects.create_user(**user_form)
+        self.project = self._project(self.contrib)
+        self.other_project = self._project(self.other)
+        self.url = 'http://127.0.0.1:8000/projects/search/'
+
+    def _project(self, user):
+        project = Project.objects.create(title='project',
+                                         description='project test',
+                                         type='test',
+                                         author_user_id=user)
+        Contributor.objects.create(user_id=user,
+                                   project_id=project,
+                                   role='author',
+                                   permission='1')
+        return project
+
+    def _issue(self, project, title, desc='issue desc'):
+        issue = {
+            'title': title,
+            'desc': desc,
+            'tag': 'task',
+            'priority': 'low',
+            'status': 'to do',
+        }
+        url = f'http://127.0.0.1:8000/projects/{project.id}/issues/'
+        response = self.client.post(path=url, data=issue)
+        return response.data['id']
+
+    def _comment(self, project, issue_id, description):
+        url = (f'http://127.0.0.1:8000/projects/{project.id}/issues/'
+               f'{issue_id}/comments/')
+        response = self.client.post(path=url,
+                                    data={'description': description})
+        return response.data['id']
+
+    def _found(self, query, **params):
+        response = self.client.get(path=self.url,
+                                   data=dict(q=query, **params))
+        self.assertEqual(response.status_code, 200)
+        return [(result['type'], result['id'])
+                for result in response.data['results']]
+
+    def test_CT_sr(self):
+        """Test
+        Contributor user /
+            + search issues and comments
+        """
+        self.client.force_authenticate(user=self.contrib)
+        issue_id = self._issue(self.project, 'Login crash',
+                               'crash on the login page')
+        other_id = self._issue(self.project, 'Slow export')
+        comment_id = self._comment(self.project, other_id,
+                                   'export crashes sometimes')
+        self.assertEqual(self._found('crash'), [('issue', issue_id)])
+        self.assertEqual(sorted(self._found('export')),
+                         [('comment', comment_id), ('issue', other_id)])
+        self.assertEqual(self._found('LOGIN page'), [('issue', issue_id)])
+        self.assertEqual(self._found('login export'), [])
+        # Query syntax is not interpreted
+        self.assertEqual(self._found('crash OR "export'),
+                         [])
+
+    def test_CT_su(self):
+        """Test
+        Contributor user /
+            + search after update
+        """
+        self.client.force_authenticate(user=self.contrib)
+        issue_id = self._issue(self.project, 'Login crash')
+        comment_id = self._comment(self.project, issue_id, 'first words')
+        url = f'http://127.0.0.1:8000/projects/{self.project.id}/issues/'
+        self.client.put(path=f'{url}{issue_id}/',
+                        data={'title': 'Logout freeze'})
+        self.client.put(path=f'{url}{issue_id}/comments/{comment_id}/',
+                        data={'description': 'second words'})
+        self.assertEqual(self._found('crash'), [])
+        self.assertEqual(self._found('freeze'), [('issue', issue_id)])
+        self.assertEqual(self._found('first'), [])
+        self.assertEqual(self._found('second'), [('comment', comment_id)])
+
+    def test_CT_sd(self):
+        """Test
+        Contributor user /
+            + search after delete
+        """
+        self.client.force_authenticate(user=self.contrib)
+        issue_id = self._issue(self.project, 'Login crash')
+        comment_id = self._comment(self.project, issue_id, 'crash again')
+        other_id = self._issue(self.project, 'Export crash')
+        url = f'http://127.0.0.1:8000/projects/{self.project.id}/issues/'
+        self.client.delete(path=f'{url}{other_id}/')
+        self.assertEqual(sorted(self._found('crash')),
+                         [('comment', comment_id), ('issue', issue_id)])
+        self.client.delete(path=f'{url}{issue_id}/comments/{comment_id}/')
+        self.assertEqual(self._found('crash'), [('issue', issue_id)])
+        self.client.delete(path=f'{url}{issue_id}/')
+        self.assertEqual(self._found('crash'), [])
+
+    def test_CT_sp(self):
+        """Test
+        Contributor user /
+            + search in one project
+        """
+        self.client.force_authenticate(user=self.contrib)
+        second_project = self._project(self.contrib)
+        membership_cache.clear()
+        issue_id = self._issue(self.project, 'crash')
+        second_id = self._issue(second_project, 'crash')
+        self.assertEqual(sorted(self._found('crash')),
+                         sorted([('issue', issue_id),
+                                 ('issue', second_id)]))
+        self.assertEqual(self._found('crash', project=second_project.id),
+                         [('issue', second_id)])
+
+    def test_CT_pg(self):
+        """Test
+        Contributor user /
+            + search pages
+        """
+        self.client.force_authenticate(user=self.contrib)
+        for index in range(5):
+            self._issue(self.project, f'crash {index}')
+        response = self.client.get(path=self.url,
+                                   data={'q': 'crash', 'page_size': 2})
+        found = [result['id'] for result in response.data['results']]
+        while response.data['next']:
+            response = self.client.get(path=response.data['next'])
+            found += [result['id'] for result in response.data['results']]
+        self.assertEqual(len(set(found)), 5)
+        with override_settings(SOFTDESK={'SEARCH_MAX_PAGE': 2}):
+            response = self.client.get(path=self.url,
+                                       data={'q': 'crash', 'page': 3})
+            self.assertEqual(response.status_code, 400)
+
+    def test_CT_eq(self):
+        """Test
+        Contributor user /
+            - empty query
+        """
+        self.client.force_authenticate(user=self.contrib)
+        response = self.client.get(path=self.url, data={'q': ' '})
+        self.assertEqual(response.status_code, 400)
+
+    def test_CT_op(self):
+        """Test
+        Contributor user /
+            - search in another project
+        """
+        self.client.force_authenticate(user=self.other)
+        self._issue(self.other_project, 'secret crash')
+        self.client.force_authenticate(user=self.contrib)
+        self.assertEqual(self._found('secret'), [])
+        response = self.client.get(
+            path=self.url,
+            data={'q': 'secret', 'project': self.other_project.id})
+        self.assertEqual(response.status_code, 404)
+
+    def test_UT_fb(self):
+        """Test
+        Unit /
+            + fallback search
+        """
+        self.client.force_authenticate(user=self.contrib)
+        issue_id = self._issue(self.project, 'Login crash')
+        comment_id = self._comment(self.project, issue_id, 'crash again')
+        results = search._search_fallback(['crash'], [self.project.id],
+                                          0, 10)
+        self.assertEqual([(result['type'], result['id'])
+                          for result in results],
+                         [('comment', comment_id), ('issue', issue_id)])
+        self.assertEqual(search._search_fallback(
+            ['crash'], [self.other_project.id], 0, 10), [])
+
+    def test_UUT_sr(self):
+        """Test
+        Unauthenticated user /
+            - search
+        """
+        response = self.client.get(path=self.url, data={'q': 'crash'})
+        self.assertEqual(response.status_code, 401)
@@ -0,0 +1,103 @@
+# Python Libs
+from io import StringIO
+
+# Django Libs
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db.models import Count
+
+# Django REST Libs
+from rest_framework.test import (APITestCase,)
+
+# Locals Libs
+from .. import search
+from ..membership import (membership_cache,)
+from ..models import (Project,
+                      Contributor,
+                      Issue,
+                      Comment,)
+from ..seed import (Seeder,)
+from ..stats import (project_stats,)
+
+
+class SeedTests(APITestCase):
+    """
+    Tests for the seed_softdesk command.
+
+    Tests :
+        Seeder tests: (ST)
+            + exact counts (ec)
+            + same seed, same rows (ss)
+            + skewed project sizes (sk)
+            + counters and search index (ci)
+        Command tests: (CT)
+            + existing prefix (ep)
+    """
+    def setUp(self):
+        membership_cache.clear()
+
+    def seed(self, **kwargs):
+        options = dict(users=20, projects=10, issues=300, comments=1000,
+                       chunk_size=120)
+        options.update(kwargs)
+        return Seeder(**options).run()
+
+    def test_ST_ec(self):
+        """Test exact counts, with several chunks"""
+        inserted = self.seed()
+        self.assertEqual(inserted["User"], 20)
+        self.assertEqual(inserted["Project"], 10)
+        self.assertEqual(inserted["Issue"], 300)
+        self.assertEqual(inserted["Comment"], 1000)
+        self.assertEqual(Issue.objects.count(), 300)
+        self.assertEqual(Comment.objects.count(), 1000)
+        self.assertEqual(Contributor.objects.count(), inserted["Contributor"])
+        # Authors and assignees are contributors of the project
+        for issue in Issue.objects.all()[:50]:
+            members = set(Contributor.objects.filter(
+                project_id=issue.project_id_id).values_list(
+                    "user_id", flat=True))
+            self.assertIn(issue.author_user_id_id, members)
+            self.assertIn(issue.assignee_user_id_id, members)
+
+    def test_ST_ss(self):
+        """Test same seed gives the same rows"""
+        self.seed(seed=7, prefix="first")
+        first = list(Issue.objects.order_by("id").values_list(
+            "title", "tag", "status"))
+        Project.objects.all().delete()
+        self.seed(seed=7, prefix="second")
+        second = list(Issue.objects.order_by("id").values_list(
+            "title", "tag", "status"))
+        self.assertEqual(first, second)
+
+    def test_ST_sk(self):
+        """Test skewed project sizes : Zipf law"""
+        self.seed(projects=20, issues=2000, comments=2000, skew=1.2)
+        sizes = sorted(Issue.objects.values("project_id").annotate(
+            count=Count("id")).values_list("count", flat=True))
+        median = sizes[len(sizes) // 2]
+        self.assertGreater(sizes[-1], 5 * median)
+
+    def test_ST_ci(self):
+        """Test counters rebuilt and search index filled"""
+        self.seed()
+        for project in Project.objects.all():
+            stats = project_stats(project.id)
+            self.assertEqual(stats["issues"], Issue.objects.filter(
+                project_id=project).count())
+            self.assertEqual(stats["comments"], Comment.objects.filter(
+                issue_id__project_id=project).count())
+        issue = Issue.objects.order_by("id").last()
+        word = issue.title.split()[0]
+        results = search.search(word, [issue.project_id_id], 0, 1000)
+        self.assertIn(issue.id, [result["id"] for result in results
+                                 if result["type"] == "issue"])
+
+    def test_CT_ep(self):
+        """Test existing prefix is refused"""
+        User.objects.create_user(username="seed_0", password="x")
+        with self.assertRaises(CommandError):
+            call_command("seed_softdesk", users=1, projects=1, issues=1,
+                         comments=1, stdout=StringIO())
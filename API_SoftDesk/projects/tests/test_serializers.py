@@ -0,0 +1,93 @@
+# Django Libs
+from django.contrib.auth.models import User
+from django.test import override_settings
+
+# Django REST Libs
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import (APITestCase,)
+
+# Locals Libs
+from ..models import (Project,
+                      Contributor,
+                      Issue,
+                      Comment,)
+from ..response_cache import (response_cache,)
+from ..serializers import (ProjectSerializer,
+                           ContributorSerializer,
+                           IssueSerializer,
+                           CommentSerializer,)
+
+
+class ValuesSerializerTests(APITestCase):
+    """
+    Tests for the values() serialization of list responses.
+
+    Tests :
+        + same JSON as ModelSerializer (sj)
+        + same issue list response (sr)
+    """
+
+    def setUp(self):
+        """Setup
+        User
+            - author user
+        Projet
+            - example project
+        Issues
+            - issue with description, issue without description
+        Comment
+            - example comment
+        """
+        user_form = {
+            'username': 'user1',
+            'password': 'Motdepasse123',
+        }
+        self.author = User.objects.create_user(**user_form)
+        self.project = Project.objects.create(title='project',
+                                              description='project test',
+                                              type='test',
+                                              author_user_id=self.author)
+        Contributor.objects.create(user_id=self.author,
+                                   project_id=self.project,
+                                   role='author',
+                                   permission='1')
+        for desc in ('issue desc', None):
+            issue = Issue.objects.create(title='issue',
+                                         desc=desc,
+                                         tag='test',
+                                         priority='low',
+                                         status='created',
+                                         assignee_user_id=self.author,
+                                         author_user_id=self.author,
+                                         project_id=self.project)
+        Comment.objects.create(description='comment',
+                               author_user_id=self.author,
+                               issue_id=issue)
+
+    def test_sj(self):
+        """Test
+        + same JSON as ModelSerializer
+        """
+        renderer = JSONRenderer()
+        for serializer_class in (ProjectSerializer,
+                                 ContributorSerializer,
+                                 IssueSerializer,
+                                 CommentSerializer):
+            queryset = serializer_class.Meta.model.objects.order_by('id')
+            expected = serializer_class(queryset, many=True).data
+            rows = serializer_class.values(queryset)
+            self.assertEqual(
+                renderer.render(serializer_class.represent(rows)),
+                renderer.render(expected))
+
+    def test_sr(self):
+        """Test
+        + same issue list response
+        """
+        url = f'http://127.0.0.1:8000/projects/{self.project.id}/issues/'
+        self.client.force_authenticate(user=self.author)
+        with override_settings(SOFTDESK={'FAST_LIST_SERIALIZERS': True}):
+            fast = self.client.get(path=url).content
+        response_cache.clear()
+        slow = self.client.get(path=url).content
+        self.assertEqual(fast, slow)
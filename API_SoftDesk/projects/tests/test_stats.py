@@ -0,0 +1,185 @@
+# Python Libs
+from io import StringIO
+
+# Django Libs
+from django.contrib.auth.models import User
+from django.core.management import call_command
+
+# Django REST Libs
+from rest_framework.test import (APITestCase,)
+
+# Locals Libs
+from ..membership import (membership_cache,)
+from ..models import (Project,
+                      Contributor,
+                      Issue,
+                      ProjectStats,)
+from ..stats import (project_stats,)
+
+
+class StatsTests(APITestCase):
+    """
+    Tests for the project counters.
+
+    Tests :
+        Contributors tests: (CT)
+            + counters follow issue and comment changes (cf)
+            + counters follow bulk issues (cb)
+            - issue moved to another project by an update (im)
+        No contributors test: (NCT)
+            - get stats (gs)
+        Unauthenticated user tests : (UUT)
+            - get stats (gs)
+        Command tests: (CMD)
+            + rebuild counters (rc)
+    """
+
+    def setUp(self):
+        """Setup
+        Users
+            - author user
+            - no contributor user
+        Projet
+            - example project
+        """
+        membership_cache.clear()
+        user_form = {
+            'username': 'user1',
+            'password': 'Motdepasse123',
+        }
+        self.author = User.objects.create_user(**user_form)
+        user_form = {
+            'username': 'user2',
+            'password': 'Motdepasse123',
+        }
+        self.no_contrib = User.objects.create_user(**user_form)
+        self.project = Project.objects.create(title='project',
+                                              description='project test',
+                                              type='test',
+                                              author_user_id=self.author)
+        Contributor.objects.create(user_id=self.author,
+                                   project_id=self.project,
+                                   role='author',
+                                   permission='1')
+        self.url = f'http://127.0.0.1:8000/projects/{self.project.id}/'
+
+    def _issue(self, **fields):
+        issue = {
+            'title': 'issue',
+            'desc': 'issue desc',
+            'tag': 'bug',
+            'priority': 'low',
+            'status': 'to do',
+        }
+        issue.update(fields)
+        return issue
+
+    def _stats(self):
+        response = self.client.get(path=self.url + 'stats/')
+        self.assertEqual(response.status_code, 200)
+        return response.data
+
+    def test_CT_cf(self):
+        """Test
+        Contributor user /
+            + counters follow issue and comment changes
+        """
+        self.client.force_authenticate(user=self.author)
+        issues_url = self.url + 'issues/'
+        first = self.client.post(path=issues_url,
+                                 data=self._issue()).data['id']
+        second = self.client.post(path=issues_url,
+                                  data=self._issue(priority='high')).data['id']
+        comments_url = f'{issues_url}{first}/comments/'
+        for _ in range(2):
+            self.client.post(path=comments_url,
+                             data={'description': 'comment'})
+        comment = self.client.post(path=f'{issues_url}{second}/comments/',
+                                   data={'description': 'comment'}).data
+        stats = self._stats()
+        self.assertEqual(stats['issues'], 2)
+        self.assertEqual(stats['priority'], {'low': 1, 'high': 1})
+        self.assertEqual(stats['comments'], 3)
+
+        self.client.put(path=f'{issues_url}{first}/',
+                        data={'status': 'done'})
+        self.client.delete(
+            path=f'{issues_url}{second}/comments/{comment["id"]}/')
+        stats = self._stats()
+        self.assertEqual(stats['status'], {'to do': 1, 'done': 1})
+        self.assertEqual(stats['comments'], 2)
+
+        self.client.delete(path=f'{issues_url}{first}/')
+        stats = self._stats()
+        self.assertEqual(stats['issues'], 1)
+        self.assertEqual(stats['status'], {'to do': 1})
+        self.assertEqual(stats['tag'], {'bug': 1})
+        self.assertEqual(stats['comments'], 0)
+
+    def test_CT_cb(self):
+        """Test
+        Contributor user /
+            + counters follow bulk issues
+        """
+        self.client.force_authenticate(user=self.author)
+        issues = [self._issue(tag='bug'),
+                  self._issue(tag='improvement'),
+                  self._issue(tag='bug')]
+        self.client.post(path=self.url + 'issues/bulk/', data=issues)
+        stats = self._stats()
+        self.assertEqual(stats['issues'], 3)
+        self.assertEqual(stats['tag'], {'bug': 2, 'improvement': 1})
+
+    def test_CT_im(self):
+        """Test
+        Contributor user /
+            - issue moved to another project by an update : refused
+        """
+        self.client.force_authenticate(user=self.author)
+        other = Project.objects.create(title='other',
+                                       description='project test',
+                                       type='test',
+                                       author_user_id=self.no_contrib)
+        issue = self.client.post(path=self.url + 'issues/',
+                                 data=self._issue()).data
+        for field, value in (('project_id', other.id),
+                             ('author_user_id', self.no_contrib.id),
+                             ('created_time', '2000-01-01T00:00:00Z')):
+            response = self.client.put(
+                path=f'{self.url}issues/{issue["id"]}/',
+                data={'title': 'moved', field: value})
+            self.assertEqual(response.status_code, 400)
+        issue = Issue.objects.get(id=issue['id'])
+        self.assertEqual(issue.project_id_id, self.project.id)
+        self.assertEqual(issue.title, 'issue')
+        self.assertEqual(self._stats()['issues'], 1)
+        self.assertEqual(project_stats(other.id)['issues'], 0)
+
+    def test_NCT_gs(self):
+        """Test
+        No contributor user /
+            - get stats
+        """
+        self.client.force_authenticate(user=self.no_contrib)
+        response = self.client.get(path=self.url + 'stats/')
+        self.assertEqual(response.status_code, 403)
+
+    def test_UUT_gs(self):
+        """Test
+        Unauthenticated user /
+            - get stats
+        """
+        response = self.client.get(path=self.url + 'stats/')
+        self.assertEqual(response.status_code, 401)
+
+    def test_CMD_rc(self):
+        """Test
+        Command /
+            + rebuild counters
+        """
+        self.client.force_authenticate(user=self.author)
+        self.client.post(path=self.url + 'issues/', data=self._issue())
+        expected = project_stats(self.project.id)
+        ProjectStats.objects.update(count=42)
+        call_command('rebuild_project_stats', stdout=StringIO())
+        self.assertEqual(project_stats(self.project.id), expected)
@@ -0,0 +1,137 @@
+# Python Libs
+from types import SimpleNamespace
+
+# Django Libs
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+# Locals Libs
+from .. import search
+from ..authentication import (user_status_cache,)
+from ..bulk import (bulk_insert,)
+from ..membership import (membership_cache,)
+from ..models import (Project,
+                      Contributor,
+                      Issue,
+                      Comment,)
+from ..response_cache import (response_cache,)
+from ..stats import (rebuild_project_stats,)
+
+
+class QueryBudgetMixin():
+    """Exact SQL query budget of a request, at several dataset sizes
+
+    assertQueryBudget() sends the same request against a dataset of
+    each size of `sizes` : a count growing with the rows (N+1) fails
+    as any count different from the budget. Caches are emptied before
+    each request, the budgets are the ones of cold caches.
+
+    Usage (APITestCase):
+        class Tests(QueryBudgetMixin, APITestCase):
+            def test_list(self):
+                self.assertQueryBudget(
+                    4, lambda data: self.client.get(data.url + "issues/"))
+    """
+    sizes = (2, 12)
+
+    def setUp(self):
+        super().setUp()
+        self.author = User.objects.create_user(username="budget_author",
+                                               password="Motdepasse123")
+        self.client.force_authenticate(user=self.author)
+        self.datasets = 0
+
+    @staticmethod
+    def reset_caches():
+        membership_cache.clear()
+        user_status_cache.clear()
+        response_cache.clear()
+        cache.clear()
+        # Checked once per process : not a cost of the requests
+        search._available()
+
+    def dataset(self, size):
+        """
+        Project of the author with size of each element :
+            - contributors (author excluded)
+            - outsiders (users not contributors)
+            - issues
+            - comments by issue
+        """
+        self.datasets += 1
+        name = f"budget{self.datasets}"
+        project = Project.objects.create(title=name,
+                                         description="budget test",
+                                         type="test",
+                                         author_user_id=self.author)
+        Contributor.objects.create(user_id=self.author,
+                                   project_id=project,
+                                   role="author",
+                                   permission="1")
+        users = bulk_insert(User,
+                            (User(username=f"{name}_{index}")
+                             for index in range(2 * size)),
+                            500)
+        users, outsiders = users[:size], users[size:]
+        bulk_insert(Contributor,
+                    (Contributor(user_id=user,
+                                 project_id=project,
+                                 role="developer",
+                                 permission="0")
+                     for user in users),
+                    500)
+        issues = bulk_insert(Issue,
+                             (Issue(title=f"issue {index}",
+                                    desc="issue desc",
+                                    tag="bug",
+                                    priority="low",
+                                    status="to do",
+                                    project_id=project,
+                                    author_user_id=self.author,
+                                    assignee_user_id=users[index % size])
+                              for index in range(size)),
+                             500)
+        comments = bulk_insert(Comment,
+                               (Comment(description=f"comment {index}",
+                                        author_user_id=self.author,
+                                        issue_id=issue)
+                                for issue in issues
+                                for index in range(size)),
+                               500)
+        rebuild_project_stats(project.id)
+        return SimpleNamespace(
+            project=Project.objects.get(id=project.id),
+            users=users,
+            outsiders=outsiders,
+            issues=issues,
+            comments=comments,
+            url=f"http://127.0.0.1:8000/projects/{project.id}/")
+
+    def assertQueryBudget(self, budget, request, status_code=None):
+        """
+        Assert request(dataset) runs budget queries at every size.
+
+        Streaming responses are consumed in the budget. The failure
+        message lists the SQL of the request.
+        """
+        for size in self.sizes:
+            data = self.dataset(size)
+            self.reset_caches()
+            with CaptureQueriesContext(connection) as queries:
+                response = request(data)
+                if response.streaming:
+                    b"".join(response.streaming_content)
+            if status_code is not None:
+                self.assertEqual(response.status_code, status_code)
+            else:
+                self.assertLess(response.status_code, 400)
+            if len(queries) != budget:
+                sql = "\n".join(f"{index}. {query['sql']}"
+                                for index, query
+                                in enumerate(queries.captured_queries, 1))
+                self.fail(f"{len(queries)} queries instead of {budget} "
+                          f"with {size} rows by element "
+                          f"({response.request['REQUEST_METHOD']} "
+                          f"{response.request['PATH_INFO']}):\n{sql}")
@@ -1,20 +1,41 @@
 # Django Libs
 from django.contrib.auth.models import User
+from django.db import IntegrityError, transaction
 from django.db.models import Q
 
 # Other frameworks Libs
 from rest_framework import viewsets
+from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework import status
 
 # Local packages
-from .models import (Project,
-                     Contributor,)
+from .bulk import (bulk_insert,)
+from .changes import (record_deletions,)
+from .conditional import (bump_version,)
+from .conf import (softdesk_setting,)
+from .events import (event_bus,)
+from .instrumentation import (TimedPermissionsMixin,)
+from .membership import (membership_cache,)
+from .models import (Contributor,)
 from .permissions import (ContributorPermissions,)
+from .response_cache import (response_cache,)
+from .scope import (get_project_scope,)
 from .serializers import (ContributorSerializer,)
 
 
-class UserTHROUGH(viewsets.ViewSet):
+def _user_id(value):
+    """User ID of a bulk form value, None if invalid"""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str) and value.isdigit():
+        return int(value)
+    return None
+
+
+class UserTHROUGH(TimedPermissionsMixin, viewsets.ViewSet):
     """Contributor management
 
     Bridge between models : Project | User
@@ -28,6 +49,7 @@ class UserTHROUGH(viewsets.ViewSet):
     Methods:
         - GET    : list
         - POST   : create
+        - POST   : bulk
         - DELETE : delete
 
     Permissions:
@@ -36,6 +58,7 @@ class UserTHROUGH(viewsets.ViewSet):
         Owner : (Project | User)
             - list
             - create
+            - bulk
             - destroy
 
     Generic Error:
@@ -52,6 +75,8 @@ class UserTHROUGH(viewsets.ViewSet):
         List all contributor for the project.
         Need to be one of them to get the list.
 
+        Cached by project version (projects.response_cache).
+
         Validate :
             (HTTP status_code | detail)
             - 200 : contributors' list
@@ -60,13 +85,18 @@ class UserTHROUGH(viewsets.ViewSet):
             - 403 : Not permission to list
             - 404 : Error no element found
         """
-        # Check if contributor
-        try:
-            Project.objects.get(id=id)
-        except Project.DoesNotExist:
+        # Check if project exists
+        scope = get_project_scope(request, id)
+        if scope.project is None:
             content = {"detail": "Project doesn't exist."}
             return Response(data=content,
                             status=status.HTTP_404_NOT_FOUND)
+        return response_cache.response(
+            request, scope.project, "users",
+            lambda: self._list_contributors(id))
+
+    def _list_contributors(self, id):
+        """Response of the contributors of a project"""
         # Should always get one contributor : the author.
         try:
             contributors = Contributor.objects.filter(project_id=id)
@@ -74,9 +104,9 @@ class UserTHROUGH(viewsets.ViewSet):
             content = {"detail": "No contributor for project {id}."}
             return Response(data=content,
                             status=status.HTTP_404_NOT_FOUND)
-        serialized_contributors = ContributorSerializer(contributors,
-                                                        many=True)
-        return Response(data=serialized_contributors.data,
+        serialized_contributors = ContributorSerializer.list_data(
+            ContributorSerializer.list_queryset(contributors))
+        return Response(data=serialized_contributors,
                         status=status.HTTP_200_OK)
 
     def create(self, request, id):
@@ -101,17 +131,18 @@ class UserTHROUGH(viewsets.ViewSet):
             - 403 : Not permission to create
             - 404 : Element doesn't exist
         """
+        # Check if project exists
+        scope = get_project_scope(request, id)
+        if scope.project is None:
+            content = {"detail": "Project doesn't exist."}
+            return Response(data=content,
+                            status=status.HTTP_404_NOT_FOUND)
         # Check if creator is author
-        try:
-            contrib_creator = Contributor.objects.get(Q(project_id=id) &
-                                                      Q(permission='1'))
-            if contrib_creator.user_id.id != request.user.id:
-                content = {"detail": "You're not the author."
-                                     "You cannot add contributors."}
-                return Response(data=content,
-                                status=status.HTTP_403_FORBIDDEN)
-        except Contributor.DoesNotExist:
-            pass
+        if scope.project.author_user_id_id != request.user.id:
+            content = {"detail": "You're not the author."
+                                 "You cannot add contributors."}
+            return Response(data=content,
+                            status=status.HTTP_403_FORBIDDEN)
 
         try:
             content = dict(request.data.items())
@@ -120,19 +151,9 @@ class UserTHROUGH(viewsets.ViewSet):
             return Response(data=content,
                             status=status.HTTP_400_BAD_REQUEST)
         if content:
-            try:
-                if Contributor.objects.get(Q(project_id=id) &
-                                           Q(user_id=content["user_id"])):
-                    content = {"detail": "User is already a "
-                               "contributor for the project {id}."}
-                    return Response(data=content,
-                                    status=status.HTTP_208_ALREADY_REPORTED)
-            except Contributor.DoesNotExist:
-                # User is not already a contributor
-                pass
             try:
                 content["user_id"] = User.objects.get(id=content['user_id'])
-                content["project_id"] = Project.objects.get(id=id)
+                content["project_id"] = scope.project
                 # To secure and set one and only author.
                 content["permission"] = "0"
                 contributor = Contributor(**content)
@@ -149,8 +170,21 @@ class UserTHROUGH(viewsets.ViewSet):
                                      "to add contributors."}
                 return Response(data=content,
                                 status=status.HTTP_403_FORBIDDEN)
-            contributor.save()
+            # Unique (project_id, user_id) : no existence pre-check
+            try:
+                with transaction.atomic():
+                    contributor.save()
+                    bump_version(scope.project.id)
+            except IntegrityError:
+                content = {"detail": "User is already a "
+                           f"contributor for the project {id}."}
+                return Response(data=content,
+                                status=status.HTTP_208_ALREADY_REPORTED)
+            membership_cache.invalidate(contributor.user_id_id)
             serialized_contributor = ContributorSerializer(contributor)
+            event_bus.publish(scope.project.id, "contributor", "created",
+                              contributor.user_id_id,
+                              serialized_contributor.data)
             return Response(data=serialized_contributor.data,
                             status=status.HTTP_201_CREATED)
         else:
@@ -158,6 +192,146 @@ class UserTHROUGH(viewsets.ViewSet):
             return Response(data=content,
                             status=status.HTTP_400_BAD_REQUEST)
 
+    @action(detail=False, methods=["post"], url_path="bulk")
+    def bulk(self, request, id):
+        """
+        POST request
+        Method bulk
+
+        Add and remove contributors of the project that user own.
+        Need to be the author. Users are resolved in one query,
+        memberships in one query, the changes are applied in one
+        transaction and reported by user.
+
+        Form: (at most BULK_MAX_ITEMS users)
+            - (add)    : list of {user_id, role}
+            - (remove) : list of user_id
+
+        Validate :
+            (HTTP status_code | detail)
+            - 200 : every change applied
+                    added
+                    removed
+                    results (user_id, action, status | detail)
+            - 207 : some changes rejected
+                    added
+                    removed
+                    results (user_id, action, status | detail)
+        Errors :
+            (HTTP status_code | detail)
+            - 400 : Invalid form
+            - 403 : Not permission to manage contributors
+            - 404 : Element doesn't exist
+        """
+        # Check if project exists
+        scope = get_project_scope(request, id)
+        if scope.project is None:
+            content = {"detail": "Project doesn't exist."}
+            return Response(data=content,
+                            status=status.HTTP_404_NOT_FOUND)
+        # Check if creator is author
+        if scope.project.author_user_id_id != request.user.id:
+            content = {"detail": "You're not the author."
+                                 "You cannot manage contributors."}
+            return Response(data=content,
+                            status=status.HTTP_403_FORBIDDEN)
+        # Check if form is valid
+        add = (request.data.get("add", [])
+               if isinstance(request.data, dict) else None)
+        remove = (request.data.get("remove", [])
+                  if isinstance(request.data, dict) else None)
+        if (not isinstance(add, list) or not isinstance(remove, list) or
+                not add + remove):
+            content = {"detail": "Invalid form. Expected add and/or "
+                                 "remove lists."}
+            return Response(data=content,
+                            status=status.HTTP_400_BAD_REQUEST)
+        if len(add) + len(remove) > softdesk_setting("BULK_MAX_ITEMS"):
+            content = {"detail": "Too many users, at most "
+                                 f"{softdesk_setting('BULK_MAX_ITEMS')}."}
+            return Response(data=content,
+                            status=status.HTTP_400_BAD_REQUEST)
+        changes = [("add", item.get("user_id") if isinstance(item, dict)
+                    else None, item) for item in add]
+        changes += [("remove", user_id, None) for user_id in remove]
+        user_ids = {_user_id(user_id) for _, user_id, _ in changes}
+        user_ids.discard(None)
+        # Resolve users and memberships : one query each
+        known_ids = set(User.objects.filter(
+            id__in=user_ids).values_list("id", flat=True))
+        memberships = dict(Contributor.objects.filter(
+            project_id=scope.project.id,
+            user_id__in=known_ids).values_list("user_id", "permission"))
+        results = []
+        added = []
+        removed = []
+        seen = set()
+        for action_name, raw_user_id, item in changes:
+            user_id = _user_id(raw_user_id)
+            result = {"user_id": raw_user_id, "action": action_name}
+            results.append(result)
+            error = None
+            if user_id is None:
+                error = (status.HTTP_400_BAD_REQUEST, "Invalid user_id.")
+            elif user_id in seen:
+                error = (status.HTTP_400_BAD_REQUEST, "Duplicate user.")
+            elif user_id not in known_ids:
+                error = (status.HTTP_404_NOT_FOUND, "User doesn't exist.")
+            elif action_name == "add":
+                role = item.get("role")
+                if (not isinstance(role, str) or not role or
+                        len(role) > Contributor._meta.get_field(
+                            "role").max_length):
+                    error = (status.HTTP_400_BAD_REQUEST, "Invalid role.")
+                elif user_id in memberships:
+                    error = (status.HTTP_208_ALREADY_REPORTED,
+                             "Already a contributor.")
+            elif user_id not in memberships:
+                error = (status.HTTP_404_NOT_FOUND, "Not a contributor.")
+            elif memberships[user_id] == "1":
+                error = (status.HTTP_403_FORBIDDEN,
+                         "You cannot delete a contributor that own it.")
+            if user_id is not None:
+                seen.add(user_id)
+            if error is not None:
+                result["status"], result["detail"] = error
+            elif action_name == "add":
+                result["status"] = status.HTTP_201_CREATED
+                added.append(Contributor(user_id_id=user_id,
+                                         project_id=scope.project,
+                                         role=item["role"],
+                                         permission="0"))
+            else:
+                result["status"] = status.HTTP_200_OK
+                removed.append(user_id)
+        # Saving process
+        if added or removed:
+            with transaction.atomic():
+                # Concurrent adds of the same users are ignored
+                bulk_insert(Contributor, added,
+                            softdesk_setting("BULK_BATCH_SIZE"),
+                            ignore_conflicts=True)
+                if removed:
+                    record_deletions(scope.project.id, "contributor",
+                                     removed)
+                    Contributor.objects.filter(
+                        project_id=scope.project.id,
+                        user_id__in=removed).delete()
+                bump_version(scope.project.id)
+            changed = [contributor.user_id_id for contributor in added]
+            membership_cache.invalidate(*changed, *removed)
+            event_bus.publish(scope.project.id, "contributor",
+                              "bulk_changed",
+                              data={"added": changed, "removed": removed})
+        content = {"added": len(added),
+                   "removed": len(removed),
+                   "results": results}
+        if all(result["status"] < 400 for result in results):
+            return Response(data=content,
+                            status=status.HTTP_200_OK)
+        return Response(data=content,
+                        status=status.HTTP_207_MULTI_STATUS)
+
     def destroy(self, request, id, pk):
         """
         DELETE request
@@ -183,10 +357,8 @@ class UserTHROUGH(viewsets.ViewSet):
             return Response(data=content,
                             status=status.HTTP_403_FORBIDDEN)
         # Check if project exists
-        try:
-            # Check if user has right to destroy a contributor.
-            Project.objects.get(id=id)
-        except Project.DoesNotExist:
+        scope = get_project_scope(request, id)
+        if scope.project is None:
             content = {"detail": "Project doesn't exist."}
             return Response(data=content,
                             status=status.HTTP_404_NOT_FOUND)
@@ -209,7 +381,14 @@ class UserTHROUGH(viewsets.ViewSet):
         # Check if user has permission to delete contributor.
         self.check_object_permissions(request, contributor)
         # Delete process.
-        contributor.delete()
+        with transaction.atomic():
+            record_deletions(contributor.project_id_id, "contributor",
+                             [contributor.user_id_id])
+            contributor.delete()
+            bump_version(contributor.project_id_id)
+        membership_cache.invalidate(contributor.user_id_id)
+        event_bus.publish(scope.project.id, "contributor", "deleted",
+                          contributor.user_id_id)
         content = {"detail": f"Contributor {pk} deleted from project {id}.",
                    "project_id": id,
                    "user_id": pk, }
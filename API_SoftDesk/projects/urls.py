@@ -6,22 +6,61 @@ from rest_framework.routers import (SimpleRouter,)
 
 # Local Libs
 from . import views
+from .async_views import (AsyncRouter,)
+from .conf import (softdesk_setting,)
 
 
 # app_name = ""
 
-router = SimpleRouter()
-router.register(r"",
-                views.ProjectView,
-                basename="projects")
-router.register(r"^(?P<id>[^/.]+)/users",
-                views.UserView,
-                basename="users")
-router.register(r"^(?P<id>[^/.]+)/issues",
-                views.IssueView,
-                basename="issues")
-router.register(r"^(?P<id>[^/.]+)/issues/(?P<issue_id>[^/.]+)/comments",
-                views.CommentView,
-                basename="comments")
+def build_router(router_class):
+    """
+    Router of the projects API.
+
+    SimpleRouter : sync viewsets
+    AsyncRouter  : async variants (ASGI), see projects.async_views
+    """
+    router = router_class()
+    router.register(r"",
+                    views.ProjectView,
+                    basename="projects")
+    router.register(r"^(?P<id>[^/.]+)/users",
+                    views.UserView,
+                    basename="users")
+    router.register(r"^(?P<id>[^/.]+)/issues",
+                    views.IssueView,
+                    basename="issues")
+    router.register(
+        r"^(?P<id>[^/.]+)/issues/(?P<issue_id>[^/.]+)/comments",
+        views.CommentView,
+        basename="comments")
+    return router
+
+
+def build_issues_router(router_class):
+    """Router of the cross-project issues API (/issues/)"""
+    router = router_class()
+    router.register(r"",
+                    views.AssignedIssueView,
+                    basename="assigned_issues")
+    return router
+
+
+def build_batch_router(router_class):
+    """Router of the batch endpoint (/batch/)"""
+    router = router_class()
+    router.register(r"",
+                    views.BatchView,
+                    basename="batch")
+    return router
+
+
+router_class = (AsyncRouter if softdesk_setting("ASYNC_VIEWS")
+                else SimpleRouter)
+router = build_router(router_class)
+issues_router = build_issues_router(router_class)
+# Sync : the sub-requests run in the thread of the batch
+batch_router = build_batch_router(SimpleRouter)
 
 urlpatterns = router.urls
+issues_urlpatterns = issues_router.urls
+batch_urlpatterns = batch_router.urls
@@ -1,7 +1,8 @@
 # Local packages
+from .batch import BatchCRUD
 from .crud_project import ProjectCRUD
 from .through_user import UserTHROUGH
-from .crud_issue import IssueCRUD
+from .crud_issue import AssignedIssueCRUD, IssueCRUD
 from .crud_comment import CommentCRUD
 
 
@@ -14,6 +15,12 @@ class ProjectView(ProjectCRUD):
     Methods:
         - GET    : list
         - GET    : retrieve
+        - GET    : export
+        - GET    : stats
+        - GET    : search
+        - GET    : changes
+        - GET    : events
+        - GET    : cache
         - POST   : create
         - PUT    : update
         - DELETE : delete
@@ -24,11 +31,23 @@ class ProjectView(ProjectCRUD):
         Contributor :
             - list
             - retrieve
+            - export
+            - stats
+            - search
+            - changes
+            - events
         Owner :
             - list
             - retrieve
+            - export
+            - stats
+            - search
+            - changes
+            - events
             - update
             - destroy
+        Superuser :
+            - cache
     """
     pass
 
@@ -47,6 +66,7 @@ class UserView(UserTHROUGH):
     Methods:
         - GET    : list
         - POST   : create
+        - POST   : bulk
         - DELETE : delete
 
     Permissions:
@@ -55,6 +75,7 @@ class UserView(UserTHROUGH):
         Owner : (Project | User)
             - list
             - create
+            - bulk
             - destroy
     """
     pass
@@ -70,6 +91,7 @@ class IssueView(IssueCRUD):
     Methods:
         - GET    : list
         - POST   : create
+        - POST   : bulk
         - PUT    : update
         - DELETE : delete
 
@@ -77,15 +99,30 @@ class IssueView(IssueCRUD):
         Contributor :
             - list
             - create
+            - bulk
         Owner :
             - list
             - create
+            - bulk
             - update
             - destroy
     """
     pass
 
 
+class AssignedIssueView(AssignedIssueCRUD):
+    """Issues assigned to the user
+
+    Methods:
+        - GET    : assigned
+
+    Permissions:
+        AUTHENTICATED :
+            - assigned (issues of the projects the user contributes to)
+    """
+    pass
+
+
 class CommentView(CommentCRUD):
     """Comment management
 
@@ -114,3 +151,16 @@ class CommentView(CommentCRUD):
             - destroy
     """
     pass
+
+
+class BatchView(BatchCRUD):
+    """Batch of API requests
+
+    Methods:
+        - POST   : create
+
+    Permissions:
+        AUTHENTICATED :
+            - create (sub-requests checked by their own views)
+    """
+    pass